@@ -0,0 +1,4 @@
+"""Benchmarks for json_sample_generator.
+
+Run ``python -m benchmarks --help``; see ``benchmarks/README.md``.
+"""
@@ -0,0 +1,398 @@
+"""Run the benchmark cases and compare results against a baseline.
+
+Each case builds one synthetic schema (see :mod:`benchmarks.schemas`) and
+times the phases of a fixture pipeline on it, in order: building and
+compiling a generator, bulk generation, variant enumeration, break site
+collection and enumeration, applying breaks (one by one and batched)
+and validating them. Enumeration phases rebuild the schema's site index
+on every run; ``site_index_cached`` times the cached lookups. Every
+phase is timed ``repeat`` times and the best run is kept; a separate,
+single run under :mod:`tracemalloc` records each phase's peak memory.
+
+Results are plain JSON, so a run on one release can serve as the
+baseline for the next::
+
+    python -m benchmarks --output baseline.json
+    # upgrade
+    python -m benchmarks --compare baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import json_sample_generator
+from json_sample_generator import (
+    BreakScenario,
+    BreakValidator,
+    JSONSchemaGenerator,
+    SampleBreaker,
+    cartesian_scenarios,
+    collect_break_sites,
+    collect_variant_sites,
+    enumerate_break_scenarios,
+    minimal_scenarios,
+)
+from json_sample_generator.models import Schema
+
+from . import schemas
+
+# Cartesian enumeration is skipped above this many combinations.
+_MAX_CARTESIAN = 5_000
+# A phase is a regression when it is this much slower than the baseline
+# and the difference is above timer noise.
+DEFAULT_TOLERANCE = 0.25
+MIN_SLOWDOWN_SECONDS = 1e-3
+
+# A phase returns (result for later phases, number of operations).
+_Phase = Callable[[Dict[str, Any]], Tuple[Any, int]]
+
+
+@dataclass(frozen=True)
+class Case:
+    """One schema and how much work to do with it."""
+
+    name: str
+    build: Callable[[bool], Schema]
+    samples: int
+    breaks: int
+
+
+CASES: Tuple[Case, ...] = (
+    Case(
+        "wide_object",
+        lambda quick: schemas.wide_object(40 if quick else 200),
+        samples=2_000,
+        breaks=200,
+    ),
+    Case(
+        "deep_nesting",
+        lambda quick: schemas.deep_nesting(4 if quick else 12),
+        samples=1_000,
+        breaks=100,
+    ),
+    Case(
+        "oneof_fan",
+        lambda quick: schemas.oneof_fan(8 if quick else 40),
+        samples=2_000,
+        breaks=200,
+    ),
+    Case(
+        "allof_chain",
+        lambda quick: schemas.allof_chain(6 if quick else 20),
+        samples=2_000,
+        breaks=100,
+    ),
+    Case(
+        "openapi_document",
+        lambda quick: schemas.openapi_document(20 if quick else 150),
+        samples=200,
+        breaks=200,
+    ),
+)
+
+
+def run_case(case: Case, quick: bool = False, repeat: int = 3) -> Dict:
+    """Time every phase of *case*; returns ``{phase: measurements}``."""
+    scale = 10 if quick else 1
+    schema = case.build(quick)
+    samples = max(case.samples // scale, 1)
+    breaks = max(case.breaks // scale, 1)
+    phases = _phases(schema, samples, breaks)
+
+    results: Dict[str, Dict[str, Any]] = {}
+    state: Dict[str, Any] = {}
+    for name, phase in phases:
+        best = float("inf")
+        ops = 0
+        for _ in range(repeat):
+            start = time.perf_counter()
+            try:
+                state[name], ops = phase(state)
+            except _Skip as skip:
+                results[name] = {"skipped": str(skip)}
+                break
+            best = min(best, time.perf_counter() - start)
+        else:
+            results[name] = {
+                "seconds": best,
+                "ops": ops,
+                "ops_per_sec": ops / best if best > 0 else None,
+            }
+
+    # Memory is measured on a separate run: tracemalloc slows everything.
+    state = {}
+    tracemalloc.start()
+    try:
+        for name, phase in phases:
+            if "skipped" in results[name]:
+                continue
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            state[name], _ = phase(state)
+            peak = tracemalloc.get_traced_memory()[1]
+            results[name]["peak_kib"] = round((peak - base) / 1024, 1)
+    finally:
+        tracemalloc.stop()
+    return results
+
+
+def run(
+    cases: Sequence[Case] = CASES, quick: bool = False, repeat: int = 3
+) -> Dict[str, Any]:
+    """Run *cases* and return the full JSON-serializable report."""
+    return {
+        "meta": {
+            "json_sample_generator": json_sample_generator.__version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "quick": quick,
+            "repeat": repeat,
+        },
+        "cases": {case.name: run_case(case, quick, repeat) for case in cases},
+    }
+
+
+def compare(
+    report: Dict[str, Any],
+    baseline: Dict[str, Any],
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> List[Dict[str, Any]]:
+    """Return one row per phase timed in both reports.
+
+    ``ratio`` is current over baseline time; ``regression`` is set when
+    it exceeds ``1 + tolerance`` and the phase got at least
+    :data:`MIN_SLOWDOWN_SECONDS` slower.
+    """
+    rows = []
+    for case, phases in report["cases"].items():
+        for phase, current in phases.items():
+            previous = baseline.get("cases", {}).get(case, {}).get(phase)
+            if not previous or "seconds" not in previous:
+                continue
+            if "seconds" not in current or not previous["seconds"]:
+                continue
+            ratio = current["seconds"] / previous["seconds"]
+            rows.append(
+                {
+                    "case": case,
+                    "phase": phase,
+                    "baseline": previous["seconds"],
+                    "current": current["seconds"],
+                    "ratio": ratio,
+                    "regression": ratio > 1 + tolerance
+                    and current["seconds"] - previous["seconds"]
+                    >= MIN_SLOWDOWN_SECONDS,
+                }
+            )
+    return rows
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Render *report* as a fixed-width table."""
+    lines = [
+        f"{'case':<18} {'phase':<20} {'seconds':>10} {'ops/s':>12} "
+        f"{'peak KiB':>10}"
+    ]
+    for case, phases in report["cases"].items():
+        for phase, m in phases.items():
+            if "skipped" in m:
+                lines.append(f"{case:<18} {phase:<20} skipped: {m['skipped']}")
+                continue
+            rate = m["ops_per_sec"]
+            lines.append(
+                f"{case:<18} {phase:<20} {m['seconds']:>10.4f} "
+                f"{rate if rate is not None else float('nan'):>12.1f} "
+                f"{m.get('peak_kib', float('nan')):>10.1f}"
+            )
+    return "\n".join(lines)
+
+
+def format_comparison(rows: List[Dict[str, Any]]) -> str:
+    """Render :func:`compare` rows, marking regressions."""
+    lines = [
+        f"{'case':<18} {'phase':<20} {'baseline':>10} {'current':>10} "
+        f"{'ratio':>7}"
+    ]
+    for row in rows:
+        mark = "  REGRESSION" if row["regression"] else ""
+        lines.append(
+            f"{row['case']:<18} {row['phase']:<20} {row['baseline']:>10.4f} "
+            f"{row['current']:>10.4f} {row['ratio']:>7.2f}{mark}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark generation, enumeration and breaking.",
+    )
+    parser.add_argument(
+        "--case",
+        action="append",
+        choices=[case.name for case in CASES],
+        help="run only this case (repeatable)",
+    )
+    parser.add_argument(
+        "--quick", action="store_true", help="smaller schemas and counts"
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="write the JSON report here")
+    parser.add_argument("--compare", help="baseline JSON report")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="allowed slowdown before a phase counts as a regression",
+    )
+    args = parser.parse_args(argv)
+
+    selected = [c for c in CASES if not args.case or c.name in args.case]
+    report = run(selected, quick=args.quick, repeat=args.repeat)
+    print(format_report(report))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fp:
+            json.dump(report, fp, indent=2)
+            fp.write("\n")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fp:
+            baseline = json.load(fp)
+        rows = compare(report, baseline, args.tolerance)
+        print()
+        print(format_comparison(rows))
+        if any(row["regression"] for row in rows):
+            return 1
+    return 0
+
+
+# ----------------------------------------------------------------------
+# Internals
+# ----------------------------------------------------------------------
+
+
+class _Skip(Exception):
+    pass
+
+
+def _phases(
+    schema: Schema, samples: int, breaks: int
+) -> List[Tuple[str, _Phase]]:
+    def setup(state: Dict[str, Any]) -> Tuple[Any, int]:
+        gen = JSONSchemaGenerator(schema)
+        gen.compile()
+        return gen, 1
+
+    def generate(state: Dict[str, Any]) -> Tuple[Any, int]:
+        return state["setup"].generate_many(samples, seed=0), samples
+
+    def variant_sites(state: Dict[str, Any]) -> Tuple[Any, int]:
+        _drop_site_index(schema)
+        sites = collect_variant_sites(schema)
+        return sites, len(sites)
+
+    def minimal(state: Dict[str, Any]) -> Tuple[Any, int]:
+        _drop_site_index(schema)
+        scenarios = minimal_scenarios(schema)
+        return scenarios, len(scenarios)
+
+    def cartesian(state: Dict[str, Any]) -> Tuple[Any, int]:
+        total = 1
+        for site in state["variant_sites"]:
+            total *= site.count
+        if total > _MAX_CARTESIAN:
+            raise _Skip(f"{total} combinations")
+        _drop_site_index(schema)
+        scenarios = cartesian_scenarios(schema, max_scenarios=total)
+        return scenarios, len(scenarios)
+
+    def break_sites(state: Dict[str, Any]) -> Tuple[Any, int]:
+        _drop_site_index(schema)
+        sites = collect_break_sites(schema)
+        return sites, len(sites)
+
+    def site_index_cached(state: Dict[str, Any]) -> Tuple[Any, int]:
+        schema.site_index()
+        sites = collect_variant_sites(schema) + collect_break_sites(schema)
+        return sites, len(sites)
+
+    def enumerate_breaks(state: Dict[str, Any]) -> Tuple[Any, int]:
+        _drop_site_index(schema)
+        scenarios = enumerate_break_scenarios(schema, max_scenarios=10**7)
+        return scenarios, len(scenarios)
+
+    def apply_breaks(state: Dict[str, Any]) -> Tuple[Any, int]:
+        sample = state["generate"][0]
+        breaker = SampleBreaker(schema)
+        scenarios = [
+            _first_items(sc) for sc in _take(state["enumerate_breaks"], breaks)
+        ]
+        broken = [(breaker.apply(sample, sc), sc) for sc in scenarios]
+        return broken, len(broken)
+
+    def apply_many(state: Dict[str, Any]) -> Tuple[Any, int]:
+        sample = state["generate"][0]
+        scenarios = [sc for _, sc in state["apply_breaks"]]
+        broken = SampleBreaker(schema).apply_many(sample, scenarios)
+        return broken, len(broken)
+
+    def validate(state: Dict[str, Any]) -> Tuple[Any, int]:
+        pairs = state["apply_breaks"]
+        reports = BreakValidator(schema).validate_many(
+            [b for b, _ in pairs], [sc for _, sc in pairs]
+        )
+        return reports, len(reports)
+
+    return [
+        ("setup", setup),
+        ("generate", generate),
+        ("variant_sites", variant_sites),
+        ("minimal_scenarios", minimal),
+        ("cartesian_scenarios", cartesian),
+        ("break_sites", break_sites),
+        ("site_index_cached", site_index_cached),
+        ("enumerate_breaks", enumerate_breaks),
+        ("apply_breaks", apply_breaks),
+        ("apply_many", apply_many),
+        ("validate_breaks", validate),
+    ]
+
+
+def _drop_site_index(schema: Schema) -> None:
+    """Make the next enumeration walk *schema* again.
+
+    The site index is cached per ``schema.data`` object, so rebinding it
+    to a shallow copy forces a new walk while the ``allOf`` merges of
+    the nested nodes stay cached, as they were before the site index.
+    """
+    schema.data = dict(schema.data)
+
+
+def _first_items(scenario: BreakScenario) -> BreakScenario:
+    """Point the ``[*]`` site paths of *scenario* at the first item."""
+    rules = [
+        rule.model_copy(update={"path": rule.path.replace("[*]", "[0]")})
+        for rule in scenario.rules
+    ]
+    return scenario.model_copy(update={"rules": rules})
+
+
+def _take(items: List[Any], count: int) -> List[Any]:
+    """Up to *count* items spread evenly over *items*."""
+    if len(items) <= count:
+        return items
+    step = len(items) / count
+    return [items[int(i * step)] for i in range(count)]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
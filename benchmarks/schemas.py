@@ -0,0 +1,145 @@
+"""Synthetic schemas that stress one dimension of the library each.
+
+Every builder returns a :class:`~json_sample_generator.models.Schema` and
+takes a size argument, so ``--quick`` runs can shrink them.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict
+
+from json_sample_generator.models import Schema
+
+_LEAVES = [
+    {"type": "integer", "minimum": 0, "maximum": 1000},
+    {"type": "number", "minimum": -1, "maximum": 1},
+    {"type": "boolean"},
+    {"type": "string", "enum": ["red", "green", "blue"]},
+    {"type": "string", "maxLength": 12},
+    {"type": "string", "format": "email"},
+    {"type": "string", "pattern": "^[A-Z]{3}-[0-9]{4}$"},
+]
+
+
+def _leaf(i: int) -> Dict[str, Any]:
+    return dict(_LEAVES[i % len(_LEAVES)])
+
+
+def wide_object(width: int = 200) -> Schema:
+    """One object with *width* scalar properties, half of them required."""
+    props = {f"field_{i:03d}": _leaf(i) for i in range(width)}
+    return Schema(
+        data={
+            "type": "object",
+            "required": [name for i, name in enumerate(props) if i % 2 == 0],
+            "properties": props,
+        }
+    )
+
+
+def deep_nesting(depth: int = 12) -> Schema:
+    """Objects nested *depth* levels deep, with an array at every level."""
+    node: Dict[str, Any] = {
+        "type": "object",
+        "properties": {"value": _leaf(0), "label": _leaf(4)},
+    }
+    for level in range(depth):
+        node = {
+            "type": "object",
+            "required": ["child"],
+            "properties": {
+                "child": node,
+                "id": _leaf(level),
+                "items": {
+                    "type": "array",
+                    "minItems": 1,
+                    "maxItems": 3,
+                    "items": _leaf(level + 1),
+                },
+            },
+        }
+    return Schema(data=node)
+
+
+def oneof_fan(variants: int = 40, sites: int = 4) -> Schema:
+    """*sites* properties, each a ``oneOf`` over *variants* object shapes."""
+
+    def variant(site: int, i: int) -> Dict[str, Any]:
+        return {
+            "type": "object",
+            "required": ["kind"],
+            "properties": {
+                "kind": {"type": "string", "const": f"k{site}_{i}"},
+                f"payload_{i}": _leaf(i),
+                "amount": _leaf(1),
+            },
+            "additionalProperties": False,
+        }
+
+    return Schema(
+        data={
+            "type": "object",
+            "required": [f"choice_{s}" for s in range(sites)],
+            "properties": {
+                f"choice_{s}": {
+                    "oneOf": [variant(s, i) for i in range(variants)]
+                }
+                for s in range(sites)
+            },
+        }
+    )
+
+
+def allof_chain(length: int = 20) -> Schema:
+    """A component extending the previous one via ``allOf``, *length* times.
+
+    Shaped as an OpenAPI document so ``$ref`` resolution is exercised too.
+    """
+    components: Dict[str, Any] = {
+        "Base0": {
+            "type": "object",
+            "required": ["id"],
+            "properties": {"id": _leaf(0), "name": _leaf(4)},
+        }
+    }
+    for i in range(1, length):
+        components[f"Base{i}"] = {
+            "allOf": [
+                {"$ref": f"#/components/schemas/Base{i - 1}"},
+                {
+                    "type": "object",
+                    "properties": {f"extra_{i}": _leaf(i)},
+                },
+            ]
+        }
+    doc = {"openapi": "3.1.0", "components": {"schemas": components}}
+    return Schema.from_oas(doc, name=f"Base{length - 1}")
+
+
+def openapi_document(components: int = 150) -> Schema:
+    """A large OpenAPI document whose root component references the rest.
+
+    Components form a tree: each references two later ones, directly or
+    through arrays, until the leaves.
+    """
+    schemas: Dict[str, Any] = {}
+    for i in range(components):
+        props: Dict[str, Any] = {
+            "id": {"type": "string", "format": "uuid"},
+            "created": {"type": "string", "format": "date-time"},
+            "score": _leaf(i),
+        }
+        for j, child in enumerate((2 * i + 1, 2 * i + 2)):
+            if child >= components:
+                continue
+            ref = {"$ref": f"#/components/schemas/C{child}"}
+            props[f"rel_{j}"] = (
+                ref if j == 0 else {"type": "array", "items": ref}
+            )
+        schemas[f"C{i}"] = {
+            "type": "object",
+            "required": ["id"],
+            "properties": props,
+        }
+    doc = {"openapi": "3.1.0", "components": {"schemas": schemas}}
+    return Schema.from_oas(doc, name="C0")
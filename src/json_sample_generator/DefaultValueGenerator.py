@@ -1,21 +1,53 @@
 import json
 import math
-import random
-from typing import Any, Callable, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-import rstr
-from faker import Faker
+from .helpers import block_random, to_type
+from .helpers.pattern_generator import compile_pattern
+from .helpers.random_source import active_faker, active_random, active_rstr
+from .helpers.value_pool import ValuePool
 
-from .helpers import to_type
+# (rng, count) -> list of count values
+BatchFactory = Callable[[Any, int], List[Any]]
 
-fake = Faker()
+
+def _length(value: Any) -> Optional[int]:
+    """Return *value* if it is a usable length bound, else None."""
+    if isinstance(value, int) and not isinstance(value, bool) and value >= 0:
+        return value
+    return None
 
 
 class DefaultValueGenerator:
     """
     A class to generate default values for various data types.
+
+    Factories are cached by a signature of the schema keywords that shape
+    them (:attr:`cache_keys` plus the resolved type), so every distinct
+    leaf schema builds its factory once per instance. Subclasses whose
+    factories read other keywords should extend :attr:`cache_keys`.
+
+    With a :class:`~.helpers.value_pool.ValuePool`, Faker-backed strings
+    (formats, ``word`` and ``pystr``) are sampled from reservoirs of
+    pre-generated values instead of calling Faker for every value.
     """
 
+    cache_keys: Tuple[str, ...] = (
+        "format",
+        "pattern",
+        "minLength",
+        "maxLength",
+        "minimum",
+        "maximum",
+        "exclusiveMinimum",
+        "exclusiveMaximum",
+    )
+    max_cached_factories = 4096
+
+    def __init__(self, pool: Optional[ValuePool] = None) -> None:
+        self.pool = pool
+        self._factories: Dict[Tuple[Any, ...], Callable] = {}
+
     def __call__(self, schema: Dict[str, Any]) -> Callable:
         """
         Generate a default value based on the provided schema.
@@ -23,8 +55,63 @@ class DefaultValueGenerator:
         :param schema: The JSON schema for which to generate a default value.
         :return: A callable that generates a default value for the specified schema.
         """
+        # const/enum factories read the schema itself; nothing to share.
+        if "const" in schema or "enum" in schema or "type" not in schema:
+            return self._type_generator(schema)
 
-        return self._type_generator(schema)
+        # The value's type is part of the key so 5 and 5.0 stay distinct.
+        key = (to_type(schema),) + tuple(
+            (k, type(schema[k]), schema[k])
+            for k in self.cache_keys
+            if k in schema
+        )
+        try:
+            return self._factories[key]
+        except KeyError:
+            pass
+        except TypeError:  # unhashable keyword value
+            return self._type_generator(schema)
+
+        factory = self._type_generator(schema)
+        if len(self._factories) < self.max_cached_factories:
+            self._factories[key] = factory
+        return factory
+
+    def batch(self, schema: Dict[str, Any]) -> Optional[BatchFactory]:
+        """
+        Return a block-draw factory for *schema*, or None.
+
+        The factory takes ``(rng, n)`` and returns ``n`` values with the
+        same distribution as the per-value factory, drawn in one go (see
+        :mod:`~.helpers.block_random`). Only ``const``, ``enum``, integer,
+        number, boolean and null schemas have one; subclasses that change
+        how those are generated should override this as well.
+        """
+        if "const" in schema:
+            const = schema["const"]
+            return lambda rng, n: [const] * n
+        if "enum" in schema:
+            enum = schema["enum"]
+            return lambda rng, n: block_random.choices(rng, enum, n)
+        if "type" not in schema:
+            return None
+
+        typ = to_type(schema)
+        if typ == "integer":
+            low, high = self._integer_bounds(schema)
+            if low > high:
+                return None  # let the per-value factory raise
+            return lambda rng, n: block_random.integers(rng, low, high, n)
+        if typ == "number":
+            minimum, maximum = self._min_max(schema, 0.01, 0.0, 1.0)
+            return lambda rng, n: block_random.uniforms(
+                rng, minimum, maximum, n
+            )
+        if typ == "boolean":
+            return lambda rng, n: block_random.choices(rng, (True, False), n)
+        if typ == "null":
+            return lambda rng, n: [None] * n
+        return None
 
     def _type_generator(self, schema: Dict[str, Any]) -> Callable:
         """Generate data based on type."""
@@ -32,23 +119,24 @@ class DefaultValueGenerator:
         if "const" in schema:
             return lambda: schema["const"]
         if "enum" in schema:
-            return lambda: random.choice(schema["enum"])
-
-        type_map = {
-            "string": self._string_generator(schema),
-            "integer": self._integer_generator(schema),
-            "number": self._number_generator(schema),
-            "boolean": lambda: random.choice([True, False]),
-            "null": lambda: None,
-        }
+            return lambda: active_random().choice(schema["enum"])
 
         if "type" not in schema:
             raise ValueError(
                 f"Schema {json.dumps(schema)} must contain a 'type' key."
             )
 
+        # Only the generator for the schema's own type is built.
         typ = to_type(schema)
-        return type_map.get(typ, lambda: None)
+        if typ == "string":
+            return self._string_generator(schema)
+        if typ == "integer":
+            return self._integer_generator(schema)
+        if typ == "number":
+            return self._number_generator(schema)
+        if typ == "boolean":
+            return lambda: active_random().choice([True, False])
+        return lambda: None
 
     def _string_generator(self, schema: Dict[str, Any]) -> Callable:
         """Generate string data with patterns and constraints."""
@@ -57,17 +145,39 @@ class DefaultValueGenerator:
             return self._format_generator(schema["format"])
 
         if "pattern" in schema:
-            # TODO add pattern support
-            return lambda: rstr.xeger(schema["pattern"])
+            pattern = schema["pattern"]
+            compiled = (
+                compile_pattern(pattern) if isinstance(pattern, str) else None
+            )
+            if compiled is None:
+                # Backreferences, lookarounds, ...: leave it to rstr.
+                return lambda: active_rstr().xeger(schema["pattern"])
+            min_length = _length(schema.get("minLength"))
+            max_length = _length(schema.get("maxLength"))
+            return lambda: compiled.generate(
+                active_random(), min_length, max_length
+            )
 
         if "maxLength" in schema or "minLength" in schema:
             min_length = schema.get("minLength", 5)
             max_length = schema.get("maxLength", min_length + 10)
-            return lambda: fake.pystr(
-                min_chars=min_length, max_chars=max_length
+            return self._pooled(
+                "pystr",
+                lambda: active_faker().pystr(
+                    min_chars=min_length, max_chars=max_length
+                ),
+                ("pystr", min_length, max_length),
             )
 
-        return lambda: fake.word()
+        return self._pooled("word", lambda: active_faker().word())
+
+    def _pooled(
+        self, kind: str, factory: Callable, key: Any = None
+    ) -> Callable:
+        """Route *factory* through the value pool, if there is one."""
+        if self.pool is None:
+            return factory
+        return self.pool.wrap(kind, factory, key)
 
     def _get_value(
         self, k: str, schema: Dict[str, Any], bound_shift: float
@@ -112,13 +222,13 @@ class DefaultValueGenerator:
             minimum, maximum = maximum, minimum
         return minimum, maximum
 
-    def _integer_generator(
+    def _integer_bounds(
         self,
         schema: Dict[str, Any],
         default_low: int = 0,
         default_high: int = 100,
-    ) -> Callable:
-        """Generate integer data with range constraints.
+    ) -> Tuple[int, int]:
+        """Return the inclusive integer range allowed by *schema*.
 
         Handles missing bounds and exclusiveMinimum/exclusiveMaximum by applying
         a small integer shift and coercing bounds to integers.
@@ -126,30 +236,42 @@ class DefaultValueGenerator:
         minimum, maximum = self._min_max(
             schema, 1.0, default_low, default_high
         )
+        return int(math.ceil(minimum)), int(math.floor(maximum))
 
-        minimum = math.ceil(minimum)
-        maximum = math.floor(maximum)
-
-        return lambda: random.randint(int(minimum), int(maximum))
+    def _integer_generator(
+        self,
+        schema: Dict[str, Any],
+        default_low: int = 0,
+        default_high: int = 100,
+    ) -> Callable:
+        """Generate integer data with range constraints."""
+        minimum, maximum = self._integer_bounds(
+            schema, default_low, default_high
+        )
+        return lambda: active_random().randint(minimum, maximum)
 
     def _number_generator(self, schema: Dict[str, Any]) -> Callable:
         """Generate number data with range constraints."""
         minimum, maximum = self._min_max(schema, 0.01, 0.0, 1.0)
-        return lambda: random.uniform(minimum, maximum)
+        return lambda: active_random().uniform(minimum, maximum)
 
     def _format_generator(self, fmt: str) -> Callable:
         """Generate data based on format."""
         format_map = {
-            "email": lambda: fake.email(),
-            "date-time": lambda: fake.date_time_this_decade().isoformat(),
-            "date": lambda: fake.date_this_decade().isoformat(),
-            "time": lambda: fake.time(),
-            "phone": lambda: fake.phone_number(),
-            "uri": lambda: fake.uri(),
-            "url": lambda: fake.url(),
-            "hostname": lambda: fake.domain_name(),
-            "ipv4": lambda: fake.ipv4(),
-            "ipv6": lambda: fake.ipv6(),
-            "uuid": lambda: fake.uuid4(),
+            "email": lambda: active_faker().email(),
+            "date-time": lambda: active_faker()
+            .date_time_this_decade()
+            .isoformat(),
+            "date": lambda: active_faker().date_this_decade().isoformat(),
+            "time": lambda: active_faker().time(),
+            "phone": lambda: active_faker().phone_number(),
+            "uri": lambda: active_faker().uri(),
+            "url": lambda: active_faker().url(),
+            "hostname": lambda: active_faker().domain_name(),
+            "ipv4": lambda: active_faker().ipv4(),
+            "ipv6": lambda: active_faker().ipv6(),
+            "uuid": lambda: active_faker().uuid4(),
         }
-        return format_map.get(fmt, lambda: f"unknown-format-{fmt}")
+        if fmt not in format_map:
+            return lambda: f"unknown-format-{fmt}"
+        return self._pooled(fmt, format_map[fmt])
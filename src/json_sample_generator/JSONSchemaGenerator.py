@@ -1,18 +1,57 @@
 from __future__ import annotations
 
 import copy
+import io
+import json
+import os
 import random
-import re
-from typing import Any, Callable, Dict, List, Optional, cast
+import threading
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 
-from faker import Faker
 from jsonref import JsonRef, jsonloader, replace_refs
 from proxytypes import LazyProxy
 
+from .columnar import (
+    ColumnLayout,
+    build_layout,
+    pivot_rows,
+    to_arrow_table,
+    typed_column,
+)
+from .compiled_scenario import CompiledScenario
 from .DefaultValueGenerator import DefaultValueGenerator
-from .helpers import allof_merge, to_type
-from .helpers.utils import path_startswith
-from .models import Context, Scenario, Schema
+from .generation_frame import Frame
+from .generation_plan import (
+    AllOfPlan,
+    ArrayPlan,
+    ObjectPlan,
+    PlanCompiler,
+    PlanNode,
+    RefPlan,
+    VariantPlan,
+)
+from .helpers import AllOfCache, allof_merge
+from .helpers.random_source import use_random
+from .helpers.utils import deep_merge
+from .instrumentation import (
+    ALLOF_MERGE,
+    DEFAULT_VALUE,
+    OVERRIDE,
+    VARIANT,
+    GenerationStats,
+)
+from .models import Context, DependentOverride, Scenario, Schema
 from .SchemaGeneratorBuilder import SchemaGeneratorBuilder
 
 _original_lazy_subject = LazyProxy.__subject__
@@ -40,10 +79,45 @@ def _safe_lazy_subject(self):
 
 LazyProxy.__subject__ = property(_safe_lazy_subject)
 
-fake = Faker()
-
 GeneratorFunctionType = Callable[[Dict[str, Any]], Callable[[], Any]]
 
+DEFAULT_BASE_URI = "file://dummy.json"
+
+# Samples per column draw in vectorized mode
+_VECTOR_BLOCK = 4096
+
+
+def resolve_schema_refs(
+    data: Dict[Any, Any], base_uri: Optional[str] = None, loader=jsonloader
+) -> Dict[Any, Any]:
+    """
+    Replace ``$ref`` objects in *data* with lazy ``JsonRef`` proxies.
+
+    Args:
+        data: The schema document to resolve
+        base_uri: Base URI for relative references
+        loader: ``jsonref`` loader for remote documents
+
+    Returns:
+        The resolved schema as a dictionary
+    """
+    uri = base_uri if base_uri is not None else DEFAULT_BASE_URI
+    loaded = replace_refs(data, base_uri=uri, loader=loader)
+    # Ensure schema.data is a dictionary after replacing references
+    if isinstance(loaded, dict):
+        return cast(Dict[Any, Any], loaded)
+    return cast(Dict[Any, Any], dict(cast(Any, loaded)))
+
+
+def _is_binary_stream(fp: Any) -> bool:
+    """Return True if *fp* takes bytes; anything unrecognized takes text."""
+    if isinstance(fp, io.TextIOBase):
+        return False
+    if isinstance(fp, (io.RawIOBase, io.BufferedIOBase)):
+        return True
+    mode = getattr(fp, "mode", "")
+    return isinstance(mode, str) and "b" in mode
+
 
 class JSONSchemaGenerator:
     """
@@ -60,73 +134,478 @@ class JSONSchemaGenerator:
         default_value_generator: GeneratorFunctionType = DefaultValueGenerator(),
         loader=jsonloader,
         generator_max_items: Optional[int] = None,
+        seed: Optional[int] = None,
+        resolve_refs: bool = True,
+        stats: Optional[GenerationStats] = None,
     ):
-        self.schema = Schema(
-            data=cast(Dict[Any, Any], copy.deepcopy(schema.data)),
-            base_uri=schema.base_uri,
-        )
         self.max_depth = max_depth
         self.generator_max_items = generator_max_items
 
-        uri = (
-            self.schema.base_uri
-            if self.schema.base_uri is not None
-            else "file://dummy.json"
-        )
-
-        loaded = replace_refs(self.schema.data, base_uri=uri, loader=loader)
-        # Ensure schema.data is a dictionary after replacing references
-        if isinstance(loaded, dict):
-            self.schema.data = cast(Dict[Any, Any], loaded)
+        if resolve_refs:
+            self.schema = Schema(
+                data=cast(Dict[Any, Any], copy.deepcopy(schema.data)),
+                base_uri=schema.base_uri,
+            )
+            self.schema.data = resolve_schema_refs(
+                self.schema.data, self.schema.base_uri, loader
+            )
         else:
-            self.schema.data = cast(Dict[Any, Any], dict(cast(Any, loaded)))
+            # Already resolved (e.g. by SchemaRegistry); share it as-is,
+            # together with the merged allOf nodes and site indexes.
+            self.schema = Schema(data=schema.data, base_uri=schema.base_uri)
+            # The constructor copies the root dict; keep the shared one.
+            self.schema.data = schema.data
+            self.schema._allof_cache = schema.allof_cache
+            self.schema._site_indexes = schema._site_indexes
 
         self.scenario = scenario or Scenario(name="default")
         self.default_value_generator = default_value_generator
         self.allof_merger = allof_merger
+        self.allof_cache = (
+            self.schema.allof_cache
+            if allof_merger is allof_merge
+            else AllOfCache(allof_merger)
+        )
+        self.stats = stats
+        if stats is not None:
+            self._instrument(stats)
+        self._plan_compiler = PlanCompiler(
+            allof_merger,
+            (
+                default_value_generator
+                if stats is None
+                else lambda schema: stats.timed(
+                    DEFAULT_VALUE, default_value_generator(schema)
+                )
+            ),
+            generator_max_items,
+            allof_cache=self.allof_cache,
+        )
+        # Seeds the per-call random sources; without a seed they are
+        # derived from the global ``random`` so ``random.seed`` still works.
+        self._seed_source = random.Random(seed) if seed is not None else None
+        self._seed_lock = threading.Lock()
+        # Names the seed stream of calls without their own seed, so a
+        # ValuePool keeps its reservoirs across them. Unseeded pooled
+        # generators draw one from the global ``random``, like the seeds.
+        self._stream: Optional[int] = seed
+        if (
+            seed is None
+            and getattr(default_value_generator, "pool", None) is not None
+        ):
+            self._stream = random.getrandbits(64)
+
+    def compile(self) -> PlanNode:
+        """
+        Compile the schema into a generation plan.
 
-    def generate(self, scenario: Optional[Scenario] = None) -> Any:
+        The plan is built lazily on first use and memoized, so calling this
+        up front only moves the cost of compiling the root node out of the
+        first :meth:`generate` call.
+
+        Returns:
+            The plan node for the root of the schema
+        """
+        return self._plan_compiler.compile(self.schema.data)
+
+    def generate(
+        self, scenario: Optional[Scenario] = None, seed: Optional[int] = None
+    ) -> Any:
         """
         Generate a JSON sample based on the schema and scenario.
 
         This method is thread-safe and can be called in parallel with different scenarios.
+        Every call draws from its own ``random.Random`` (and Faker bound to
+        it), so concurrent calls do not share generator state.
 
         Args:
             scenario: Optional scenario to use for this generation.
                      If provided, overrides the scenario set in the constructor.
+            seed: Optional seed for this call; the same seed yields the
+                same sample.
 
         Returns:
             Generated JSON sample data
         """
-        # Use the provided scenario or fall back to the default one
-        active_scenario = scenario or self.scenario
+        return next(self.iter_generate(1, scenario, seed))
 
-        active_scenario = active_scenario.normalize()
+    def generate_many(
+        self,
+        count: int,
+        scenario: Optional[Scenario] = None,
+        seed: Optional[int] = None,
+        vectorized: bool = False,
+    ) -> List[Any]:
+        """
+        Generate *count* JSON samples for the same scenario.
 
-        # Create a new builder for this generation
-        builder = SchemaGeneratorBuilder()
+        The scenario is normalized and compiled once for the whole batch,
+        so only the per-sample output is allocated per iteration.
+
+        With ``vectorized=True``, schemas that are (nested) objects of
+        scalar leaves are generated column-wise: each leaf draws a block
+        of values at once (with NumPy when installed) and rows are
+        assembled afterwards. Other schemas, and scenarios with overrides
+        or ``default_data`` for those leaves, are generated one sample at
+        a time as usual. Vectorized output follows the same distributions
+        but a different random stream than the default mode.
+
+        Args:
+            count: Number of samples to generate.
+            scenario: Optional scenario to use for every sample.
+                     If provided, overrides the scenario set in the constructor.
+            seed: Optional seed; the same seed yields the same batch.
+                Without one, the batch is seeded from the generator's
+                ``seed`` (or the global ``random`` when that is unset).
+            vectorized: Generate flat schemas column-wise (see above).
+
+        Returns:
+            List of generated JSON samples
+        """
+        return list(self.iter_generate(count, scenario, seed, vectorized))
+
+    def iter_generate(
+        self,
+        count: int,
+        scenario: Optional[Scenario] = None,
+        seed: Optional[int] = None,
+        vectorized: bool = False,
+    ) -> Iterator[Any]:
+        """
+        Lazily generate *count* JSON samples; see :meth:`generate_many`.
+
+        Yields:
+            Generated JSON samples, one at a time
+        """
+        plan, root_ctx, compiled, filtered_defaults, rng, stream = (
+            self._batch_setup(scenario, seed)
+        )
+        layout = (
+            self._column_layout(plan, compiled, filtered_defaults)
+            if vectorized
+            else None
+        )
+        if layout is not None:
+            remaining = count
+            while remaining > 0:
+                block = min(remaining, _VECTOR_BLOCK)
+                with use_random(rng, stream):
+                    values = layout.draw(rng, block)
+                yield from layout.rows(values, block)
+                remaining -= block
+            return
+
+        for _ in range(count):
+            with use_random(rng, stream):
+                sample = self._generate_sample(
+                    plan, root_ctx, compiled, filtered_defaults, rng
+                )
+            yield sample
+
+    def generate_columns(
+        self,
+        count: int,
+        scenario: Optional[Scenario] = None,
+        seed: Optional[int] = None,
+        typed: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Generate *count* samples as columns instead of rows.
+
+        Returns one column per leaf property, keyed by its dotted path
+        (``"address.city"``), with the value of sample ``i`` at index
+        ``i``. For the flat schemas that :meth:`generate_many` can
+        vectorize, columns are drawn directly and no per-sample dict is
+        built. Any other object schema is generated sample by sample and
+        pivoted; a sample missing a path gets ``None`` there, and arrays
+        or variant values are kept as cells.
+
+        Args:
+            count: Number of samples to generate.
+            scenario: Optional scenario to use for every sample.
+            seed: Optional seed; see :meth:`generate_many`.
+            typed: Pack all-int and all-float columns into
+                ``array.array`` (``"q"``/``"d"``) instead of lists.
+
+        Returns:
+            Dict mapping each property path to its column
+
+        Raises:
+            ValueError: If the samples are not JSON objects
+        """
+        plan, root_ctx, compiled, filtered_defaults, rng, stream = (
+            self._batch_setup(scenario, seed)
+        )
+        layout = self._column_layout(plan, compiled, filtered_defaults)
+        if layout is not None:
+            columns: List[List[Any]] = [[] for _ in layout.columns]
+            remaining = count
+            while remaining > 0:
+                block = min(remaining, _VECTOR_BLOCK)
+                with use_random(rng, stream):
+                    values = layout.draw(rng, block)
+                for column, drawn in zip(columns, values):
+                    column.extend(drawn)
+                remaining -= block
+            result: Dict[str, Any] = dict(zip(layout.names(), columns))
+        else:
+            rows = []
+            for _ in range(count):
+                with use_random(rng, stream):
+                    sample = self._generate_sample(
+                        plan, root_ctx, compiled, filtered_defaults, rng
+                    )
+                if not isinstance(sample, dict):
+                    raise ValueError(
+                        "Columnar output requires an object schema, got a "
+                        f"{type(sample).__name__} sample."
+                    )
+                rows.append(sample)
+            result = pivot_rows(rows)
+
+        if typed:
+            return {name: typed_column(col) for name, col in result.items()}
+        return result
+
+    def generate_table(
+        self,
+        count: int,
+        scenario: Optional[Scenario] = None,
+        seed: Optional[int] = None,
+    ) -> Any:
+        """
+        Generate *count* samples as a ``pyarrow.Table``.
+
+        Columns are those of :meth:`generate_columns`. Requires the
+        optional ``pyarrow`` dependency.
+
+        Returns:
+            A ``pyarrow.Table`` with one row per sample
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        return to_arrow_table(self.generate_columns(count, scenario, seed))
+
+    def write_parquet(
+        self,
+        path: Union[str, os.PathLike],
+        count: int,
+        scenario: Optional[Scenario] = None,
+        seed: Optional[int] = None,
+        **options: Any,
+    ) -> int:
+        """
+        Write *count* samples to a Parquet file at *path*.
+
+        Args:
+            path: Destination file.
+            count: Number of samples to write.
+            scenario: Optional scenario to use for every sample.
+            seed: Optional seed; see :meth:`generate_many`.
+            **options: Passed to ``pyarrow.parquet.write_table``
+                (``compression``, ``row_group_size``, ...).
+
+        Returns:
+            The number of samples written
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        table = self.generate_table(count, scenario, seed)
+        import pyarrow.parquet as pq
+
+        pq.write_table(table, path, **options)
+        return table.num_rows
+
+    def stream_ndjson(
+        self,
+        fp: Union[str, os.PathLike, IO[Any]],
+        count: int,
+        scenario: Optional[Scenario] = None,
+        seed: Optional[int] = None,
+        buffer_size: int = 1 << 16,
+        default: Optional[Callable[[Any], Any]] = None,
+        vectorized: bool = False,
+    ) -> int:
+        """
+        Write *count* samples to *fp* as newline-delimited JSON.
+
+        Samples are generated and serialized one at a time; encoded lines
+        are collected into a buffer of at most *buffer_size* characters
+        (bytes for binary streams) before being written, so memory use
+        stays flat regardless of *count*.
+
+        Args:
+            fp: A path, or a text or binary stream opened for writing.
+                Streams are written as binary when they are
+                ``io.RawIOBase``/``io.BufferedIOBase`` instances or have a
+                ``"b"`` in their ``mode``, and as text otherwise.
+            count: Number of samples to write.
+            scenario: Optional scenario to use for every sample.
+            seed: Optional seed; see :meth:`generate_many`.
+            buffer_size: Flush threshold for the write buffer.
+            default: Optional ``json`` fallback for values that are not
+                JSON serializable (e.g. ``str``).
+            vectorized: Generate flat schemas column-wise; see
+                :meth:`generate_many`.
+
+        Returns:
+            The number of samples written
+        """
+        if isinstance(fp, (str, os.PathLike)):
+            with open(fp, "wb") as out:
+                return self.stream_ndjson(
+                    out,
+                    count,
+                    scenario,
+                    seed,
+                    buffer_size,
+                    default,
+                    vectorized,
+                )
 
-        # Initialize result with scenario default data if provided
-        if active_scenario.default_data:
-            # Merge filtered default_data into builder.generated
-            from .helpers.utils import deep_merge
+        binary = _is_binary_stream(fp)
+        encode = json.JSONEncoder(
+            ensure_ascii=False, separators=(",", ":"), default=default
+        ).encode
+
+        buffer: List[Any] = []
+        buffered = 0
+        written = 0
+        for sample in self.iter_generate(count, scenario, seed, vectorized):
+            line = encode(sample) + "\n"
+            chunk = line.encode("utf-8") if binary else line
+            buffer.append(chunk)
+            buffered += len(chunk)
+            written += 1
+            if buffered >= buffer_size:
+                fp.write((b"" if binary else "").join(buffer))
+                buffer.clear()
+                buffered = 0
+        if buffer:
+            fp.write((b"" if binary else "").join(buffer))
+        return written
+
+    def _instrument(self, stats: GenerationStats) -> None:
+        """Route the hot paths through *stats*; see :mod:`.instrumentation`."""
+        clock = stats.clock
+        generate_node = self._generate_node
+
+        def timed_node(
+            resolve: Callable[[], PlanNode],
+            ctx: Frame,
+            scenario: CompiledScenario,
+            builder: SchemaGeneratorBuilder,
+        ) -> Any:
+            start = clock()
+            try:
+                return generate_node(resolve, ctx, scenario, builder)
+            finally:
+                stats.record_node(ctx.prop_path, clock() - start)
+
+        # Instance attributes shadow the methods, so generators without
+        # stats keep calling them directly.
+        self._generate_node = timed_node  # type: ignore[method-assign]
+        self._select_variant = stats.timed(  # type: ignore[method-assign]
+            VARIANT, self._select_variant
+        )
+        # Merges performed by this generator are timed, so it does not
+        # share the schema's allOf cache.
+        self.allof_cache = AllOfCache(
+            stats.timed(ALLOF_MERGE, self.allof_merger)
+        )
 
-            filtered_defaults = self._filter_default_data(
+    def _batch_setup(
+        self, scenario: Optional[Scenario], seed: Optional[int]
+    ) -> Tuple[
+        PlanNode,
+        Frame,
+        CompiledScenario,
+        Optional[Dict[str, Any]],
+        random.Random,
+        Optional[int],
+    ]:
+        """Prepare what every sample of a batch shares."""
+        # Use the provided scenario or fall back to the default one
+        active_scenario = (scenario or self.scenario).normalize()
+        compiled = CompiledScenario(active_scenario)
+
+        # Only known top-level properties of default_data are merged
+        filtered_defaults = (
+            self._filter_default_data(
                 self.schema.data, active_scenario.default_data
             )
+            if active_scenario.default_data
+            else None
+        )
+
+        plan = self.compile()
+        root_ctx = Frame.from_context(
+            SchemaGeneratorBuilder().build_context(self.schema)
+        )
+        if seed is not None:
+            rng, stream = random.Random(seed), seed
+        else:
+            rng, stream = self._new_random(), self._stream
+        return plan, root_ctx, compiled, filtered_defaults, rng, stream
+
+    def _column_layout(
+        self,
+        plan: PlanNode,
+        compiled: CompiledScenario,
+        filtered_defaults: Optional[Dict[str, Any]],
+    ) -> Optional[ColumnLayout]:
+        if filtered_defaults:
+            return None
+        return build_layout(
+            plan, compiled, self.max_depth, self.default_value_generator
+        )
+
+    def _generate_sample(
+        self,
+        plan: PlanNode,
+        root_ctx: Frame,
+        scenario: CompiledScenario,
+        filtered_defaults: Optional[Dict[str, Any]],
+        rng: random.Random,
+    ) -> Any:
+        """Generate one sample from precomputed per-batch state."""
+        # Create a new builder for this generation
+        builder = SchemaGeneratorBuilder(rng)
+        if filtered_defaults:
             builder.generated = deep_merge(
                 builder.generated, filtered_defaults
             )
 
-        # Build the initial context
-        ctx = builder.build_context(self.schema)
+        # The root context sees a snapshot of the initial data, as a freshly
+        # validated Context would.
+        ctx = Frame(
+            root_ctx.prop_path,
+            dict(builder.generated),
+            root_ctx.schema_data,
+            root_ctx.schema_path,
+            root_ctx.parent_schema,
+            root_ctx.tokens,
+        )
 
         # Start the generation process
-        self._generate_node(ctx, active_scenario, builder)
-        self._resolve_pending_fields(active_scenario, builder)
+        self._generate_node(lambda: plan, ctx, scenario, builder)
+        if builder.deferred_fields:
+            self._resolve_deferred_fields(scenario, builder)
+        self._resolve_pending_fields(scenario, builder)
 
+        if self.stats is not None:
+            self.stats.record_sample()
         return builder.get_result()
 
+    def _new_random(self) -> random.Random:
+        """Return a fresh random source for one generate call."""
+        if self._seed_source is None:
+            return random.Random(random.getrandbits(64))
+        with self._seed_lock:
+            return random.Random(self._seed_source.getrandbits(64))
+
     def _filter_default_data(
         self, schema_fragment: Dict[str, Any], default_data: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -141,22 +620,7 @@ class JSONSchemaGenerator:
 
         return {k: v for k, v in default_data.items() if k in properties}
 
-    def _scenario_defined(self, path: str, scenario: Scenario) -> bool:
-        """
-        Check if a scenario is defined for the given path.
-
-        Args:
-            path: The property path to check
-            scenario: The scenario to check against
-
-        Returns:
-            True if a scenario is defined for this path
-        """
-        return path in scenario.overrides or any(
-            pattern in path for pattern, _ in scenario.pattern_overrides
-        )
-
-    def _apply_scenario(self, ctx: Context, scenario: Scenario) -> Any:
+    def _apply_scenario(self, ctx: Context, scenario: CompiledScenario) -> Any:
         """
         Apply the scenario override for the given context.
 
@@ -171,12 +635,11 @@ class JSONSchemaGenerator:
             ValueError: If no scenario override is defined for the path
         """
         path = ctx.prop_path
-        if path in scenario.overrides:
-            return scenario.overrides[path](ctx)
-
-        for pattern, override in scenario.pattern_overrides:
-            if pattern in path:
-                return override(ctx)
+        override = scenario.override_for(path)
+        if override is not None:
+            if self.stats is not None:
+                override = self.stats.timed(OVERRIDE, override)
+            return override(ctx)
 
         raise ValueError(
             f"Scenario override not defined for path: {path}. "
@@ -209,12 +672,18 @@ class JSONSchemaGenerator:
         return schema
 
     def _generate_node(
-        self, ctx: Context, scenario: Scenario, builder: SchemaGeneratorBuilder
+        self,
+        resolve: Callable[[], PlanNode],
+        ctx: Frame,
+        scenario: CompiledScenario,
+        builder: SchemaGeneratorBuilder,
     ) -> Any:
         """
-        Generate a node in the JSON sample based on the schema and context.
+        Generate a node in the JSON sample based on the plan and context.
 
         Args:
+            resolve: Returns the compiled plan for ``ctx.schema_data``;
+                only called once depth and overrides have been checked
             ctx: The current generation context
             scenario: The scenario to use for this generation
             builder: The builder instance for this generation
@@ -223,58 +692,99 @@ class JSONSchemaGenerator:
             The generated value for this node
         """
         dpth = ctx.prop_path.count(".")
-        schema = ctx.schema_data
 
         if dpth > self.max_depth:
             return None
 
-        if isinstance(ctx.schema_data, JsonRef):
-            ref = ctx.schema_data.__reference__["$ref"]
-            resolved_schema = ctx.schema_data.__subject__
-            ctx = ctx.copy(
-                schema_data=resolved_schema,
-                schema_path=ref,
-                parent_schema=resolved_schema,
-            )
-            return self._generate_node(ctx, scenario, builder)
-
         path = ctx.prop_path
 
-        if self._scenario_defined(path, scenario):
+        override = scenario.override_for(path)
+        if override is not None:
+            # Overrides see the $ref target, as the plan would generate it.
+            while isinstance(ctx.schema_data, JsonRef):
+                target = ctx.schema_data.__subject__
+                ctx = Frame(
+                    ctx.prop_path,
+                    ctx.data,
+                    target,
+                    ctx.schema_data.__reference__["$ref"],
+                    target,
+                    ctx.tokens,
+                )
+            if isinstance(override, DependentOverride):
+                builder.add_deferred_field(ctx)
+                return None
+            if self.stats is not None:
+                override = self.stats.timed(OVERRIDE, override)
+            context = ctx.context()
             try:
-                val = self._apply_scenario(ctx, scenario)
-                return builder.set_value_at_path(path, val)
+                val = override(context)
+                return self._write(builder, ctx, val)
             except KeyError:
-                builder.add_pending_field(ctx)
+                builder.add_pending_field(context)
+                if self.stats is not None:
+                    self.stats.record_pending(deferred=1)
                 return None
 
-        if "allOf" in schema:
-            return self._generate_all_of(ctx, scenario, builder)
-        if "anyOf" in schema:
-            return self._generate_any_of(ctx, scenario, builder)
-        if "oneOf" in schema:
-            return self._generate_one_of(ctx, scenario, builder)
+        return self._generate_plan(resolve(), ctx, scenario, builder)
 
-        typ = to_type(schema)
-
-        if typ == "object":
-            return self._handle_object(ctx, scenario, builder)
-        elif typ == "array":
-            return self._handle_array(ctx, scenario, builder)
-        else:
-            # If scenario default_data already provides a value at this path, keep it
+    def _generate_plan(
+        self,
+        plan: PlanNode,
+        ctx: Frame,
+        scenario: CompiledScenario,
+        builder: SchemaGeneratorBuilder,
+    ) -> Any:
+        """Dispatch on the plan node kind; overrides are already handled."""
+        if isinstance(plan, RefPlan):
+            ctx = Frame(
+                ctx.prop_path,
+                ctx.data,
+                plan.schema,
+                plan.ref,
+                plan.schema,
+                ctx.tokens,
+            )
+            return self._generate_plan(plan.resolve(), ctx, scenario, builder)
+        if isinstance(plan, AllOfPlan):
+            return self._generate_all_of(plan, ctx, scenario, builder)
+        if isinstance(plan, VariantPlan):
+            return self._generate_variant(plan, ctx, scenario, builder)
+        if isinstance(plan, ObjectPlan):
+            return self._handle_object(plan, ctx, scenario, builder)
+        if isinstance(plan, ArrayPlan):
+            return self._handle_array(plan, ctx, scenario, builder)
+
+        # If scenario default_data already provides a value at this path, keep it
+        if ctx.tokens is None:
+            path = ctx.prop_path
             if builder.has_value_at_path(path):
                 return builder.get_value_at_path(path)
-            val = self._default_value(schema)
-            return builder.set_value_at_path(path, val)
+            return builder.set_value_at_path(path, plan.value())
+        existing = builder.get_value_at_tokens(ctx.tokens)
+        if existing is not None:
+            return existing
+        return builder.set_value_at_tokens(ctx.tokens, plan.value())
+
+    @staticmethod
+    def _write(builder: SchemaGeneratorBuilder, ctx: Frame, value: Any) -> Any:
+        """Store *value* at the frame's path, using its parsed tokens."""
+        if ctx.tokens is None:
+            return builder.set_value_at_path(ctx.prop_path, value)
+        return builder.set_value_at_tokens(ctx.tokens, value)
 
     def _generate_all_of(
-        self, ctx: Context, scenario: Scenario, builder: SchemaGeneratorBuilder
+        self,
+        plan: AllOfPlan,
+        ctx: Frame,
+        scenario: CompiledScenario,
+        builder: SchemaGeneratorBuilder,
     ):
         """
         Generate a node that satisfies all schemas in an allOf array.
 
         Args:
+            plan: The allOf plan holding the merged schema
             ctx: The current generation context
             scenario: The scenario to use for generation
             builder: The builder instance for this generation
@@ -282,42 +792,61 @@ class JSONSchemaGenerator:
         Returns:
             The generated value
         """
-        result = self.allof_merger(ctx.schema_data)
         # Use the original allOf schema (with potential JsonRef children) as the parent schema
-        origin_parent = ctx.schema_data
-        return self._generate_node(
-            ctx.copy(schema_data=result, parent_schema=origin_parent),
+        return self._generate_plan(
+            plan.resolve(),
+            Frame(
+                ctx.prop_path,
+                ctx.data,
+                plan.merged,
+                ctx.schema_path,
+                plan.origin,
+                ctx.tokens,
+            ),
             scenario,
             builder,
         )
 
-    def _generate_any_of(
-        self, ctx: Context, scenario: Scenario, builder: SchemaGeneratorBuilder
+    def _generate_variant(
+        self,
+        plan: VariantPlan,
+        ctx: Frame,
+        scenario: CompiledScenario,
+        builder: SchemaGeneratorBuilder,
     ):
-        schemas = ctx.schema_data.get("anyOf", [])
-        selected = self._resolve_variant(ctx, schemas, scenario, "anyOf")
-        return self._generate_node(
-            ctx.copy(schema_data=selected), scenario, builder
+        """Generate the branch of a oneOf/anyOf node picked for this sample."""
+        idx = self._select_variant(
+            ctx, plan.candidates, scenario, plan.kind, builder.rng
         )
-
-    def _generate_one_of(
-        self, ctx: Context, scenario: Scenario, builder: SchemaGeneratorBuilder
-    ):
-        schemas = ctx.schema_data.get("oneOf", [])
-        selected = self._resolve_variant(ctx, schemas, scenario, "oneOf")
-        return self._generate_node(
-            ctx.copy(schema_data=selected), scenario, builder
+        if isinstance(idx, int):
+            selected = plan.candidates[idx]
+            target = plan.resolve(idx)
+        else:
+            selected = idx
+            target = plan.resolve_schema(selected)
+        ctx = Frame(
+            ctx.prop_path,
+            ctx.data,
+            selected,
+            ctx.schema_path,
+            ctx.parent_schema,
+            ctx.tokens,
         )
+        return self._generate_plan(target, ctx, scenario, builder)
 
-    def _resolve_variant(
+    def _select_variant(
         self,
-        ctx: Context,
+        ctx: Frame,
         schemas: List[Dict[str, Any]],
-        scenario: Scenario,
+        scenario: CompiledScenario,
         kind: str,
-    ) -> Dict[str, Any]:
+        rng: random.Random,
+    ) -> Union[int, Dict[str, Any]]:
         """Pick one branch from a oneOf/anyOf candidate list.
 
+        Returns the index of the chosen candidate, or the schema fragment
+        itself when a selector resolved it by name or returned a dict.
+
         Selector lookup in ``scenario.oneof_selectors``:
           1. exact match on ``ctx.prop_path``;
           2. else first regex (``re.fullmatch``) in insertion order.
@@ -335,11 +864,11 @@ class JSONSchemaGenerator:
                 f"'{ctx.prop_path or '<root>'}'"
             )
 
-        selector = self._lookup_variant_selector(ctx.prop_path, scenario)
+        selector = scenario.selector_for(ctx.prop_path)
         if selector is None:
-            return schemas[random.randint(0, len(schemas) - 1)]
+            return rng.randint(0, len(schemas) - 1)
 
-        sel_res = selector(ctx, schemas)
+        sel_res = selector(ctx.context(), schemas)
 
         if isinstance(sel_res, bool):
             raise TypeError(
@@ -353,7 +882,7 @@ class JSONSchemaGenerator:
                     f"out-of-range index {sel_res} "
                     f"(valid: 0..{len(schemas) - 1})"
                 )
-            return schemas[sel_res]
+            return sel_res
         if isinstance(sel_res, str):
             return self._resolve_variant_by_name(sel_res, schemas, ctx, kind)
         if isinstance(sel_res, dict):
@@ -364,29 +893,11 @@ class JSONSchemaGenerator:
             f"{type(sel_res).__name__}; expected int, str, or dict"
         )
 
-    @staticmethod
-    def _lookup_variant_selector(
-        path: str, scenario: Scenario
-    ) -> Optional[Callable[[Context, List[Dict[str, Any]]], Any]]:
-        selectors = scenario.oneof_selectors
-        if path in selectors:
-            return selectors[path]
-        for pattern, sel in selectors.items():
-            if pattern == path:
-                continue
-            try:
-                if re.fullmatch(pattern, path) is not None:
-                    return sel
-            except re.error:
-                # Treat invalid regex as non-matching rather than crashing.
-                continue
-        return None
-
     @staticmethod
     def _resolve_variant_by_name(
         name: str,
         schemas: List[Dict[str, Any]],
-        ctx: Context,
+        ctx: Frame,
         kind: str,
     ) -> Dict[str, Any]:
         # 1. title match
@@ -455,7 +966,7 @@ class JSONSchemaGenerator:
     def _should_include_optional(
         self,
         child_path: str,
-        scenario: Scenario,
+        scenario: CompiledScenario,
         builder: SchemaGeneratorBuilder,
     ) -> bool:
         """Return True if an optional property at *child_path* should be
@@ -473,23 +984,22 @@ class JSONSchemaGenerator:
         ``pattern_overrides`` are intentionally excluded — they apply to
         fields that survive filtering but do not force optional fields in.
         """
-        for key in scenario.overrides:
-            if path_startswith(child_path, key):
-                return True
-        if builder.has_value_at_path(child_path):
+        if scenario.mentions(child_path):
             return True
-        for key in scenario.oneof_selectors:
-            if path_startswith(child_path, key):
-                return True
-        return False
+        return builder.has_value_at_path(child_path)
 
     def _handle_array(
-        self, ctx: Context, scenario: Scenario, builder: SchemaGeneratorBuilder
+        self,
+        plan: ArrayPlan,
+        ctx: Frame,
+        scenario: CompiledScenario,
+        builder: SchemaGeneratorBuilder,
     ) -> List[Any]:
         """
         Handle array type schema by generating array elements.
 
         Args:
+            plan: The array plan with pre-computed item bounds
             ctx: The current generation context
             scenario: The scenario to use for generation
             builder: The builder instance for this generation
@@ -497,42 +1007,43 @@ class JSONSchemaGenerator:
         Returns:
             List of generated array items
         """
-        schema = ctx.schema_data
-        items = schema.get("items", {})
-
-        min_items = schema.get("minItems", 0)
-        bounds = [
-            b
-            for b in (schema.get("maxItems"), self.generator_max_items)
-            if b is not None
-        ]
-        max_items = min(bounds) if bounds else max(min_items, 2)
-        count = random.randint(min_items, max_items)
-
-        # Derive schema_path for array items when items is a $ref
-        item_schema_path: Optional[str] = None
-        if isinstance(items, JsonRef):
-            item_schema_path = items.__reference__["$ref"]
+        count = builder.rng.randint(plan.min_items, plan.max_items)
+        tokens = ctx.tokens
 
         result: List[Any] = []
         for i in range(count):
-            child_ctx = ctx.copy(
-                prop_path=f"{ctx.prop_path}[{i}]",
-                schema_data=items,
-                parent_schema=schema,
-                schema_path=item_schema_path or ctx.schema_path,
+            child_ctx = Frame(
+                f"{ctx.prop_path}[{i}]",
+                ctx.data,
+                plan.items,
+                plan.item_schema_path or ctx.schema_path,
+                plan.schema,
+                # Only ``key[i]`` is addressable; other shapes (root or
+                # nested arrays) fall back to parsing the path string.
+                (
+                    tokens[:-1] + ((tokens[-1][0], i),)
+                    if tokens and tokens[-1][1] is None
+                    else None
+                ),
+            )
+            result.append(
+                self._generate_node(plan.resolve, child_ctx, scenario, builder)
             )
-            result.append(self._generate_node(child_ctx, scenario, builder))
 
         return result
 
     def _handle_object(
-        self, ctx: Context, scenario: Scenario, builder: SchemaGeneratorBuilder
+        self,
+        plan: ObjectPlan,
+        ctx: Frame,
+        scenario: CompiledScenario,
+        builder: SchemaGeneratorBuilder,
     ) -> Dict[str, Any]:
         """
         Handle object type schema by generating properties.
 
         Args:
+            plan: The object plan listing the properties to generate
             ctx: The current generation context
             scenario: The scenario to use for generation
             builder: The builder instance for this generation
@@ -540,51 +1051,78 @@ class JSONSchemaGenerator:
         Returns:
             Dictionary of generated property values
         """
-        props = ctx.schema_data.get("properties", {})
-        if props is None:
-            return {}
-
-        required_set = set(ctx.schema_data.get("required") or [])
         result: Dict[str, Any] = {}
 
-        for k, v in props.items():
+        for prop in plan.properties:
+            k = prop.name
             child_path = f"{ctx.prop_path}.{k}" if ctx.prop_path else k
-            if scenario.minimal_mode and k not in required_set:
+            if scenario.minimal_mode and not prop.required:
                 if not self._should_include_optional(
                     child_path, scenario, builder
                 ):
                     continue
-            # Inherit schema_path by default; override if this property is a $ref
-            child_schema_path = (
-                v.__reference__["$ref"]
-                if isinstance(v, JsonRef)
-                else ctx.schema_path
-            )
 
-            child_ctx = ctx.copy(
-                prop_path=child_path,
-                schema_data=v,
-                parent_schema=ctx.schema_data,
-                schema_path=child_schema_path,
+            child_ctx = Frame(
+                child_path,
+                ctx.data,
+                prop.schema,
+                # Inherit schema_path unless this property is a $ref
+                prop.schema_path or ctx.schema_path,
+                plan.schema,
+                (
+                    ctx.tokens + prop.tokens
+                    if ctx.tokens is not None and prop.tokens is not None
+                    else None
+                ),
+            )
+            result[k] = self._generate_node(
+                prop.resolve, child_ctx, scenario, builder
             )
-            result[k] = self._generate_node(child_ctx, scenario, builder)
 
         return result
 
-    def _default_value(self, schema: Dict[str, Any]) -> Any:
+    def _resolve_deferred_fields(
+        self, scenario: CompiledScenario, builder: SchemaGeneratorBuilder
+    ) -> None:
         """
-        Generate a default value for a schema.
+        Evaluate overrides declared with ``depends_on`` in dependency order.
 
-        Args:
-            schema: The schema to generate a value for
+        They run once the rest of the sample exists, so each sees its
+        inputs in ``ctx.data``. One that still raises ``KeyError`` (e.g. a
+        dependency on an undeclared pending field) joins the retry loop of
+        :meth:`_resolve_pending_fields`.
 
-        Returns:
-            A generated default value
+        Args:
+            scenario: The scenario to use for resolution
+            builder: The builder instance for this generation
         """
-        return self.default_value_generator(schema)()
+        deferred = sorted(
+            builder.deferred_fields,
+            key=lambda frame: scenario.dependency_rank(frame.prop_path),
+        )
+        builder.deferred_fields = []
+        for frame in deferred:
+            frame = Frame(
+                frame.prop_path,
+                builder.get_result(),
+                frame.schema_data,
+                frame.schema_path,
+                frame.parent_schema,
+                frame.tokens,
+            )
+            context = frame.context()
+            override = scenario.override_for(frame.prop_path)
+            if self.stats is not None:
+                override = self.stats.timed(OVERRIDE, override)
+            try:
+                self._write(builder, frame, override(context))
+            except KeyError:
+                builder.add_pending_field(context)
+                if self.stats is not None:
+                    self.stats.record_pending(deferred=1)
 
     def _resolve_pending_fields(
-        self, scenario: Scenario, builder: SchemaGeneratorBuilder
+        self, scenario: CompiledScenario, builder: SchemaGeneratorBuilder
     ) -> None:
         """
         Attempt to resolve fields that were pending during initial generation.
@@ -595,10 +1133,14 @@ class JSONSchemaGenerator:
             builder: The builder instance for this generation
         """
         max_retries = 5
+        stats = self.stats
+        deferred = len(builder.pending_fields)
         for _ in range(max_retries):
             if not builder.pending_fields:
                 break
 
+            if stats is not None:
+                stats.record_pending(rounds=1)
             still_pending = []
             for ctx in builder.pending_fields:
                 try:
@@ -610,3 +1152,9 @@ class JSONSchemaGenerator:
                     still_pending.append(ctx)
 
             builder.pending_fields = still_pending
+
+        if stats is not None and deferred:
+            unresolved = len(builder.pending_fields)
+            stats.record_pending(
+                resolved=deferred - unresolved, unresolved=unresolved
+            )
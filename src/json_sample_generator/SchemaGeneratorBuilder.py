@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+import random
 from typing import Any, Dict, List, Optional
 
-from .helpers.utils import parse_path, set_value_at_path
+from .helpers.utils import (
+    PathTokens,
+    get_value_at_tokens,
+    parse_path,
+    set_value_at_path,
+    set_value_at_tokens,
+)
 from .models import Context, Schema
 
 
@@ -13,10 +20,14 @@ class SchemaGeneratorBuilder:
     JSON samples based on schemas and scenarios.
     """
 
-    def __init__(self):
+    def __init__(self, rng: Optional[random.Random] = None):
         self.generated = {}
         self.pending_fields: List[Context] = []
+        # Frames of overrides declared with depends_on, run after the pass
+        self.deferred_fields: List[Any] = []
         self.context: Optional[Context] = None
+        # Random source for structural choices (array sizes, variants)
+        self.rng = rng if rng is not None else random.Random()
 
     def build_context(self, schema: Schema, prop_path: str = "") -> Context:
         """
@@ -63,6 +74,19 @@ class SchemaGeneratorBuilder:
         """
         return set_value_at_path(path, self.generated, value)
 
+    def set_value_at_tokens(self, tokens: PathTokens, value: Any) -> Any:
+        """
+        Set a value at a path already split by ``parse_path``.
+
+        Args:
+            tokens: The parsed path
+            value: The value to set
+
+        Returns:
+            The set value
+        """
+        return set_value_at_tokens(tokens, self.generated, value)
+
     def add_pending_field(self, ctx: Context) -> None:
         """
         Add a field to be resolved later.
@@ -72,6 +96,15 @@ class SchemaGeneratorBuilder:
         """
         self.pending_fields.append(ctx)
 
+    def add_deferred_field(self, frame: Any) -> None:
+        """
+        Add a field whose override declared its dependencies.
+
+        Args:
+            frame: The generation frame of the field
+        """
+        self.deferred_fields.append(frame)
+
     def get_result(self) -> Dict[str, Any]:
         """
         Get the final generated result.
@@ -102,3 +135,11 @@ class SchemaGeneratorBuilder:
     def has_value_at_path(self, path: str) -> bool:
         val = self.get_value_at_path(path)
         return val is not None
+
+    def get_value_at_tokens(self, tokens: PathTokens) -> Any:
+        if not tokens:
+            return self.generated
+        return get_value_at_tokens(tokens, self.generated)
+
+    def has_value_at_tokens(self, tokens: PathTokens) -> bool:
+        return self.get_value_at_tokens(tokens) is not None
@@ -16,6 +16,7 @@ from .break_enum import (
 )
 from .break_validate import (
     BreakScenarioReport,
+    BreakValidator,
     RuleCheck,
     ValidationFailure,
     check_break_scenario,
@@ -24,27 +25,41 @@ from .break_validate import (
 from .breaker import SampleBreaker, apply_break_scenario
 from .DefaultValueGenerator import DefaultValueGenerator
 from .helpers.utils import duuid
+from .helpers.value_pool import ValuePool
+from .instrumentation import GenerationStats
 from .JSONSchemaGenerator import JSONSchemaGenerator
+from .models import depends_on
 from .models.break_models import BreakKind, BreakRule, BreakScenario
+from .parallel import ParallelGenerator
 from .scenario_enum import (
     VariantSite,
     cartesian_scenarios,
     collect_variant_sites,
+    iter_cartesian_scenarios,
     minimal_scenarios,
+    pairwise_scenarios,
 )
+from .schema_registry import SchemaRegistry
 from .SchemaGeneratorBuilder import SchemaGeneratorBuilder
 
 __version__ = "0.5.0"
 
 __all__ = [
     "JSONSchemaGenerator",
+    "ParallelGenerator",
+    "GenerationStats",
+    "SchemaRegistry",
     "DefaultValueGenerator",
+    "ValuePool",
     "duuid",
     "SchemaGeneratorBuilder",
+    "depends_on",
     "VariantSite",
     "collect_variant_sites",
     "cartesian_scenarios",
+    "iter_cartesian_scenarios",
     "minimal_scenarios",
+    "pairwise_scenarios",
     # Break scenarios
     "BreakKind",
     "BreakRule",
@@ -58,6 +73,7 @@ __all__ = [
     "apply_break_scenario",
     "ValidationFailure",
     "validate_breaks",
+    "BreakValidator",
     "RuleCheck",
     "BreakScenarioReport",
     "check_break_scenario",
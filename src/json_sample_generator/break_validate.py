@@ -9,19 +9,18 @@ Two complementary validators:
 
 * :func:`validate_breaks` — **sample-based**.  Applies the scenario
   to a broken sample and checks that each rule triggered at least one
-  real ``jsonschema`` validation error.
+  real ``jsonschema`` validation error.  :class:`BreakValidator` does
+  the same for many samples, building the ``jsonschema`` validator once.
 """
 
 from __future__ import annotations
 
 import re
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import jsonschema
 
-from .break_enum import BreakSite, collect_break_sites
-from .helpers.utils import path_startswith
 from .models.break_models import BreakKind, BreakRule, BreakScenario
 from .models.models import Schema
 
@@ -108,12 +107,10 @@ def check_break_scenario(
         ``report.all_applicable`` for a quick pass/fail, or iterate
         ``report.checks`` for per-rule details.
     """
-    # Build lookup: normalized wildcard path → list of sites.
+    # Lookup: normalized wildcard path → sites, cached on the schema.
     # Multiple sites can share the same path (oneOf branches with
     # overlapping properties); we union their applicable kinds.
-    site_map: Dict[str, List[BreakSite]] = {}
-    for site in collect_break_sites(schema):
-        site_map.setdefault(site.path, []).append(site)
+    site_map = schema.site_index().break_sites_by_path
 
     checks: List[RuleCheck] = []
     for rule in scenario.rules:
@@ -173,6 +170,74 @@ def check_break_scenario(
     )
 
 
+class BreakValidator:
+    """Validates broken samples against one schema.
+
+    The ``jsonschema.Draft202012Validator`` (with its ``FormatChecker``
+    and reference resolution) is built once, when the validator is
+    created, and reused for every sample and scenario. It is never
+    mutated afterwards, so one :class:`BreakValidator` can be shared
+    between threads. Create a new one after editing the schema.
+
+    Parameters
+    ----------
+    schema:
+        The JSON Schema that the original (unbroken) samples conform to.
+        It is used as-is (the caller is responsible for ref resolution
+        when needed).
+
+    Examples
+    --------
+    >>> validator = BreakValidator(schema)
+    >>> scenarios = enumerate_break_scenarios(schema)
+    >>> broken = SampleBreaker(schema).apply_many(sample, scenarios)
+    >>> reports = validator.validate_many(broken, scenarios)
+    """
+
+    def __init__(self, schema: Schema) -> None:
+        self.schema = schema
+        self._validator = jsonschema.Draft202012Validator(
+            schema.data,
+            format_checker=jsonschema.FormatChecker(),
+        )
+
+    def validate(
+        self, broken_sample: Any, scenario: BreakScenario
+    ) -> List[ValidationFailure]:
+        """Check that *broken_sample* fails validation in the expected places.
+
+        Returns one :class:`ValidationFailure` per rule in *scenario*; see
+        :func:`validate_breaks`.
+        """
+        index = _ErrorIndex(list(self._validator.iter_errors(broken_sample)))
+        return [
+            ValidationFailure(rule=rule, matched_errors=index.match(rule))
+            for rule in scenario.rules
+        ]
+
+    def validate_many(
+        self,
+        broken_samples: Iterable[Any],
+        scenarios: Iterable[BreakScenario],
+    ) -> List[List[ValidationFailure]]:
+        """Validate each broken sample against the scenario it came from.
+
+        *broken_samples* and *scenarios* are paired in order, as returned
+        by :meth:`~.SampleBreaker.apply_many` and passed to it.
+
+        Raises
+        ------
+        ValueError
+            If the two iterables have different lengths.
+        """
+        return [
+            self.validate(broken_sample, scenario)
+            for broken_sample, scenario in zip(
+                broken_samples, scenarios, strict=True
+            )
+        ]
+
+
 def validate_breaks(
     schema: Schema,
     broken_sample: dict,
@@ -201,21 +266,11 @@ def validate_breaks(
     Notes
     -----
     Uses ``jsonschema.Draft202012Validator``.  The schema is used as-is
-    (the caller is responsible for ref resolution when needed).
+    (the caller is responsible for ref resolution when needed).  Each
+    call builds a new validator; use :class:`BreakValidator` to validate
+    many samples against the same schema.
     """
-    validator = jsonschema.Draft202012Validator(
-        schema.data,
-        format_checker=jsonschema.FormatChecker(),
-    )
-    all_errors: List[jsonschema.ValidationError] = list(
-        validator.iter_errors(broken_sample)
-    )
-
-    results: List[ValidationFailure] = []
-    for rule in scenario.rules:
-        matched = _match_errors(rule, all_errors)
-        results.append(ValidationFailure(rule=rule, matched_errors=matched))
-    return results
+    return BreakValidator(schema).validate(broken_sample, scenario)
 
 
 # ---------------------------------------------------------------------------
@@ -280,27 +335,74 @@ def _error_path_str(error: jsonschema.ValidationError) -> str:
     return ".".join(parts)
 
 
-def _match_errors(
-    rule: BreakRule,
-    errors: List[jsonschema.ValidationError],
-) -> List[jsonschema.ValidationError]:
-    """Return errors whose path starts with or equals *rule.path*."""
-    matched = []
-    for err in errors:
-        err_path = _error_path_str(err)
+class _PathNode:
+    __slots__ = ("children", "errors")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, _PathNode] = {}
+        self.errors: List[int] = []
+
+
+# Splits a dot/bracket path right before every "." and "[", so one path
+# is a token-wise prefix of another exactly when path_startswith says so.
+_BOUNDARY = re.compile(r"(?=[.\[])")
+
+
+class _ErrorIndex:
+    """The validation errors of one sample, indexed by path.
+
+    Each error's path string is computed once and its tokens are stored
+    in a trie, so a rule's matches — errors on the rule's path, on an
+    ancestor of it or below it — are found by walking the rule's path
+    instead of comparing it to every error.
+    """
+
+    def __init__(self, errors: List[jsonschema.ValidationError]) -> None:
+        self.errors = errors
+        self.root = _PathNode()
+        # Errors without a path (e.g. a missing "required" property).
+        self.root_errors: List[int] = []
+        for i, err in enumerate(errors):
+            path = _error_path_str(err)
+            if not path:
+                self.root_errors.append(i)
+                continue
+            node = self.root
+            for token in _BOUNDARY.split(path):
+                child = node.children.get(token)
+                if child is None:
+                    child = node.children[token] = _PathNode()
+                node = child
+            node.errors.append(i)
+
+    def match(self, rule: BreakRule) -> List[jsonschema.ValidationError]:
+        """Return errors whose path starts with or equals *rule.path*.
+
+        Errors keep the order :meth:`iter_errors` produced them in.
+        """
         # An empty rule path (root-level break) matches everything.
         if not rule.path:
-            matched.append(err)
+            return list(self.errors)
+        hits: List[int] = []
         # Exact match or error fired on an ancestor of the broken field.
-        elif err_path and path_startswith(rule.path, err_path):
-            matched.append(err)
+        node: Optional[_PathNode] = self.root
+        for token in _BOUNDARY.split(rule.path):
+            node = node.children.get(token)
+            if node is None:
+                break
+            hits.extend(node.errors)
         # Error fired below the broken field.
-        elif err_path and path_startswith(err_path, rule.path):
-            matched.append(err)
-        elif not err_path:
-            # Root-level error (e.g. "required") — match when the error
-            # message references the terminal segment of the rule path.
-            prop = rule.path.split(".")[0].split("[")[0]
-            if prop in err.message:
-                matched.append(err)
-    return matched
+        if node is not None:
+            stack = list(node.children.values())
+            while stack:
+                below = stack.pop()
+                hits.extend(below.errors)
+                stack.extend(below.children.values())
+        # Root-level error (e.g. "required") — match when the error
+        # message references the first segment of the rule path.
+        prop = rule.path.split(".")[0].split("[")[0]
+        hits.extend(
+            i for i in self.root_errors if prop in self.errors[i].message
+        )
+        hits.sort()
+        return [self.errors[i] for i in hits]
@@ -5,25 +5,27 @@ Public surface:
 * :class:`SampleBreaker` — stateful breaker bound to a :class:`~.Schema`.
 * :func:`apply_break_scenario` — functional shortcut for one-off use.
 
-The engine operates on a **deep copy** of the input sample — the
-original is never modified.
+The engine never modifies the input sample. Changes are copy-on-write
+(see :func:`~.helpers.utils.with_value_at_path`): a broken sample copies
+only the dicts and lists from the root down to each changed value and
+shares everything else with the input, so it costs O(depth) rather than
+O(size) to produce and to keep.
 """
 
 from __future__ import annotations
 
-import copy
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from jsonref import JsonRef
 
 from .DefaultValueGenerator import DefaultValueGenerator
-from .helpers.allof_handler import allof_merge
 from .helpers.utils import (
-    delete_value_at_path,
     get_value_at_path,
     parse_path,
-    set_value_at_path,
+    path_startswith,
     to_type,
+    with_value_at_path,
+    without_value_at_path,
 )
 from .models.break_models import BreakKind, BreakRule, BreakScenario
 from .models.models import Schema
@@ -58,7 +60,7 @@ def apply_break_scenario(
     schema: Schema,
     sample: dict,
     scenario: BreakScenario,
-) -> dict:
+) -> Any:
     """Apply *scenario* to *sample* and return the mutated copy.
 
     Shortcut for ``SampleBreaker(schema).apply(sample, scenario)``.
@@ -78,105 +80,159 @@ class SampleBreaker:
     def __init__(self, schema: Schema) -> None:
         self._schema = schema
 
-    def apply(self, sample: dict, scenario: BreakScenario) -> dict:
-        """Return a deep copy of *sample* with all *scenario* rules applied."""
-        result = copy.deepcopy(sample)
-        for rule in scenario.rules:
-            self._apply_rule(result, rule)
-        return result
+    def apply(self, sample: dict, scenario: BreakScenario) -> Any:
+        """Return *sample* with all *scenario* rules applied.
+
+        The result is a new sample that shares the subtrees the rules do
+        not touch with *sample*; treat it as read-only, or deep-copy it
+        before changing it further. A rule on the root path (``""``)
+        replaces the whole sample.
+        """
+        return self._apply_rules(sample, scenario.rules, {})
+
+    def apply_many(
+        self, sample: dict, scenarios: Iterable[BreakScenario]
+    ) -> List[Any]:
+        """Apply each of *scenarios* to *sample*, one result per scenario.
+
+        Equivalent to ``[self.apply(sample, s) for s in scenarios]``; the
+        results share untouched subtrees with *sample* and with each
+        other, and the schema fragment of each rule path is resolved once
+        for the whole batch.
+        """
+        fragments: Dict[str, dict] = {}
+        return [
+            self._apply_rules(sample, scenario.rules, fragments)
+            for scenario in scenarios
+        ]
 
     # ------------------------------------------------------------------
     # Rule dispatch
     # ------------------------------------------------------------------
 
-    def _apply_rule(self, data: dict, rule: BreakRule) -> None:
+    def _apply_rules(
+        self,
+        sample: Any,
+        rules: List[BreakRule],
+        fragments: Dict[str, dict],
+    ) -> Any:
+        """Apply *rules* in order; *fragments* caches lookups on *sample*."""
+        result = sample
+        for pos, rule in enumerate(rules):
+            # Earlier rules of the scenario may have changed the data the
+            # fragment lookup reads; those paths resolve afresh.
+            shared = not any(
+                _affects(earlier.path, rule.path) for earlier in rules[:pos]
+            )
+            result = self._apply_rule(
+                result, rule, fragments if shared else None
+            )
+        # Never hand back the caller's own object.
+        return sample.copy() if result is sample else result
+
+    def _apply_rule(
+        self,
+        data: Any,
+        rule: BreakRule,
+        fragments: Optional[Dict[str, dict]] = None,
+    ) -> Any:
+        """Return *data* with *rule* applied, copy-on-write."""
+        path = rule.path
         if rule.value is not None:
-            set_value_at_path(rule.path, data, rule.value)
-            return
+            return with_value_at_path(path, data, rule.value)
 
         kind = rule.kind
 
         # For kinds that mutate an existing value, skip rules whose path
         # does not exist in the sample (e.g. a oneOf branch not taken).
         # ADDITIONAL_PROPERTY is exempt — it adds a new key to the parent.
-        if kind != BreakKind.ADDITIONAL_PROPERTY and rule.path:
-            existing = get_value_at_path(rule.path, data)
-            if existing is None and not _path_exists(data, rule.path):
-                return
-
-        frag = self._resolve_schema(data, rule.path)
-        kind = rule.kind
+        if kind != BreakKind.ADDITIONAL_PROPERTY and path:
+            existing = get_value_at_path(path, data)
+            if existing is None and not _path_exists(data, path):
+                return data
+
+        if fragments is None:
+            frag = self._resolve_schema(data, path)
+        else:
+            frag = fragments.get(path)
+            if frag is None:
+                frag = fragments[path] = self._resolve_schema(data, path)
 
         if kind == BreakKind.REMOVE_REQUIRED:
-            delete_value_at_path(rule.path, data)
+            return without_value_at_path(path, data)
 
         elif kind == BreakKind.NULL_VALUE:
-            set_value_at_path(rule.path, data, None)
+            return with_value_at_path(path, data, None)
 
         elif kind == BreakKind.WRONG_TYPE:
             invalid = self._wrong_type_value(frag)
-            set_value_at_path(rule.path, data, invalid)
+            return with_value_at_path(path, data, invalid)
 
         elif kind == BreakKind.ENUM_VIOLATION:
             invalid = self._enum_violation(frag)
-            set_value_at_path(rule.path, data, invalid)
+            return with_value_at_path(path, data, invalid)
 
         elif kind == BreakKind.CONST_VIOLATION:
             invalid = self._const_violation(frag)
-            set_value_at_path(rule.path, data, invalid)
+            return with_value_at_path(path, data, invalid)
 
         elif kind == BreakKind.PATTERN_VIOLATION:
-            current = get_value_at_path(rule.path, data) or ""
-            set_value_at_path(rule.path, data, "!!!" + str(current))
+            current = get_value_at_path(path, data) or ""
+            return with_value_at_path(path, data, "!!!" + str(current))
 
         elif kind == BreakKind.MIN_LENGTH_VIOLATION:
             min_len = frag.get("minLength", 1)
             truncated = "" if min_len <= 1 else "x" * (min_len - 1)
-            set_value_at_path(rule.path, data, truncated)
+            return with_value_at_path(path, data, truncated)
 
         elif kind == BreakKind.MAX_LENGTH_VIOLATION:
             max_len = frag.get("maxLength", 0)
-            set_value_at_path(rule.path, data, "x" * (max_len + 1))
+            return with_value_at_path(path, data, "x" * (max_len + 1))
 
         elif kind == BreakKind.MIN_VIOLATION:
             bound = _get_numeric_bound(frag, "min")
             if bound is not None:
-                set_value_at_path(rule.path, data, bound - 1)
+                return with_value_at_path(path, data, bound - 1)
 
         elif kind == BreakKind.MAX_VIOLATION:
             bound = _get_numeric_bound(frag, "max")
             if bound is not None:
-                set_value_at_path(rule.path, data, bound + 1)
+                return with_value_at_path(path, data, bound + 1)
 
         elif kind == BreakKind.ADDITIONAL_PROPERTY:
-            target = _resolve_dict_at(data, rule.path)
+            target = _resolve_dict_at(data, path)
             if isinstance(target, dict):
-                target["__break_extra__"] = "unexpected"
+                extra = (
+                    f"{path}.__break_extra__" if path else "__break_extra__"
+                )
+                return with_value_at_path(extra, data, "unexpected")
 
         elif kind == BreakKind.MIN_ITEMS_VIOLATION:
             min_items = frag.get("minItems", 1)
-            current = get_value_at_path(rule.path, data)
+            current = get_value_at_path(path, data)
             if isinstance(current, list):
                 sliced = current[: max(min_items - 1, 0)]
-                set_value_at_path(rule.path, data, sliced)
+                return with_value_at_path(path, data, sliced)
 
         elif kind == BreakKind.MAX_ITEMS_VIOLATION:
             max_items = frag.get("maxItems", 0)
-            current = get_value_at_path(rule.path, data)
+            current = get_value_at_path(path, data)
             if isinstance(current, list) and current:
                 padded = list(current) + [current[-1]] * (
                     max_items + 1 - len(current)
                 )
-                set_value_at_path(rule.path, data, padded)
+                return with_value_at_path(path, data, padded)
             elif isinstance(current, list):
-                set_value_at_path(
-                    rule.path, data, ["__break__"] * (max_items + 1)
+                return with_value_at_path(
+                    path, data, ["__break__"] * (max_items + 1)
                 )
 
         elif kind == BreakKind.FORMAT_VIOLATION:
             fmt = frag.get("format", "")
             invalid = _FORMAT_INVALID.get(fmt, f"not-a-{fmt}")
-            set_value_at_path(rule.path, data, invalid)
+            return with_value_at_path(path, data, invalid)
+
+        return data
 
     # ------------------------------------------------------------------
     # Schema resolution helpers
@@ -199,7 +255,7 @@ class SampleBreaker:
             # Flatten allOf.
             if "allOf" in node:
                 try:
-                    node = allof_merge(node)
+                    node = self._schema.allof_cache.merge(node)
                 except Exception:
                     pass
 
@@ -311,6 +367,16 @@ def _pick_variant(variants: List[Any], sample_node: Any) -> Optional[dict]:
     return best
 
 
+def _affects(earlier: str, path: str) -> bool:
+    """Whether a change at *earlier* can alter what is seen along *path*.
+
+    A change replaces a value in (or deletes it from) the parent of
+    *earlier*, so every path under that parent is affected.
+    """
+    cut = max(earlier.rfind("."), earlier.rfind("["))
+    return cut <= 0 or path_startswith(earlier[:cut], path)
+
+
 def _resolve_dict_at(data: dict, path: str) -> Any:
     """Return the dict/list at *path*, or the root dict when *path* is empty."""
     if not path:
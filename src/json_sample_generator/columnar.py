@@ -0,0 +1,269 @@
+"""Column-wise bulk generation for flat object schemas.
+
+For schemas that are (nested) objects of scalar leaves — no arrays, no
+``oneOf``/``anyOf`` — every sample has the same shape, so a block of
+samples can be generated one column at a time: each leaf draws the
+values for the whole block at once (see
+:meth:`~.DefaultValueGenerator.batch`) and the rows are assembled
+afterwards. :func:`build_layout` decides whether a compiled plan
+qualifies and returns ``None`` when it does not, in which case the
+generator keeps producing samples one by one.
+
+The same layout backs the columnar output mode
+(:meth:`~.JSONSchemaGenerator.generate_columns`), which returns the drawn
+columns as they are instead of zipping them into rows.
+"""
+
+from __future__ import annotations
+
+import array
+import random
+from dataclasses import dataclass
+from itertools import repeat
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .compiled_scenario import CompiledScenario
+from .generation_plan import (
+    AllOfPlan,
+    LeafPlan,
+    ObjectPlan,
+    PlanNode,
+    RefPlan,
+)
+
+# (rng, count) -> list of count values
+DrawFn = Callable[[random.Random, int], List[Any]]
+
+
+@dataclass(eq=False, slots=True)
+class Column:
+    """One leaf of the layout and how to draw a block of its values."""
+
+    path: str
+    keys: Tuple[str, ...]
+    draw: DrawFn
+
+
+# A column of values: a list, or an ``array.array`` for typed columns
+ColumnValues = Union[List[Any], "array.array[Any]"]
+
+_INT64_MIN, _INT64_MAX = -(2**63), 2**63 - 1
+
+
+# name -> column index, or a nested layout for an object property
+_Tree = List[Tuple[str, Union[int, "_Tree"]]]
+
+
+@dataclass(eq=False, slots=True)
+class ColumnLayout:
+    """The leaves of a flat schema, in the order samples list them."""
+
+    columns: Tuple[Column, ...]
+    tree: _Tree
+
+    def draw(self, rng: random.Random, count: int) -> List[List[Any]]:
+        """Draw *count* values for every column, one column at a time."""
+        return [column.draw(rng, count) for column in self.columns]
+
+    def rows(
+        self, values: List[List[Any]], count: int
+    ) -> List[Dict[str, Any]]:
+        """Assemble drawn columns into *count* dicts, one per sample."""
+        if not self.columns:
+            return [{} for _ in repeat(None, count)]
+        if all(isinstance(child, int) for _, child in self.tree):
+            names = [name for name, _ in self.tree]
+            return [dict(zip(names, row)) for row in zip(*values)]
+        return [_assemble(self.tree, row) for row in zip(*values)]
+
+    def names(self) -> List[str]:
+        """Return the dotted path of every column, in column order."""
+        return [column.path for column in self.columns]
+
+
+def build_layout(
+    plan: PlanNode,
+    scenario: CompiledScenario,
+    max_depth: int,
+    default_value_generator: Any,
+) -> Optional[ColumnLayout]:
+    """Return the column layout for *plan*, or None if it is not flat.
+
+    Besides the schema shape, any override (exact or pattern) on the
+    root, an object or a leaf disqualifies the layout, since overrides
+    are per-sample callbacks.
+    """
+    if scenario.override_for("") is not None:
+        return None
+    root = _unwrap(plan)
+    if not isinstance(root, ObjectPlan):
+        return None
+
+    batch = getattr(default_value_generator, "batch", None)
+    columns: List[Column] = []
+    tree = _object_tree(root, "", (), scenario, max_depth, batch, columns)
+    if tree is None:
+        return None
+    return ColumnLayout(columns=tuple(columns), tree=tree)
+
+
+def pivot_rows(rows: Iterable[Mapping[str, Any]]) -> Dict[str, List[Any]]:
+    """Turn sample dicts into columns keyed by dotted property path.
+
+    Nested objects are flattened (``{"a": {"b": 1}}`` becomes column
+    ``"a.b"``); other values, arrays included, are kept as cells. A
+    sample without a given path gets ``None`` in that column. Columns are
+    ordered by first appearance.
+    """
+    columns: Dict[str, List[Any]] = {}
+    count = 0
+    for row in rows:
+        for path, value in _flatten(row, ""):
+            column = columns.get(path)
+            if column is None:
+                column = columns[path] = [None] * count
+            column.append(value)
+        count += 1
+        for column in columns.values():
+            if len(column) < count:
+                column.append(None)
+    return columns
+
+
+def typed_column(values: List[Any]) -> ColumnValues:
+    """Pack *values* into an ``array.array`` when they allow it.
+
+    All-``int`` values within the int64 range become an ``"q"`` array and
+    all-``float`` values a ``"d"`` array; anything else (strings,
+    booleans, ``None``, mixed types) is returned unchanged.
+    """
+    if not values:
+        return values
+    kinds = {type(value) for value in values}
+    if kinds == {int}:
+        if _INT64_MIN <= min(values) and max(values) <= _INT64_MAX:
+            return array.array("q", values)
+    elif kinds == {float}:
+        return array.array("d", values)
+    return values
+
+
+def to_arrow_table(columns: Mapping[str, Iterable[Any]]) -> Any:
+    """Build a ``pyarrow.Table`` from columns; needs ``pyarrow``.
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    pa = _pyarrow()
+    return pa.table(
+        {
+            name: pa.array(
+                values if isinstance(values, list) else list(values)
+            )
+            for name, values in columns.items()
+        }
+    )
+
+
+# ----------------------------------------------------------------------
+# Internals
+# ----------------------------------------------------------------------
+
+
+def _unwrap(plan: PlanNode) -> PlanNode:
+    while isinstance(plan, (RefPlan, AllOfPlan)):
+        plan = plan.resolve()
+    return plan
+
+
+def _object_tree(
+    plan: ObjectPlan,
+    path: str,
+    keys: Tuple[str, ...],
+    scenario: CompiledScenario,
+    max_depth: int,
+    batch: Optional[Callable[[Dict[str, Any]], Optional[DrawFn]]],
+    columns: List[Column],
+) -> Optional[_Tree]:
+    tree: _Tree = []
+    for prop in plan.properties:
+        # Names that parse_path would split ("a.b", "x[0]") nest values
+        # in ways a column cannot express.
+        if prop.tokens != ((prop.name, None),):
+            return None
+        child_path = f"{path}.{prop.name}" if path else prop.name
+        if scenario.minimal_mode and not prop.required:
+            if not scenario.mentions(child_path):
+                continue
+        if child_path.count(".") > max_depth:
+            continue
+        if scenario.override_for(child_path) is not None:
+            return None
+
+        child = _unwrap(prop.resolve())
+        child_keys = keys + (prop.name,)
+        if isinstance(child, ObjectPlan):
+            subtree = _object_tree(
+                child,
+                child_path,
+                child_keys,
+                scenario,
+                max_depth,
+                batch,
+                columns,
+            )
+            if subtree is None:
+                return None
+            if subtree:  # empty objects are left out of samples
+                tree.append((prop.name, subtree))
+        elif isinstance(child, LeafPlan):
+            draw = batch(child.schema) if batch is not None else None
+            if draw is None:
+                draw = _per_value(child)
+            tree.append((prop.name, len(columns)))
+            columns.append(Column(child_path, child_keys, draw))
+        else:
+            return None
+    return tree
+
+
+def _per_value(leaf: LeafPlan) -> DrawFn:
+    value = leaf.value
+    return lambda rng, count: [value() for _ in repeat(None, count)]
+
+
+def _flatten(value: Mapping[str, Any], path: str) -> Iterable[Tuple[str, Any]]:
+    for name, child in value.items():
+        child_path = f"{path}.{name}" if path else name
+        if isinstance(child, dict) and child:
+            yield from _flatten(child, child_path)
+        else:
+            yield child_path, child
+
+
+def _pyarrow() -> Any:
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError(
+            "Arrow output requires pyarrow; install it with "
+            "'pip install sample_generator[arrow]'."
+        ) from None
+    return pyarrow
+
+
+def _assemble(tree: _Tree, row: Tuple[Any, ...]) -> Dict[str, Any]:
+    return {
+        name: row[child] if isinstance(child, int) else _assemble(child, row)
+        for name, child in tree
+    }
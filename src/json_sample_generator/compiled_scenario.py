@@ -0,0 +1,292 @@
+"""Lookup tables for a normalized :class:`~.Scenario`.
+
+:class:`CompiledScenario` is built once per ``generate``/``generate_many``
+call and answers the per-node questions the generator asks — is there an
+override for this path, which variant selector applies, does
+``minimal_mode`` need to keep this optional field — without rescanning
+the scenario's dicts and lists at every node.
+
+Substring ``pattern_overrides`` are matched with an Aho–Corasick
+automaton and selector regexes are joined into one alternation, so a
+lookup does not grow with the number of patterns. Answers are memoized
+per path, which makes repeated paths across a batch a dict hit.
+
+Overrides declared with :func:`~.models.depends_on` are ranked once, in
+dependency order, so the generator can evaluate them without retries.
+"""
+
+from __future__ import annotations
+
+import collections
+import graphlib
+import re
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+from .helpers.utils import path_startswith
+from .models import DependentOverride, Scenario
+
+OverrideFn = Callable[[Any], Any]
+SelectorFn = Callable[[Any, List[Dict[str, Any]]], Any]
+
+
+def _path_prefixes(key: str) -> List[str]:
+    """Return every prefix of *key* that :func:`path_startswith` accepts.
+
+    ``"a.b[0]"`` yields ``["a", "a.b", "a.b[0]"]``.
+    """
+    prefixes = [key[:i] for i, ch in enumerate(key) if ch in ".["]
+    prefixes.append(key)
+    return prefixes
+
+
+def _dependency_ranks(overrides: Dict[str, Any]) -> Dict[str, int]:
+    """Rank the exact overrides that declare dependencies, in the order
+    they must run: an override comes after every declared override whose
+    path is one of its dependencies, or above or below one.
+
+    Raises:
+        ValueError: If the declared dependencies form a cycle
+    """
+    declared = {
+        path: fn.depends_on
+        for path, fn in overrides.items()
+        if isinstance(fn, DependentOverride)
+    }
+    if not declared:
+        return {}
+    sorter: graphlib.TopologicalSorter = graphlib.TopologicalSorter()
+    for path, deps in declared.items():
+        sorter.add(
+            path,
+            *(
+                other
+                for other in declared
+                if other != path
+                and any(
+                    path_startswith(dep, other) or path_startswith(other, dep)
+                    for dep in deps
+                )
+            ),
+        )
+    try:
+        order = list(sorter.static_order())
+    except graphlib.CycleError as exc:
+        raise ValueError(
+            "Override dependencies form a cycle: " + " -> ".join(exc.args[1])
+        ) from None
+    return {path: rank for rank, path in enumerate(order)}
+
+
+class _SubstringIndex:
+    """Aho–Corasick automaton returning the first listed pattern found.
+
+    ``first_in(text)`` returns the smallest index ``i`` such that
+    ``patterns[i] in text``, or ``None`` — the same answer as scanning
+    the list in order, in time linear in ``len(text)``.
+    """
+
+    __slots__ = ("_goto", "_fail", "_best")
+
+    def __init__(self, patterns: List[str]) -> None:
+        goto: List[Dict[str, int]] = [{}]
+        best: List[Optional[int]] = [None]
+        for index, pattern in enumerate(patterns):
+            state = 0
+            for ch in pattern:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    best.append(None)
+                state = nxt
+            if best[state] is None:
+                best[state] = index
+
+        # Breadth-first failure links; each state's best also covers the
+        # patterns that end at its failure chain (proper suffixes).
+        fail = [0] * len(goto)
+        queue = collections.deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                inherited = best[fail[nxt]]
+                if inherited is not None and (
+                    best[nxt] is None or inherited < best[nxt]
+                ):
+                    best[nxt] = inherited
+
+        self._goto = goto
+        self._fail = fail
+        self._best = best
+
+    def first_in(self, text: str) -> Optional[int]:
+        goto, fail, best = self._goto, self._fail, self._best
+        found = best[0]  # the empty pattern matches everywhere
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            hit = best[state]
+            if hit is not None and (found is None or hit < found):
+                found = hit
+                if found == 0:
+                    break
+        return found
+
+
+# Constructs that refer to groups by number or name and would break once
+# the pattern is embedded in a larger one.
+_GROUP_REFERENCE = re.compile(r"\\(?:\d|g<)|\(\?P=|\(\?\(")
+
+
+def _join_selectors(
+    entries: List[Tuple[str, re.Pattern, Any]],
+) -> Optional[Tuple[re.Pattern, Dict[int, Any]]]:
+    """Join selector regexes into one ``(p0)|(p1)|...`` alternation.
+
+    Alternatives are tried left to right, so ``fullmatch`` picks the
+    first key in insertion order that matches, as a sequential scan
+    would. Returns the combined pattern and a map from the wrapping
+    group's number to its selector, or ``None`` when the patterns cannot
+    be combined (backreferences, duplicate group names, inline flags).
+    """
+    if not entries:
+        return None
+    parts: List[str] = []
+    by_group: Dict[int, Any] = {}
+    group = 1
+    for pattern, compiled, sel in entries:
+        if _GROUP_REFERENCE.search(pattern):
+            return None
+        parts.append(f"({pattern})")
+        by_group[group] = sel
+        group += 1 + compiled.groups
+    try:
+        joined = re.compile("|".join(parts))
+    except re.error:
+        return None
+    if joined.groups != group - 1:
+        return None
+    return joined, by_group
+
+
+class CompiledScenario:
+    """A normalized scenario with its lookup tables precomputed.
+
+    Args:
+        scenario: A scenario that has already been through
+            :meth:`Scenario.normalize`.
+    """
+
+    __slots__ = (
+        "scenario",
+        "overrides",
+        "pattern_overrides",
+        "minimal_mode",
+        "_pattern_index",
+        "_override_memo",
+        "_selectors",
+        "_regex_selectors",
+        "_joined_selectors",
+        "_selector_memo",
+        "_mentioned",
+        "_dependency_ranks",
+    )
+
+    def __init__(self, scenario: Scenario) -> None:
+        self.scenario = scenario
+        self.overrides: Dict[str, OverrideFn] = dict(scenario.overrides)
+        self.pattern_overrides: List[Tuple[str, OverrideFn]] = list(
+            scenario.pattern_overrides
+        )
+        self.minimal_mode = scenario.minimal_mode
+        self._pattern_index = (
+            _SubstringIndex([p for p, _ in self.pattern_overrides])
+            if self.pattern_overrides
+            else None
+        )
+        self._override_memo: Dict[str, Optional[OverrideFn]] = {}
+
+        self._selectors: Dict[str, SelectorFn] = dict(scenario.oneof_selectors)
+        self._regex_selectors: List[Tuple[str, re.Pattern, SelectorFn]] = []
+        for pattern, sel in self._selectors.items():
+            try:
+                compiled = re.compile(pattern)
+            except re.error:
+                # Treat invalid regex as non-matching rather than crashing.
+                continue
+            self._regex_selectors.append((pattern, compiled, sel))
+        self._joined_selectors = _join_selectors(self._regex_selectors)
+        self._selector_memo: Dict[str, Optional[SelectorFn]] = {}
+
+        mentioned = set()
+        for key in (*self.overrides, *self._selectors):
+            mentioned.update(_path_prefixes(key))
+        self._mentioned: FrozenSet[str] = frozenset(mentioned)
+        self._dependency_ranks = _dependency_ranks(self.overrides)
+
+    def override_for(self, path: str) -> Optional[OverrideFn]:
+        """Return the override for *path*: exact key first, then pattern.
+
+        Of the ``pattern_overrides`` whose substring occurs in *path*, the
+        first one listed wins.
+        """
+        override = self.overrides.get(path)
+        if override is not None:
+            return override
+        if self._pattern_index is None:
+            return None
+        try:
+            return self._override_memo[path]
+        except KeyError:
+            pass
+        index = self._pattern_index.first_in(path)
+        override = None if index is None else self.pattern_overrides[index][1]
+        self._override_memo[path] = override
+        return override
+
+    def selector_for(self, path: str) -> Optional[SelectorFn]:
+        """Return the variant selector for *path*.
+
+        Exact key first, else the first key (in insertion order) that
+        ``re.fullmatch``-es *path*.
+        """
+        selector = self._selectors.get(path)
+        if selector is not None:
+            return selector
+        try:
+            return self._selector_memo[path]
+        except KeyError:
+            pass
+        if self._joined_selectors is not None:
+            joined, by_group = self._joined_selectors
+            match = joined.fullmatch(path)
+            # The wrapping group closes last, so it is ``lastindex``.
+            selector = None if match is None else by_group[match.lastindex]
+        else:
+            for pattern, compiled, sel in self._regex_selectors:
+                if pattern != path and compiled.fullmatch(path) is not None:
+                    selector = sel
+                    break
+        self._selector_memo[path] = selector
+        return selector
+
+    def mentions(self, path: str) -> bool:
+        """Return True if an override or selector key is *path* or below it."""
+        return path in self._mentioned
+
+    def dependency_rank(self, path: str) -> int:
+        """Return where the deferred override at *path* runs.
+
+        Exact overrides declaring dependencies run in topological order;
+        anything else (e.g. a pattern override with ``depends_on``) runs
+        after them.
+        """
+        return self._dependency_ranks.get(path, len(self._dependency_ranks))
@@ -0,0 +1,66 @@
+"""Per-node state used while generating one sample.
+
+:class:`~.JSONSchemaGenerator` creates one frame for every node it
+visits. A frame carries the same fields as :class:`~.models.Context`, but
+as a plain slotted object so that creating it costs a constructor call
+rather than a pydantic ``model_copy``. The public :class:`Context` handed
+to override and selector callbacks is only built when one of them is
+actually invoked.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from .helpers.utils import PathTokens, parse_path
+from .models import Context
+
+
+def _parse_tokens(path: str) -> Optional[PathTokens]:
+    if not path:
+        return ()
+    try:
+        return tuple(parse_path(path))
+    except ValueError:
+        return None
+
+
+@dataclass(eq=False, slots=True)
+class Frame:
+    """The generation state at one node of the sample being built."""
+
+    prop_path: str
+    data: Dict[str, Any]
+    schema_data: Any
+    schema_path: Optional[str] = None
+    parent_schema: Optional[Dict[str, Any]] = None
+    # ``parse_path(prop_path)``, built incrementally; None when the path
+    # has no token form and writes must go through the string path.
+    tokens: Optional[PathTokens] = None
+    _context: Optional[Context] = None
+
+    @classmethod
+    def from_context(cls, ctx: Context) -> Frame:
+        return cls(
+            ctx.prop_path,
+            ctx.data,
+            ctx.schema_data,
+            ctx.schema_path,
+            ctx.parent_schema,
+            _parse_tokens(ctx.prop_path),
+        )
+
+    def context(self) -> Context:
+        """Return this frame as a :class:`Context`, built on first use."""
+        if self._context is None:
+            # Unvalidated, like the ``model_copy`` contexts it replaces:
+            # ``data`` and the schema fragments are shared, not copied.
+            self._context = Context.model_construct(
+                prop_path=self.prop_path,
+                data=self.data,
+                schema_data=self.schema_data,
+                schema_path=self.schema_path,
+                parent_schema=self.parent_schema,
+            )
+        return self._context
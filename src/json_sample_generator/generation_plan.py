@@ -0,0 +1,279 @@
+"""Compile a resolved JSON Schema into a reusable generation plan.
+
+:class:`~.JSONSchemaGenerator` walks a tree of plan nodes instead of the
+raw schema dict. Each node captures the schema-only decisions for one
+schema fragment — ``$ref`` unwrapping, ``allOf`` merging, type dispatch,
+array bounds and the leaf value factory — so they are taken once per
+generator rather than once per visited node of every sample.
+
+Plan nodes are built lazily: children are compiled on first access, which
+keeps recursive schemas finite and means fragments that are never reached
+(unselected variants, nodes beyond ``max_depth``) are never compiled.
+Scenario-dependent decisions (overrides, selectors, ``minimal_mode``)
+stay in the generator because they vary per call.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from jsonref import JsonRef
+
+from .helpers import AllOfCache, to_type
+from .helpers.utils import PathTokens, parse_path
+
+
+@dataclass(eq=False, slots=True)
+class RefPlan:
+    """A ``$ref`` hop; the target becomes ``schema_path``/``parent_schema``."""
+
+    compiler: PlanCompiler
+    ref: str
+    schema: Any
+    target: Optional[PlanNode] = None
+
+    def resolve(self) -> PlanNode:
+        if self.target is None:
+            self.target = self.compiler.compile(self.schema)
+        return self.target
+
+
+@dataclass(eq=False, slots=True)
+class AllOfPlan:
+    """An ``allOf`` node, merged once through the schema's allOf cache."""
+
+    compiler: PlanCompiler
+    origin: Dict[str, Any]
+    merged: Dict[str, Any]
+    target: Optional[PlanNode] = None
+
+    def resolve(self) -> PlanNode:
+        if self.target is None:
+            self.target = self.compiler.compile(self.merged)
+        return self.target
+
+
+@dataclass(eq=False, slots=True)
+class VariantPlan:
+    """A ``oneOf``/``anyOf`` node with one lazily compiled plan per branch."""
+
+    compiler: PlanCompiler
+    schema: Dict[str, Any]
+    kind: str
+    candidates: List[Any]
+    targets: List[Optional[PlanNode]] = field(default_factory=list)
+
+    def resolve(self, index: int) -> PlanNode:
+        target = self.targets[index]
+        if target is None:
+            target = self.compiler.compile(self.candidates[index])
+            self.targets[index] = target
+        return target
+
+    def resolve_schema(self, selected: Any) -> PlanNode:
+        """Return the plan for *selected*, a candidate or a foreign fragment.
+
+        Fragments that are not one of :attr:`candidates` (e.g. returned by
+        a selector) get a detached plan so they do not grow the memo.
+        """
+        for idx, candidate in enumerate(self.candidates):
+            if candidate is selected:
+                return self.resolve(idx)
+        return self.compiler.detached().compile(selected)
+
+
+@dataclass(eq=False, slots=True)
+class PropertyPlan:
+    """One entry of an object's ``properties``."""
+
+    compiler: PlanCompiler
+    name: str
+    schema: Any
+    schema_path: Optional[str]
+    required: bool
+    # ``parse_path(name)``, or None when the name has no token form
+    tokens: Optional[PathTokens] = None
+    plan: Optional[PlanNode] = None
+
+    def resolve(self) -> PlanNode:
+        if self.plan is None:
+            self.plan = self.compiler.compile(self.schema)
+        return self.plan
+
+
+@dataclass(eq=False, slots=True)
+class ObjectPlan:
+    """An object node with its properties in schema order."""
+
+    schema: Dict[str, Any]
+    properties: Tuple[PropertyPlan, ...]
+
+
+@dataclass(eq=False, slots=True)
+class ArrayPlan:
+    """An array node with pre-computed item bounds."""
+
+    compiler: PlanCompiler
+    schema: Dict[str, Any]
+    items: Any
+    item_schema_path: Optional[str]
+    min_items: int
+    max_items: int
+    item: Optional[PlanNode] = None
+
+    def resolve(self) -> PlanNode:
+        if self.item is None:
+            self.item = self.compiler.compile(self.items)
+        return self.item
+
+
+@dataclass(eq=False, slots=True)
+class LeafPlan:
+    """A scalar node; the value factory is bound on first use."""
+
+    compiler: PlanCompiler
+    schema: Dict[str, Any]
+    factory: Optional[Callable[[], Any]] = None
+
+    def value(self) -> Any:
+        if self.factory is None:
+            self.factory = self.compiler.default_value_generator(self.schema)
+        return self.factory()
+
+
+PlanNode = Union[
+    RefPlan, AllOfPlan, VariantPlan, ObjectPlan, ArrayPlan, LeafPlan
+]
+
+
+def _name_tokens(name: str) -> Optional[PathTokens]:
+    try:
+        return tuple(parse_path(name))
+    except ValueError:
+        return None
+
+
+class PlanCompiler:
+    """Build and memoize plan nodes for the fragments of one schema.
+
+    Nodes are keyed by the identity of the schema fragment they were
+    compiled from; the fragment itself is kept alive alongside the plan so
+    identities cannot be recycled.
+    """
+
+    def __init__(
+        self,
+        allof_merger: Callable[[Dict[str, Any]], Dict[str, Any]],
+        default_value_generator: Callable[[Dict[str, Any]], Callable[[], Any]],
+        generator_max_items: Optional[int] = None,
+        allof_cache: Optional[AllOfCache] = None,
+    ) -> None:
+        self.allof_merger = allof_merger
+        self.allof_cache = allof_cache
+        self.default_value_generator = default_value_generator
+        self.generator_max_items = generator_max_items
+        self._memo: Dict[int, Tuple[Any, PlanNode]] = {}
+
+    def compile(self, node: Any) -> PlanNode:
+        """Return the (memoized) plan node for schema fragment *node*."""
+        hit = self._memo.get(id(node))
+        if hit is not None:
+            return hit[1]
+        plan = self._build(node)
+        return self._memo.setdefault(id(node), (node, plan))[1]
+
+    def detached(self) -> PlanCompiler:
+        """Return a compiler with the same settings and an empty memo.
+
+        The allOf cache is not shared either, so one-off fragments do not
+        accumulate in it.
+        """
+        return PlanCompiler(
+            self.allof_merger,
+            self.default_value_generator,
+            self.generator_max_items,
+        )
+
+    def _build(self, node: Any) -> PlanNode:
+        if isinstance(node, JsonRef):
+            return RefPlan(
+                compiler=self,
+                ref=node.__reference__["$ref"],
+                schema=node.__subject__,
+            )
+
+        if "allOf" in node:
+            return AllOfPlan(
+                compiler=self,
+                origin=node,
+                merged=(
+                    self.allof_cache.merge(node)
+                    if self.allof_cache is not None
+                    else self.allof_merger(node)
+                ),
+            )
+        for kind in ("anyOf", "oneOf"):
+            if kind in node:
+                candidates = node.get(kind, [])
+                return VariantPlan(
+                    compiler=self,
+                    schema=node,
+                    kind=kind,
+                    candidates=candidates,
+                    targets=[None] * len(candidates),
+                )
+
+        typ = to_type(node)
+        if typ == "object":
+            return self._build_object(node)
+        if typ == "array":
+            return self._build_array(node)
+        return LeafPlan(compiler=self, schema=node)
+
+    def _build_object(self, node: Dict[str, Any]) -> ObjectPlan:
+        props = node.get("properties", {})
+        if props is None:
+            return ObjectPlan(schema=node, properties=())
+
+        required_set = set(node.get("required") or [])
+        return ObjectPlan(
+            schema=node,
+            properties=tuple(
+                PropertyPlan(
+                    compiler=self,
+                    name=k,
+                    schema=v,
+                    schema_path=(
+                        v.__reference__["$ref"]
+                        if isinstance(v, JsonRef)
+                        else None
+                    ),
+                    required=k in required_set,
+                    tokens=_name_tokens(k),
+                )
+                for k, v in props.items()
+            ),
+        )
+
+    def _build_array(self, node: Dict[str, Any]) -> ArrayPlan:
+        items = node.get("items", {})
+        min_items = node.get("minItems", 0)
+        bounds = [
+            b
+            for b in (node.get("maxItems"), self.generator_max_items)
+            if b is not None
+        ]
+        max_items = min(bounds) if bounds else max(min_items, 2)
+        return ArrayPlan(
+            compiler=self,
+            schema=node,
+            items=items,
+            item_schema_path=(
+                items.__reference__["$ref"]
+                if isinstance(items, JsonRef)
+                else None
+            ),
+            min_items=min_items,
+            max_items=max_items,
+        )
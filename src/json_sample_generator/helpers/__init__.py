@@ -1,4 +1,4 @@
-from .allof_handler import allof_merge
+from .allof_handler import AllOfCache, allof_merge
 from .utils import deep_merge, duuid, remove_nulls, sort_with_priority, to_type
 
 __all__ = [
@@ -7,5 +7,6 @@ __all__ = [
     "remove_nulls",
     "sort_with_priority",
     "allof_merge",
+    "AllOfCache",
     "to_type",
 ]
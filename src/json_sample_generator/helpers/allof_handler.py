@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from jsonref import JsonRef
 
@@ -116,3 +116,41 @@ def allof_merge(
         merge_shallow(result, part)
 
     return result
+
+
+class AllOfCache:
+    """
+    Memoize ``allof_merge`` results by the identity of the allOf node.
+
+    ``$ref`` wrappers are unwrapped first, so every reference to the same
+    target shares one entry. Entries keep their node alive so identities
+    cannot be recycled. Schemas are assumed not to change after they are
+    merged; call :meth:`invalidate` after editing one in place.
+    """
+
+    def __init__(
+        self,
+        merger: Callable[[Dict[str, Any]], Dict[str, Any]] = allof_merge,
+    ) -> None:
+        self.merger = merger
+        self._merged: Dict[int, Tuple[Any, Dict[str, Any]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._merged)
+
+    def merge(self, node: Any) -> Dict[str, Any]:
+        """Return the (memoized) merge of *node*."""
+        root: Any = node.__subject__ if isinstance(node, JsonRef) else node
+        hit = self._merged.get(id(root))
+        if hit is not None:
+            return hit[1]
+        merged = self.merger(node)
+        return self._merged.setdefault(id(root), (root, merged))[1]
+
+    def invalidate(self, node: Any = None) -> None:
+        """Forget the merge of *node*, or every merge when *node* is None."""
+        if node is None:
+            self._merged.clear()
+            return
+        root: Any = node.__subject__ if isinstance(node, JsonRef) else node
+        self._merged.pop(id(root), None)
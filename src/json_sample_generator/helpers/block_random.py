@@ -0,0 +1,62 @@
+"""Draw blocks of random values for many samples at once.
+
+Used by the vectorized bulk path of :class:`~.JSONSchemaGenerator` to
+fill a whole column of integer, number, boolean or enum values in one
+call. NumPy is used when it is installed; otherwise the draws fall back
+to list comprehensions over ``random.Random``, which still avoid the
+per-value factory and ``randint`` overhead.
+
+Either way the draws are seeded from the given ``random.Random``, so a
+seeded batch is reproducible — but the two backends produce different
+streams, so results depend on whether NumPy is available.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from itertools import repeat
+from typing import Any, List, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+# Spans beyond this lose precision with ``floor(random() * span)``.
+_EXACT_SPAN = 2**53
+_INT64_MIN, _INT64_MAX = -(2**63), 2**63 - 1
+
+
+def _numpy_rng(rng: random.Random) -> Any:
+    return np.random.default_rng(rng.getrandbits(64))
+
+
+def integers(rng: random.Random, low: int, high: int, n: int) -> List[int]:
+    """Return *n* integers drawn uniformly from ``[low, high]``."""
+    if np is not None and _INT64_MIN <= low and high < _INT64_MAX:
+        return _numpy_rng(rng).integers(low, high + 1, size=n).tolist()
+    if high - low < _EXACT_SPAN:
+        return rng.choices(range(low, high + 1), k=n)
+    return [rng.randint(low, high) for _ in repeat(None, n)]
+
+
+def uniforms(
+    rng: random.Random, low: float, high: float, n: int
+) -> List[float]:
+    """Return *n* floats drawn uniformly from ``[low, high]``."""
+    span = high - low
+    if np is not None and math.isfinite(span):
+        return _numpy_rng(rng).uniform(low, high, size=n).tolist()
+    draw = rng.random
+    return [low + span * draw() for _ in repeat(None, n)]
+
+
+def choices(
+    rng: random.Random, population: Sequence[Any], n: int
+) -> List[Any]:
+    """Return *n* items drawn with replacement from *population*."""
+    if np is not None and len(population) > 0:
+        picks = _numpy_rng(rng).integers(0, len(population), size=n)
+        return [population[i] for i in picks.tolist()]
+    return rng.choices(population, k=n)
@@ -0,0 +1,172 @@
+"""Generate strings that match a JSON Schema ``pattern``.
+
+``rstr.xeger`` re-parses its regex on every call. :func:`compile_pattern`
+parses a pattern once with the standard library's regex parser and turns
+it into a tree of small generator functions, cached per pattern. Patterns
+using constructs the tree does not model (backreferences, lookarounds,
+conditionals) compile to ``None`` so callers can fall back to ``rstr``.
+"""
+
+from __future__ import annotations
+
+import re
+import string
+from functools import lru_cache
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+try:
+    from re import _parser as sre_parse  # type: ignore[attr-defined]
+except ImportError:  # Python < 3.11
+    import sre_parse  # type: ignore[no-redef]
+
+# Upper bound for ``*``, ``+`` and large ``{m,n}`` repeats, as in rstr.
+# A ``maxLength`` lowers it further.
+STAR_PLUS_LIMIT = 100
+# Attempts at meeting minLength/maxLength before giving up on them.
+_LENGTH_ATTEMPTS = 10
+
+_PRINTABLE = string.printable
+_CATEGORIES = {
+    "CATEGORY_DIGIT": string.digits,
+    "CATEGORY_NOT_DIGIT": "".join(
+        c for c in _PRINTABLE if c not in string.digits
+    ),
+    "CATEGORY_SPACE": string.whitespace,
+    "CATEGORY_NOT_SPACE": _PRINTABLE.strip(),
+    "CATEGORY_WORD": string.ascii_letters + string.digits + "_",
+    "CATEGORY_NOT_WORD": "".join(
+        c
+        for c in _PRINTABLE
+        if c not in string.ascii_letters + string.digits + "_"
+    ),
+}
+
+# (rng, repeat cap) -> generated text
+_Gen = Callable[[Any, int], str]
+
+
+class _Unsupported(Exception):
+    pass
+
+
+class PatternGenerator:
+    """A parsed ``pattern``, ready to generate matching strings."""
+
+    __slots__ = ("pattern", "_gen")
+
+    def __init__(self, pattern: str, gen: _Gen) -> None:
+        self.pattern = pattern
+        self._gen = gen
+
+    def generate(
+        self,
+        rng: Any,
+        min_length: Optional[int] = None,
+        max_length: Optional[int] = None,
+    ) -> str:
+        """Return a string matching the pattern.
+
+        ``min_length``/``max_length`` are honoured when the pattern allows
+        it within a few attempts; otherwise the last attempt is returned.
+        """
+        cap = STAR_PLUS_LIMIT
+        if max_length is not None:
+            cap = max(0, min(cap, max_length))
+        value = self._gen(rng, cap)
+        for _ in range(_LENGTH_ATTEMPTS - 1):
+            if (min_length is None or len(value) >= min_length) and (
+                max_length is None or len(value) <= max_length
+            ):
+                break
+            value = self._gen(rng, cap)
+        return value
+
+
+@lru_cache(maxsize=512)
+def compile_pattern(pattern: str) -> Optional[PatternGenerator]:
+    """Return a cached :class:`PatternGenerator`, or ``None`` if *pattern*
+    is invalid or uses constructs that need ``rstr``.
+    """
+    try:
+        parsed = sre_parse.parse(pattern)
+        return PatternGenerator(pattern, _sequence(list(parsed)))
+    except (re.error, _Unsupported, OverflowError):
+        return None
+
+
+# ----------------------------------------------------------------------
+# Internals
+# ----------------------------------------------------------------------
+
+
+def _sequence(items: Sequence[Tuple[Any, Any]]) -> _Gen:
+    gens = [g for g in (_node(op, av) for op, av in items) if g is not None]
+    if not gens:
+        return lambda rng, cap: ""
+    if len(gens) == 1:
+        return gens[0]
+    return lambda rng, cap: "".join([g(rng, cap) for g in gens])
+
+
+def _choice(chars: str) -> _Gen:
+    if not chars:
+        raise _Unsupported("empty character set")
+    if len(chars) == 1:
+        return lambda rng, cap: chars
+    return lambda rng, cap: rng.choice(chars)
+
+
+def _node(op: Any, av: Any) -> Optional[_Gen]:
+    name = str(op)
+    if name == "LITERAL":
+        ch = chr(av)
+        return lambda rng, cap: ch
+    if name == "NOT_LITERAL":
+        return _choice(_PRINTABLE.replace(chr(av), ""))
+    if name == "ANY":
+        return _choice(_PRINTABLE.replace("\n", ""))
+    if name == "IN":
+        return _choice(_charset(av))
+    if name == "AT":
+        return None
+    if name == "BRANCH":
+        branches = [_sequence(list(b)) for b in av[1]]
+        return lambda rng, cap: rng.choice(branches)(rng, cap)
+    if name == "SUBPATTERN":
+        # (group, add_flags, del_flags, pattern); captures are not needed
+        # because backreferences are unsupported.
+        return _sequence(list(av[-1]))
+    if name == "ATOMIC_GROUP":
+        return _sequence(list(av))
+    if name in ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT"):
+        lo, hi, body = av
+        inner = _sequence(list(body))
+
+        def repeat(rng: Any, cap: int) -> str:
+            times = rng.randint(lo, max(lo, min(hi, cap)))
+            return "".join([inner(rng, cap) for _ in range(times)])
+
+        return repeat
+    raise _Unsupported(name)
+
+
+def _charset(items: Sequence[Tuple[Any, Any]]) -> str:
+    chars: List[str] = []
+    negate = False
+    for op, av in items:
+        name = str(op)
+        if name == "NEGATE":
+            negate = True
+        elif name == "LITERAL":
+            chars.append(chr(av))
+        elif name == "RANGE":
+            chars.extend(chr(c) for c in range(av[0], av[1] + 1))
+        elif name == "CATEGORY":
+            chars.extend(_CATEGORIES.get(str(av), ""))
+        else:
+            raise _Unsupported(name)
+    if negate:
+        excluded = set(chars)
+        return "".join(c for c in _PRINTABLE if c not in excluded)
+    # Keep first-seen order so output is stable across processes.
+    return "".join(dict.fromkeys(chars))
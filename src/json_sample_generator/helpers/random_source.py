@@ -0,0 +1,92 @@
+"""Per-run random state shared by the generator and value factories.
+
+Value factories returned by :class:`~.DefaultValueGenerator` take no
+arguments, so the random source for a run is published through a
+:class:`~contextvars.ContextVar` instead of being passed explicitly.
+Outside :func:`use_random` everything falls back to the module-global
+``random`` and a shared ``Faker`` instance.
+
+A run may also name its *stream*: a hashable that stays the same across
+the calls of one seeded generator (its seed) while the per-call
+``random.Random`` changes. Caches whose contents must be reproducible
+but outlive a call, such as :class:`~.value_pool.ValuePool` reservoirs,
+key on it.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Hashable, Iterator, Optional
+
+import rstr
+from faker import Faker
+
+fake = Faker()
+
+_active: ContextVar[Optional[random.Random]] = ContextVar(
+    "json_sample_generator_random", default=None
+)
+_stream: ContextVar[Optional[Hashable]] = ContextVar(
+    "json_sample_generator_stream", default=None
+)
+_local = threading.local()
+
+
+def active_random() -> Any:
+    """Return the active ``random.Random`` or the ``random`` module."""
+    rng = _active.get()
+    return random if rng is None else rng
+
+
+def active_stream() -> Optional[Hashable]:
+    """Return the stream named by :func:`use_random`, or None."""
+    return _stream.get()
+
+
+def active_faker() -> Faker:
+    """Return a ``Faker`` drawing from :func:`active_random`.
+
+    Faker instances are expensive to build, so runs reuse one
+    instance per thread and re-point its ``random`` at the active source.
+    """
+    rng = _active.get()
+    if rng is None:
+        return fake
+    faker = getattr(_local, "faker", None)
+    if faker is None:
+        faker = _local.faker = Faker()
+    faker.random = rng
+    return faker
+
+
+def active_rstr() -> Any:
+    """Return an ``rstr`` generator drawing from :func:`active_random`."""
+    rng = _active.get()
+    if rng is None:
+        return rstr
+    xeger = getattr(_local, "rstr", None)
+    if xeger is None:
+        xeger = _local.rstr = rstr.Rstr(rng)
+    xeger._random = rng
+    return xeger
+
+
+@contextmanager
+def use_random(
+    rng: random.Random, stream: Optional[Hashable] = None
+) -> Iterator[random.Random]:
+    """Make *rng* the active random source for the enclosed block.
+
+    *stream* names the seed stream *rng* belongs to (see the module
+    docstring); None means the run has none.
+    """
+    token = _active.set(rng)
+    stream_token = _stream.set(stream)
+    try:
+        yield rng
+    finally:
+        _stream.reset(stream_token)
+        _active.reset(token)
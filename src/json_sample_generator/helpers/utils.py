@@ -1,12 +1,15 @@
 import copy
 import re
 import uuid
-from typing import Any, Dict, List, Mapping, Optional
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 
 from jsonref import JsonRef
 
 pattern = re.compile(r"^([^\\\[\]]+)(?:\[(\d+)\])?$")
 
+# A path split by parse_path: (key, index-or-None) per dotted segment
+PathTokens = Sequence[Tuple[str, Optional[int]]]
+
 
 def _to_idx(s: str) -> Optional[int]:
     try:
@@ -79,6 +82,18 @@ def remove_nulls(obj: Any) -> Any:
     return obj
 
 
+def _initiate_if_not_exists(
+    target: Any, key: str, idx: Optional[int] = None
+) -> None:
+    if key not in target:
+        if idx is None:
+            target[key] = {}
+        else:
+            target[key] = []
+    if idx is not None and idx >= len(target[key]):
+        target[key].extend([{} for _ in range(idx - len(target[key]) + 1)])
+
+
 def set_value_at_path(
     path: str, target: Any, value: Any, force: bool = True
 ) -> Any:
@@ -92,33 +107,26 @@ def set_value_at_path(
     Returns:
         Any: The modified target object.
     """
-
-    def set_value(target, key, value):
-        if force or key not in target:
-            target[key] = value
-            return value
-        return target[key]
-
-    def initiate_if_not_exists(
-        target: Any, key: str, idx: Optional[int] = None
-    ) -> Any:
-        if key not in target:
-            if idx is None:
-                target[key] = {}
-            else:
-                target[key] = []
-        if idx is not None and idx >= len(target[key]):
-            target[key].extend([{} for _ in range(idx - len(target[key]) + 1)])
-
     if not path or path == "":
         target = deep_merge(target, value)
         return target
 
-    keys = parse_path(path)
+    return set_value_at_tokens(parse_path(path), target, value, force)
+
+
+def set_value_at_tokens(
+    keys: PathTokens, target: Any, value: Any, force: bool = True
+) -> Any:
+    """
+    Like :func:`set_value_at_path`, for a path already split by
+    :func:`parse_path`.
+    """
+    if not keys:
+        return deep_merge(target, value)
 
     ref = target
     for key, idx in keys[:-1]:
-        initiate_if_not_exists(ref, key, idx)
+        _initiate_if_not_exists(ref, key, idx)
 
         if idx is not None:
             ref = ref[key][idx]
@@ -127,12 +135,15 @@ def set_value_at_path(
 
     key, idx = keys[-1]
 
-    initiate_if_not_exists(ref, key, idx)
+    _initiate_if_not_exists(ref, key, idx)
 
     if idx is not None:
-        return set_value(ref[key], idx, value)
-    else:
-        return set_value(ref, key, value)
+        ref = ref[key]
+        key = idx
+    if force or key not in ref:
+        ref[key] = value
+        return value
+    return ref[key]
 
 
 def get_value_at_path(path: str, target: Any) -> Any:
@@ -140,20 +151,25 @@ def get_value_at_path(path: str, target: Any) -> Any:
     if not path:
         return target
     try:
-        ref: Any = target
-        for key, idx in parse_path(path):
-            if not isinstance(ref, dict) or key not in ref:
-                return None
-            ref = ref[key]
-            if idx is not None:
-                if not isinstance(ref, list) or idx >= len(ref):
-                    return None
-                ref = ref[idx]
-        return ref
+        return get_value_at_tokens(parse_path(path), target)
     except Exception:
         return None
 
 
+def get_value_at_tokens(keys: PathTokens, target: Any) -> Any:
+    """Return the value at pre-parsed *keys* in *target*, or ``None``."""
+    ref: Any = target
+    for key, idx in keys:
+        if not isinstance(ref, dict) or key not in ref:
+            return None
+        ref = ref[key]
+        if idx is not None:
+            if not isinstance(ref, list) or idx >= len(ref):
+                return None
+            ref = ref[idx]
+    return ref
+
+
 def delete_value_at_path(path: str, target: Any) -> bool:
     """Delete the value at *path* from *target*.
 
@@ -188,6 +204,66 @@ def delete_value_at_path(path: str, target: Any) -> bool:
     return True
 
 
+def copy_path(path: str, target: Any, include_target: bool = False) -> Any:
+    """Return a shallow copy of *target* with the containers along *path*
+    copied too, so they can be changed without touching *target*.
+
+    Every dict and list on the way from the root to *path* is copied; the
+    value at *path* itself only with *include_target*. Everything else is
+    shared with *target*. Copying stops where *path* leaves *target*.
+    This is the building block of :func:`with_value_at_path` and
+    :func:`without_value_at_path`.
+    """
+    root = target.copy()
+    ref = root
+    keys = parse_path(path) if path else []
+    last = len(keys) - 1
+    for pos, (key, idx) in enumerate(keys):
+        if not isinstance(ref, dict) or key not in ref:
+            break
+        child = ref[key]
+        if idx is not None:
+            if not isinstance(child, list):
+                break
+            child = ref[key] = child.copy()
+            if not 0 <= idx < len(child):
+                break
+            ref, key = child, idx
+            child = child[idx]
+        if pos == last and not include_target:
+            break
+        if not isinstance(child, (dict, list)):
+            break
+        ref[key] = ref = child.copy()
+    return root
+
+
+def with_value_at_path(path: str, target: Any, value: Any) -> Any:
+    """Copy-on-write :func:`set_value_at_path`.
+
+    Returns a new root in which *path* holds *value*, sharing every
+    subtree off the path with *target*, which is left unchanged. Missing
+    containers are created as with :func:`set_value_at_path`. An empty
+    *path* replaces the root: *value* is returned as is.
+    """
+    if not path:
+        return value
+    root = copy_path(path, target)
+    set_value_at_path(path, root, value)
+    return root
+
+
+def without_value_at_path(path: str, target: Any) -> Any:
+    """Copy-on-write :func:`delete_value_at_path`.
+
+    Returns a new root without the value at *path*, sharing every
+    subtree off the path with *target*, which is left unchanged.
+    """
+    root = copy_path(path, target)
+    delete_value_at_path(path, root)
+    return root
+
+
 def sort_with_priority(
     data: Mapping[str, Any],
     priority: List[str] = ["@type", "@baseType", "id", "href"],
@@ -0,0 +1,153 @@
+"""Reservoirs of pre-generated Faker values.
+
+Faker providers cost tens of microseconds per value, which dominates bulk
+generation of string-heavy schemas. A :class:`ValuePool` keeps a
+reservoir of values per kind (a ``format`` such as ``"email"``, or
+``"word"``/``"pystr"``) and samples from it instead of calling Faker for
+every value.
+
+Each draw picks a random slot of the reservoir and fills it on first
+use, so short runs cost about the same as without a pool. With
+probability ``refresh`` a draw returns a fresh value instead.
+``refresh`` is the knob between novelty (``1.0`` always calls Faker) and
+speed (``0.0`` never does once the reservoir is full).
+
+Reservoirs are kept per seed stream (see :mod:`.random_source`), so
+they carry over between the ``generate()`` calls of one generator. A
+slot of a stream is always filled with the same value, generated from a
+random source derived from the stream, the kind and the slot, so
+reusing a reservoir never changes what a seed produces. Runs without a
+stream get reservoirs of their own, keyed by the active
+``random.Random``.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, List
+
+from .random_source import active_random, active_stream, use_random
+
+# Kinds that identify values and so are never pooled by default.
+DEFAULT_EXCLUDED = frozenset({"uuid"})
+
+# Reservoirs of this many seed streams are kept; the oldest are dropped.
+MAX_STREAMS = 64
+
+# Marks a reservoir slot that has not been filled yet.
+_EMPTY = object()
+
+
+class ValuePool:
+    """Per-kind reservoirs of generated values.
+
+    Parameters
+    ----------
+    size:
+        Number of values kept per kind.
+    refresh:
+        Probability that a draw generates a fresh value instead of
+        reusing a pooled one. Between ``0.0`` and ``1.0``.
+    exclude:
+        Kinds that are always generated fresh; ``uuid`` by default.
+
+    Examples
+    --------
+    >>> pool = ValuePool(size=2048, refresh=0.01)
+    >>> gen = JSONSchemaGenerator(
+    ...     schema, default_value_generator=DefaultValueGenerator(pool=pool)
+    ... )
+    """
+
+    def __init__(
+        self,
+        size: int = 1024,
+        refresh: float = 0.05,
+        exclude: Iterable[str] = DEFAULT_EXCLUDED,
+    ) -> None:
+        if size < 1:
+            raise ValueError(f"size must be >= 1, got {size}")
+        if not 0.0 <= refresh <= 1.0:
+            raise ValueError(f"refresh must be in [0, 1], got {refresh}")
+        self.size = size
+        self.refresh = refresh
+        self.exclude = frozenset(exclude)
+        # seed stream -> key -> reservoir, least recently used first
+        self._streams: OrderedDict[Hashable, Dict[Hashable, List[Any]]] = (
+            OrderedDict()
+        )
+        # active Random (or the ``random`` module) -> key -> reservoir,
+        # for runs without a stream
+        self._reservoirs: weakref.WeakKeyDictionary[
+            Any, Dict[Hashable, List[Any]]
+        ] = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def __reduce__(self) -> Any:
+        # Reservoirs are per process; ship only the configuration (e.g. to
+        # ParallelGenerator workers).
+        return (type(self), (self.size, self.refresh, self.exclude))
+
+    def wrap(
+        self, kind: str, factory: Callable[[], Any], key: Hashable = None
+    ) -> Callable[[], Any]:
+        """Return a factory drawing from the reservoir for *kind*.
+
+        *key* distinguishes reservoirs of the same kind whose factories
+        differ (e.g. ``pystr`` length bounds); it defaults to *kind*.
+        """
+        if kind in self.exclude:
+            return factory
+        slot = kind if key is None else key
+        return lambda: self.draw(slot, factory)
+
+    def draw(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """Return a value for *key*, calling *factory* when needed."""
+        rng = active_random()
+        if self.refresh and rng.random() < self.refresh:
+            return factory()
+        stream = active_stream()
+        reservoir = self._reservoir(rng, stream, key)
+        slot = rng.randrange(self.size)
+        value = reservoir[slot]
+        if value is _EMPTY:
+            if stream is None:
+                value = factory()
+            else:
+                with use_random(random.Random(f"{stream!r}:{key!r}:{slot}")):
+                    value = factory()
+            reservoir[slot] = value
+        return value
+
+    def clear(self) -> None:
+        """Drop every reservoir."""
+        with self._lock:
+            self._streams = OrderedDict()
+            self._reservoirs = weakref.WeakKeyDictionary()
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _reservoir(
+        self, rng: Any, stream: Hashable, key: Hashable
+    ) -> List[Any]:
+        if stream is None:
+            reservoirs = self._reservoirs.get(rng)
+            if reservoirs is None:
+                with self._lock:
+                    reservoirs = self._reservoirs.setdefault(rng, {})
+        else:
+            reservoirs = self._streams.get(stream)
+            if reservoirs is None:
+                with self._lock:
+                    reservoirs = self._streams.setdefault(stream, {})
+                    while len(self._streams) > MAX_STREAMS:
+                        self._streams.popitem(last=False)
+        reservoir = reservoirs.get(key)
+        if reservoir is None:
+            reservoir = reservoirs.setdefault(key, [_EMPTY] * self.size)
+        return reservoir
@@ -1,10 +1,18 @@
 from .break_models import BreakKind, BreakRule, BreakScenario
-from .models import Context, Scenario, Schema
+from .models import (
+    Context,
+    DependentOverride,
+    Scenario,
+    Schema,
+    depends_on,
+)
 
 __all__ = [
     "Scenario",
     "Schema",
     "Context",
+    "DependentOverride",
+    "depends_on",
     "BreakKind",
     "BreakRule",
     "BreakScenario",
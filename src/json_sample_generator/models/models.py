@@ -2,10 +2,25 @@
 from __future__ import annotations
 
 import warnings
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 
 from jsonref import jsonloader, replace_refs
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+
+from ..helpers.allof_handler import AllOfCache
+
+if TYPE_CHECKING:
+    from ..site_index import SiteIndex
 
 # Define a type for scenario override functions
 ScenarioOverrideFn = Callable[["Context"], Any]
@@ -14,6 +29,54 @@ ScenarioOverrideFn = Callable[["Context"], Any]
 ScenarioOverrideValue = Union[ScenarioOverrideFn, Any]
 
 
+class DependentOverride:
+    """An override callable that declares which paths it reads.
+
+    Build one with :func:`depends_on`. The generator evaluates these
+    overrides after the rest of the sample, in dependency order, instead
+    of retrying them until their inputs exist.
+    """
+
+    __slots__ = ("fn", "depends_on")
+
+    def __init__(self, fn: ScenarioOverrideFn, depends_on: Tuple[str, ...]):
+        self.fn = fn
+        self.depends_on = depends_on
+
+    def __call__(self, ctx: "Context") -> Any:
+        return self.fn(ctx)
+
+    def __repr__(self) -> str:
+        return f"DependentOverride({self.fn!r}, depends_on={self.depends_on})"
+
+
+def depends_on(
+    *paths: str,
+) -> Callable[[ScenarioOverrideFn], DependentOverride]:
+    """Declare the property paths an override reads from ``ctx.data``.
+
+    Example::
+
+        @depends_on("first_name", "last_name")
+        def full_name(ctx):
+            return f"{ctx.data['first_name']} {ctx.data['last_name']}"
+
+        Scenario(name="s", overrides={"full_name": full_name})
+
+    A dependency on ``"address"`` also covers overrides below it, such as
+    ``"address.city"``.
+    """
+
+    def wrap(fn: ScenarioOverrideFn) -> DependentOverride:
+        if not callable(fn):
+            raise TypeError(
+                f"depends_on() expects a callable override, got {fn!r}"
+            )
+        return DependentOverride(fn, tuple(paths))
+
+    return wrap
+
+
 class Scenario(BaseModel):
     name: str
     description: Optional[str] = None
@@ -98,6 +161,44 @@ class Scenario(BaseModel):
 class Schema(BaseModel):
     data: Dict[Any, Any]
     base_uri: Optional[str] = None
+    _allof_cache: Optional[AllOfCache] = PrivateAttr(default=None)
+    # max_depth -> (the data it was built from, SiteIndex)
+    _site_indexes: Dict[int, Tuple[Any, SiteIndex]] = PrivateAttr(
+        default_factory=dict
+    )
+
+    @property
+    def allof_cache(self) -> AllOfCache:
+        """
+        Merged ``allOf`` nodes of this schema, shared by the generator,
+        the scenario/break enumerators and :class:`~.SampleBreaker`.
+        Call :meth:`invalidate` after editing ``data`` in place.
+        """
+        if self._allof_cache is None:
+            self._allof_cache = AllOfCache()
+        return self._allof_cache
+
+    def site_index(self, max_depth: int = 6) -> SiteIndex:
+        """
+        The variant and break sites of this schema, found by a single
+        walk per ``max_depth`` and cached. Backs
+        ``collect_variant_sites``, ``collect_break_sites`` and every
+        enumerator built on them. Assigning a new ``data`` is picked up
+        automatically; call :meth:`invalidate` after editing it in place.
+        """
+        from ..site_index import build_site_index
+
+        hit = self._site_indexes.get(max_depth)
+        if hit is not None and hit[0] is self.data:
+            return hit[1]
+        index = build_site_index(self.data, max_depth, self.allof_cache)
+        self._site_indexes[max_depth] = (self.data, index)
+        return index
+
+    def invalidate(self) -> None:
+        """Drop cached ``allOf`` merges and site indexes."""
+        self.allof_cache.invalidate()
+        self._site_indexes.clear()
 
     @staticmethod
     def from_raw_data(raw: Dict[str, Any], base_uri: str) -> Schema:
@@ -0,0 +1,194 @@
+"""Process-pool backed sample generation.
+
+:class:`ParallelGenerator` spreads :meth:`JSONSchemaGenerator.generate_many`
+across worker processes so pure-Python generation is not bound by the
+GIL. The schema and generator options are shipped to each worker once,
+when the pool starts; every worker resolves ``$ref`` pointers and
+compiles its generation plan a single time and then serves chunks.
+
+Output is deterministic: samples are produced in fixed-size chunks and
+chunk ``i`` is generated from a seed derived from ``(seed, i)``, so the
+result depends only on ``seed`` and ``chunk_size`` — not on the number
+of workers or the order in which chunks finish.
+"""
+
+from __future__ import annotations
+
+import collections
+import os
+import pickle
+import random
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Deque, Dict, Iterator, List, Optional
+
+from .JSONSchemaGenerator import JSONSchemaGenerator
+from .models import Scenario, Schema
+
+_DEFAULT_CHUNK_SIZE = 1_000
+
+# Per-process generator, built once by the pool initializer.
+_worker_generator: Optional[JSONSchemaGenerator] = None
+
+
+def _init_worker(
+    schema_data: Dict[Any, Any],
+    base_uri: Optional[str],
+    options: Dict[str, Any],
+) -> None:
+    global _worker_generator
+    _worker_generator = JSONSchemaGenerator(
+        Schema(data=schema_data, base_uri=base_uri), **options
+    )
+    _worker_generator.compile()
+
+
+def _generate_chunk(count: int, scenario: bytes, seed: int) -> List[Any]:
+    assert _worker_generator is not None, "worker was not initialized"
+    return _worker_generator.generate_many(
+        count, pickle.loads(scenario), seed=seed
+    )
+
+
+def _chunk_seed(seed: int, index: int) -> int:
+    """Derive the seed for chunk *index*; stable across processes and runs."""
+    return random.Random(f"{seed}:{index}").getrandbits(64)
+
+
+class ParallelGenerator:
+    """Generate samples for one schema on a pool of worker processes.
+
+    Parameters
+    ----------
+    schema:
+        The schema to generate samples for.
+    workers:
+        Number of worker processes (``None`` uses ``os.cpu_count()``).
+    chunk_size:
+        Samples generated per task. Part of the seed derivation, so keep
+        it fixed when comparing outputs across runs.
+    scenario:
+        Default scenario, as for :class:`~.JSONSchemaGenerator`.
+    mp_context:
+        Optional :mod:`multiprocessing` context for the pool.
+    **generator_options:
+        Extra keyword arguments for the per-worker
+        :class:`~.JSONSchemaGenerator` (``max_depth``,
+        ``generator_max_items``, ...). They must be picklable.
+
+    Scenarios are pickled to reach the workers, so overrides and
+    selectors must be plain values or module-level functions. Note that
+    :meth:`Scenario.normalize` (also called by ``generate``) replaces
+    plain values with lambdas, so pass scenarios that have not been
+    normalized.
+    """
+
+    def __init__(
+        self,
+        schema: Schema,
+        workers: Optional[int] = None,
+        chunk_size: int = _DEFAULT_CHUNK_SIZE,
+        scenario: Optional[Scenario] = None,
+        mp_context: Any = None,
+        **generator_options: Any,
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+        self.schema = schema
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.scenario = scenario or Scenario(name="default")
+        self._mp_context = mp_context
+        self._generator_options = generator_options
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> ParallelGenerator:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the worker pool; it is restarted on next use."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def generate_many(
+        self,
+        count: int,
+        scenario: Optional[Scenario] = None,
+        seed: Optional[int] = None,
+    ) -> List[Any]:
+        """Generate *count* samples in a stable order.
+
+        Args:
+            count: Number of samples to generate.
+            scenario: Optional scenario; defaults to the constructor's.
+            seed: Optional seed. The same seed and ``chunk_size`` yield
+                the same samples regardless of ``workers``.
+
+        Returns:
+            List of generated JSON samples
+        """
+        return list(self.iter_generate(count, scenario, seed))
+
+    def iter_generate(
+        self,
+        count: int,
+        scenario: Optional[Scenario] = None,
+        seed: Optional[int] = None,
+    ) -> Iterator[Any]:
+        """Yield *count* samples in order; see :meth:`generate_many`.
+
+        At most two chunks per worker are in flight, so memory stays
+        bounded when the consumer is slower than the pool.
+        """
+        payload = self._pickle_scenario(scenario or self.scenario)
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(64)
+
+        executor = self._pool()
+        window = 2 * self.workers
+        pending: Deque[Future] = collections.deque()
+        remaining = count
+        index = 0
+        while remaining > 0 or pending:
+            while remaining > 0 and len(pending) < window:
+                size = min(self.chunk_size, remaining)
+                pending.append(
+                    executor.submit(
+                        _generate_chunk,
+                        size,
+                        payload,
+                        _chunk_seed(seed, index),
+                    )
+                )
+                remaining -= size
+                index += 1
+            yield from pending.popleft().result()
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=self._mp_context,
+                initializer=_init_worker,
+                initargs=(
+                    self.schema.data,
+                    self.schema.base_uri,
+                    self._generator_options,
+                ),
+            )
+        return self._executor
+
+    @staticmethod
+    def _pickle_scenario(scenario: Scenario) -> bytes:
+        try:
+            return pickle.dumps(scenario)
+        except (pickle.PicklingError, AttributeError, TypeError) as exc:
+            raise TypeError(
+                f"scenario {scenario.name!r} cannot be sent to worker "
+                "processes; use plain values or module-level functions "
+                "for overrides and selectors, and do not normalize() it "
+                f"first ({exc})"
+            ) from exc
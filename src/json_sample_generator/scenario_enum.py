@@ -4,12 +4,17 @@ Two strategies are provided:
 
 * :func:`cartesian_scenarios` emits the full cartesian product of variants
   across every discovered site — useful when every combination matters.
+  :func:`iter_cartesian_scenarios` yields the same scenarios lazily, with
+  sharding and resuming for products too large to hold in memory.
 * :func:`minimal_scenarios` emits a 1-wise covering set of size
   ``max(site.count)`` so that every variant of every site appears in at
   least one scenario — the smallest fixture set that still touches every
   branch.
+* :func:`pairwise_scenarios` sits in between: every pair (or t-tuple) of
+  variants across sites appears in some scenario, for a small fraction
+  of the cartesian product.
 
-Both strategies return :class:`Scenario` objects with ``oneof_selectors``
+All strategies return :class:`Scenario` objects with ``oneof_selectors``
 pre-filled. Selector keys are regex patterns so wildcard array paths like
 ``items[*]`` match the concrete ``items[0]``, ``items[1]``, ... paths the
 generator produces at runtime.
@@ -17,40 +22,26 @@ generator produces at runtime.
 
 from __future__ import annotations
 
-import itertools
 import re
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from itertools import combinations
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
-from jsonref import JsonRef
-
-from .helpers.allof_handler import allof_merge
 from .models import Scenario, Schema
+from .site_index import Enclosing, VariantSite
 
 _DEFAULT_MAX_DEPTH = 6
 _DEFAULT_MAX_SCENARIOS = 10_000
 
 
-@dataclass(frozen=True)
-class VariantSite:
-    """A location in a schema where a branch must be chosen.
-
-    Attributes:
-        path: Property path to the composite node (empty string at root).
-            Array items use ``[*]`` as the index placeholder.
-        kind: ``"oneOf"`` or ``"anyOf"``.
-        count: Number of variants at this site.
-        names: Best-effort human labels for each variant — the variant's
-            ``title``, else a discriminator-mapping key, else
-            ``f"variant_{i}"``.
-    """
-
-    path: str
-    kind: str
-    count: int
-    names: Tuple[str, ...]
-
-
 def collect_variant_sites(
     schema: Schema, *, max_depth: int = _DEFAULT_MAX_DEPTH
 ) -> List[VariantSite]:
@@ -62,11 +53,11 @@ def collect_variant_sites(
     arise when two sibling variants of an outer oneOf both contain a
     nested oneOf at the same relative path — are collapsed to the first
     occurrence.
+
+    The walk is cached on the schema (:meth:`.Schema.site_index`), so
+    every enumerator below reuses it.
     """
-    sites: List[VariantSite] = []
-    seen: Dict[Tuple[str, str], int] = {}
-    _walk(schema.data, "", 0, max_depth, sites, seen)
-    return sites
+    return list(schema.site_index(max_depth).variant_sites)
 
 
 def cartesian_scenarios(
@@ -94,21 +85,63 @@ def cartesian_scenarios(
         raise ValueError(
             f"cartesian product would produce {total} scenarios "
             f"(max_scenarios={max_scenarios}); pass a higher "
-            "max_scenarios or use minimal_scenarios()"
+            "max_scenarios, stream with iter_cartesian_scenarios() or use "
+            "minimal_scenarios()"
         )
 
-    combos = itertools.product(*(range(s.count) for s in sites))
-    width = max(len(str(total - 1)), 1)
-    return [
-        _build_scenario(
-            combo,
-            sites,
-            f"{name_prefix}_{idx:0{width}d}",
-            _describe(sites, combo),
-            base,
-        )
-        for idx, combo in enumerate(combos)
-    ]
+    return list(
+        _iter_cartesian(sites, total, name_prefix, base, 0, total, 0, 1)
+    )
+
+
+def iter_cartesian_scenarios(
+    schema: Schema,
+    *,
+    name_prefix: str = "cartesian",
+    base: Optional[Scenario] = None,
+    shard: int = 0,
+    num_shards: int = 1,
+    start: int = 0,
+    stop: Optional[int] = None,
+) -> Iterator[Scenario]:
+    """Lazily yield the scenarios of :func:`cartesian_scenarios`.
+
+    Scenarios are built one at a time and there is no ``max_scenarios``
+    cap. Combination ``i`` (in :func:`cartesian_scenarios` order, and
+    with the same name) is decoded straight from ``i``, so skipping ahead
+    costs nothing.
+
+    Args:
+        schema: The schema to enumerate.
+        name_prefix: Prefix of the scenario names.
+        base: Optional scenario whose overrides and defaults every
+            generated scenario starts from.
+        shard: Which shard to yield, ``0 <= shard < num_shards``. Shard
+            ``k`` gets the combinations whose index ``i`` satisfies
+            ``i % num_shards == k``.
+        num_shards: Number of workers splitting the product.
+        start: First combination index to consider, e.g. to resume after
+            the last one processed.
+        stop: Index to stop before; defaults to the size of the product.
+
+    Raises:
+        ValueError: If the shard or range arguments are out of bounds.
+    """
+    if num_shards < 1:
+        raise ValueError(f"num_shards must be >= 1, got {num_shards}")
+    if not 0 <= shard < num_shards:
+        raise ValueError(f"shard must be in [0, {num_shards}), got {shard}")
+    if start < 0:
+        raise ValueError(f"start must be >= 0, got {start}")
+
+    sites = collect_variant_sites(schema)
+    total = 1
+    for site in sites:
+        total *= site.count
+    end = total if stop is None else min(stop, total)
+    return _iter_cartesian(
+        sites, total, name_prefix, base, start, end, shard, num_shards
+    )
 
 
 def minimal_scenarios(
@@ -146,88 +179,244 @@ def minimal_scenarios(
     return result
 
 
+def pairwise_scenarios(
+    schema: Schema,
+    *,
+    strength: int = 2,
+    name_prefix: str = "pairwise",
+    base: Optional[Scenario] = None,
+) -> List[Scenario]:
+    """Build a scenario set covering every combination of ``strength`` sites.
+
+    For every ``strength`` sites and every choice of one variant per
+    site, at least one scenario selects all of them together — with the
+    default ``strength=2``, every pair of variants across two sites. The
+    set grows roughly with the product of the ``strength`` largest site
+    counts times a logarithm of the number of sites, instead of with the
+    product of *all* counts as :func:`cartesian_scenarios` does.
+
+    Rows are built with the IPOG strategy: sites are added one at a time,
+    first by picking, for each existing scenario, the variant that covers
+    the most uncovered combinations, then by adding scenarios for the
+    combinations left over.
+
+    Nesting is respected: a site nested inside a variant of another site
+    is only combined with the assignments under which it is reached, and
+    a scenario leaves out the selector of every site it cannot reach.
+
+    Args:
+        schema: The schema to enumerate.
+        strength: How many sites each covered combination spans;
+            ``1`` gives a 1-wise covering set like
+            :func:`minimal_scenarios`. With at most ``strength`` sites
+            the result is the cartesian product.
+        name_prefix: Prefix of the scenario names.
+        base: Optional scenario whose overrides and defaults every
+            generated scenario starts from.
+
+    Raises:
+        ValueError: If ``strength`` is below 1.
+    """
+    if strength < 1:
+        raise ValueError(f"strength must be >= 1, got {strength}")
+
+    index = schema.site_index(_DEFAULT_MAX_DEPTH)
+    sites = list(index.variant_sites)
+    if not sites:
+        return [_build_scenario((), [], f"{name_prefix}_0", "", base)]
+
+    rows = _covering_rows(sites, _conditions(index.enclosing), strength)
+    width = max(len(str(len(rows) - 1)), 1)
+    result: List[Scenario] = []
+    for r_idx, row in enumerate(rows):
+        picked = [s for s, value in enumerate(row) if value is not None]
+        row_sites = [sites[s] for s in picked]
+        combo = tuple(row[s] for s in picked)
+        result.append(
+            _build_scenario(
+                combo,
+                row_sites,
+                f"{name_prefix}_{r_idx:0{width}d}",
+                _describe(row_sites, combo),
+                base,
+            )
+        )
+    return result
+
+
 # ---------------------------------------------------------------------------
 # Internals
 # ---------------------------------------------------------------------------
 
 
-def _unwrap(node: Any) -> Any:
-    if isinstance(node, JsonRef):
-        try:
-            return node.__subject__
-        except Exception:
-            return node
-    return node
-
-
-def _variant_label(variant: Any, index: int, mapping: Dict[str, Any]) -> str:
-    variant = _unwrap(variant)
-    if isinstance(variant, dict):
-        title = variant.get("title")
-        if isinstance(title, str) and title:
-            return title
-        # Reverse-lookup discriminator mapping by ref tail, if we can.
-        for map_key, ref in mapping.items():
-            tail = str(ref).rsplit("/", 1)[-1]
-            if tail and variant.get("title") == tail:
-                return str(map_key)
-    return f"variant_{index}"
-
-
-def _walk(
-    node: Any,
-    path: str,
-    depth: int,
-    max_depth: int,
-    out: List[VariantSite],
-    seen: Dict[Tuple[str, str], int],
-) -> None:
-    if depth > max_depth:
-        return
-    node = _unwrap(node)
-    if not isinstance(node, dict):
-        return
-
-    if "allOf" in node:
-        try:
-            merged = allof_merge(node)
-        except Exception:
-            merged = node
-        _walk(merged, path, depth + 1, max_depth, out, seen)
-        return
-
-    for kind in ("oneOf", "anyOf"):
-        variants = node.get(kind)
-        if not isinstance(variants, list) or not variants:
-            continue
-        discriminator = node.get("discriminator") or {}
-        mapping = discriminator.get("mapping") or {}
-        names = tuple(
-            _variant_label(v, i, mapping) for i, v in enumerate(variants)
+def _iter_cartesian(
+    sites: List[VariantSite],
+    total: int,
+    name_prefix: str,
+    base: Optional[Scenario],
+    start: int,
+    stop: int,
+    shard: int,
+    num_shards: int,
+) -> Iterator[Scenario]:
+    width = max(len(str(total - 1)), 1)
+    first = start + (shard - start) % num_shards
+    for idx in range(first, stop, num_shards):
+        combo = _decode_combo(sites, idx)
+        yield _build_scenario(
+            combo,
+            sites,
+            f"{name_prefix}_{idx:0{width}d}",
+            _describe(sites, combo),
+            base,
         )
-        key = (path, kind)
-        if key not in seen:
-            seen[key] = len(out)
-            out.append(
-                VariantSite(
-                    path=path,
-                    kind=kind,
-                    count=len(variants),
-                    names=names,
+
+
+def _decode_combo(sites: List[VariantSite], index: int) -> Tuple[int, ...]:
+    """Return combination *index* of the product, last site fastest."""
+    combo = [0] * len(sites)
+    for pos in range(len(sites) - 1, -1, -1):
+        index, combo[pos] = divmod(index, sites[pos].count)
+    return tuple(combo)
+
+
+# A covering-array row: one variant per site, None where it does not matter
+_Row = List[Optional[int]]
+# ((site, variant), ...) in ascending site order
+_Interaction = Tuple[Tuple[int, int], ...]
+
+
+def _conditions(
+    enclosing: Sequence[Optional[Enclosing]],
+) -> List[Dict[int, FrozenSet[int]]]:
+    """Return, per site, the variants its enclosing sites must select."""
+    conditions: List[Dict[int, FrozenSet[int]]] = []
+    for link in enclosing:
+        condition: Dict[int, FrozenSet[int]] = {}
+        if link is not None:
+            parent, variants = link
+            condition = dict(conditions[parent])
+            condition[parent] = variants
+        conditions.append(condition)
+    return conditions
+
+
+def _requirements(
+    interaction: _Interaction,
+    conditions: List[Dict[int, FrozenSet[int]]],
+) -> Optional[Dict[int, FrozenSet[int]]]:
+    """Return the variants a row needs so *interaction* is reached.
+
+    Returns None when no row can reach every site of the interaction.
+    """
+    required: Dict[int, FrozenSet[int]] = {}
+    for site, value in interaction:
+        for idx, allowed in (
+            *conditions[site].items(),
+            (site, frozenset((value,))),
+        ):
+            if idx in required:
+                allowed = required[idx] & allowed
+                if not allowed:
+                    return None
+            required[idx] = allowed
+    return required
+
+
+def _reachable(row: _Row, condition: Dict[int, FrozenSet[int]]) -> bool:
+    return all(row[idx] in allowed for idx, allowed in condition.items())
+
+
+def _covering_rows(
+    sites: List[VariantSite],
+    conditions: List[Dict[int, FrozenSet[int]]],
+    strength: int,
+) -> List[_Row]:
+    """Build a ``strength``-wise covering array with IPOG.
+
+    Sites are visited in discovery order, which puts every site after
+    the sites enclosing it. A row holds a variant only for sites it
+    reaches, so every set value takes part in the coverage.
+    """
+    n = len(sites)
+    first = min(strength, n)
+    rows: List[_Row] = []
+    unique = set()
+    for idx in range(_product_size(sites[:first])):
+        row: _Row = [*_decode_combo(sites[:first], idx), *[None] * (n - first)]
+        for site in range(first):
+            if not _reachable(row, conditions[site]):
+                row[site] = None
+        if tuple(row) not in unique:
+            unique.add(tuple(row))
+            rows.append(row)
+
+    for k in range(first, n):
+        uncovered: Dict[_Interaction, Dict[int, FrozenSet[int]]] = {}
+        for others in combinations(range(k), strength - 1):
+            for idx in range(_product_size([sites[s] for s in others])):
+                values = _decode_combo([sites[s] for s in others], idx)
+                for value in range(sites[k].count):
+                    interaction = (*zip(others, values), (k, value))
+                    required = _requirements(interaction, conditions)
+                    if required is not None:
+                        uncovered[interaction] = required
+
+        # Horizontal growth: extend every row by the best variant of k.
+        for row in rows:
+            if not _reachable(row, conditions[k]):
+                continue
+            assigned = [s for s in range(k) if row[s] is not None]
+            best, best_gain = None, 0
+            for value in range(sites[k].count):
+                gain = sum(
+                    (*((s, row[s]) for s in others), (k, value)) in uncovered
+                    for others in combinations(assigned, strength - 1)
+                )
+                if gain > best_gain:
+                    best, best_gain = value, gain
+            if best is None:
+                continue  # leave it free for vertical growth
+            row[k] = best
+            for others in combinations(assigned, strength - 1):
+                uncovered.pop(
+                    (*((s, row[s]) for s in others), (k, best)), None
                 )
+
+        # Vertical growth: fit what is left into free slots or new rows.
+        for interaction in sorted(uncovered):
+            required = uncovered[interaction]
+            target = next(
+                (
+                    row
+                    for row in rows
+                    if all(
+                        row[idx] is None or row[idx] in allowed
+                        for idx, allowed in required.items()
+                    )
+                ),
+                None,
             )
-        for v in variants:
-            _walk(v, path, depth + 1, max_depth, out, seen)
-
-    props = node.get("properties")
-    if isinstance(props, dict):
-        for prop_name, prop_schema in props.items():
-            child_path = f"{path}.{prop_name}" if path else str(prop_name)
-            _walk(prop_schema, child_path, depth + 1, max_depth, out, seen)
-
-    items = node.get("items")
-    if isinstance(items, (dict, JsonRef)):
-        _walk(items, f"{path}[*]", depth + 1, max_depth, out, seen)
+            if target is None:
+                target = [None] * n
+                rows.append(target)
+            for idx, allowed in required.items():
+                if target[idx] is None:
+                    target[idx] = min(allowed)
+
+    # Sites a row reaches but no combination needed get any variant.
+    for r_idx, row in enumerate(rows):
+        for site in range(n):
+            if row[site] is None and _reachable(row, conditions[site]):
+                row[site] = r_idx % sites[site].count
+    return rows
+
+
+def _product_size(sites: List[VariantSite]) -> int:
+    total = 1
+    for site in sites:
+        total *= site.count
+    return total
 
 
 def _site_to_regex_key(path: str) -> str:
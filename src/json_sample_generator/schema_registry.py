@@ -0,0 +1,208 @@
+"""Share resolved schema documents between generators.
+
+Building a :class:`~.JSONSchemaGenerator` deep-copies the schema and runs
+``jsonref.replace_refs`` over it. For an OpenAPI document with hundreds of
+components that cost is paid again for every generator, even though the
+document never changes. :class:`SchemaRegistry` resolves each document
+once, keyed by its content and ``base_uri``, and hands out generators for
+the whole document or any fragment of it. Generators for the same
+fragment share one :class:`~.models.Schema`, so merged ``allOf`` nodes
+are computed once for all of them.
+
+Registered documents are treated as immutable: generators share the
+resolved tree, so mutating it (or the dict it was registered from)
+after the fact is not supported. Call :meth:`SchemaRegistry.clear` after
+changing a schema in place.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from jsonref import jsonloader
+
+from .JSONSchemaGenerator import (
+    DEFAULT_BASE_URI,
+    JSONSchemaGenerator,
+    resolve_schema_refs,
+)
+from .models import Schema
+
+_CacheKey = Tuple[str, Optional[str]]
+
+
+def _fingerprint(data: Any) -> str:
+    """Return a stable content hash for a JSON document."""
+    encoded = json.dumps(
+        data, sort_keys=True, separators=(",", ":"), default=str
+    ).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+class SchemaRegistry:
+    """An LRU cache of ``$ref``-resolved schema documents.
+
+    Parameters
+    ----------
+    maxsize:
+        Number of resolved documents to keep; the least recently used one
+        is evicted first.
+    loader:
+        ``jsonref`` loader for remote references, as for
+        :class:`~.JSONSchemaGenerator`.
+
+    Examples
+    --------
+    >>> registry = SchemaRegistry()
+    >>> pet = registry.component(Schema(data=openapi_doc), "Pet")
+    >>> order = registry.component(Schema(data=openapi_doc), "Order")
+
+    Both generators share a single resolution of ``openapi_doc``.
+    """
+
+    def __init__(self, maxsize: int = 32, loader=jsonloader) -> None:
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be >= 1, got {maxsize}")
+        self.maxsize = maxsize
+        self.loader = loader
+        self._documents: OrderedDict[_CacheKey, Dict[Any, Any]] = OrderedDict()
+        # (document key, fragment) -> Schema handed to generators
+        self._schemas: Dict[Tuple[_CacheKey, str], Schema] = {}
+        # id(source dict) -> (source dict, key): skips re-hashing when the
+        # same dict object is registered again. The source is kept alive
+        # so its id cannot be recycled while the entry exists.
+        self._by_identity: Dict[Tuple[int, Optional[str]], Tuple[Any, Any]] = (
+            {}
+        )
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def clear(self) -> None:
+        """Drop every cached document."""
+        with self._lock:
+            self._documents.clear()
+            self._by_identity.clear()
+            self._schemas.clear()
+
+    def resolve(self, schema: Schema) -> Dict[Any, Any]:
+        """Return the resolved document for *schema*, resolving on a miss."""
+        return self._resolve(schema)[1]
+
+    def generator(
+        self,
+        schema: Schema,
+        fragment: Optional[str] = None,
+        **options: Any,
+    ) -> JSONSchemaGenerator:
+        """Return a generator for *schema* or one of its fragments.
+
+        Args:
+            schema: The full schema document
+            fragment: Optional JSON pointer into the document (e.g.
+                ``"/components/schemas/Pet"``)
+            **options: Keyword arguments for :class:`~.JSONSchemaGenerator`
+                (``max_depth``, ``seed``, ...)
+
+        Returns:
+            A generator sharing the registry's resolved document
+
+        Raises:
+            ValueError: If the fragment does not exist in the document
+        """
+        key, document = self._resolve(schema)
+        tokens = (fragment or "").strip("/")
+        with self._lock:
+            shared = self._schemas.get((key, tokens))
+        if shared is None:
+            shared = self._fragment_schema(
+                document, schema.base_uri, fragment, tokens
+            )
+            with self._lock:
+                # Skip caching if the document was evicted meanwhile.
+                if key in self._documents:
+                    shared = self._schemas.setdefault((key, tokens), shared)
+        options.setdefault("loader", self.loader)
+        return JSONSchemaGenerator(shared, resolve_refs=False, **options)
+
+    def component(
+        self, schema: Schema, name: str, **options: Any
+    ) -> JSONSchemaGenerator:
+        """Return a generator for ``#/components/schemas/<name>``."""
+        return self.generator(
+            schema, fragment=f"/components/schemas/{name}", **options
+        )
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _resolve(self, schema: Schema) -> Tuple[_CacheKey, Dict[Any, Any]]:
+        document_uri = schema.base_uri
+        identity = (id(schema.data), document_uri)
+        with self._lock:
+            hit = self._by_identity.get(identity)
+            if hit is not None and hit[0] is schema.data:
+                key = hit[1]
+            else:
+                key = (_fingerprint(schema.data), document_uri)
+            resolved = self._documents.get(key)
+            if resolved is not None:
+                self._documents.move_to_end(key)
+                self._by_identity[identity] = (schema.data, key)
+                return key, resolved
+
+        # Resolve outside the lock; a concurrent miss on the same document
+        # may resolve it twice, but only one copy is kept.
+        fresh = resolve_schema_refs(
+            copy.deepcopy(schema.data),
+            document_uri,
+            self.loader,
+        )
+        with self._lock:
+            resolved = self._documents.setdefault(key, fresh)
+            self._documents.move_to_end(key)
+            self._by_identity[identity] = (schema.data, key)
+            while len(self._documents) > self.maxsize:
+                evicted, _ = self._documents.popitem(last=False)
+                self._by_identity = {
+                    ident: entry
+                    for ident, entry in self._by_identity.items()
+                    if entry[1] != evicted
+                }
+                self._schemas = {
+                    entry: cached
+                    for entry, cached in self._schemas.items()
+                    if entry[0] != evicted
+                }
+            return key, resolved
+
+    @staticmethod
+    def _fragment_schema(
+        document: Dict[Any, Any],
+        base_uri: Optional[str],
+        fragment: Optional[str],
+        tokens: str,
+    ) -> Schema:
+        node: Any = document
+        for token in tokens.split("/") if tokens else ():
+            token = _unescape(token)
+            try:
+                node = node[int(token) if isinstance(node, list) else token]
+            except (KeyError, IndexError, ValueError, TypeError):
+                raise ValueError(
+                    f"Fragment '{fragment}' not found in the schema document."
+                ) from None
+        if tokens:
+            base_uri = f"{base_uri or DEFAULT_BASE_URI}#/{tokens}"
+        return Schema(data=node, base_uri=base_uri)
@@ -0,0 +1,443 @@
+"""One walk of a schema shared by the scenario and break enumerators.
+
+:func:`build_site_index` visits a schema once and records both the
+oneOf/anyOf sites :mod:`.scenario_enum` chooses branches at and the
+locations :mod:`.break_enum` can violate. The result is cached per
+``max_depth`` on the :class:`~.Schema` (see :meth:`.Schema.site_index`),
+so ``cartesian_scenarios``, ``minimal_scenarios``,
+``enumerate_break_scenarios``, ``check_break_scenario`` and friends only
+pay for the walk, and its ``allOf`` merges, the first time.
+
+The two kinds of sites are found with slightly different rules: variant
+sites are looked up in the merge of an ``allOf`` node even when it also
+has ``oneOf``/``anyOf``, while break sites are then taken from the node
+as written. At such nodes the walk forks; everywhere else a single
+visit serves both.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
+
+from jsonref import JsonRef
+
+from .helpers.allof_handler import AllOfCache
+from .models.break_models import BreakKind
+
+_KNOWN_FORMATS = {
+    "email",
+    "date-time",
+    "date",
+    "time",
+    "uri",
+    "url",
+    "uuid",
+    "hostname",
+    "ipv4",
+    "ipv6",
+}
+
+# (enclosing site index, variant indices under which a site is reachable)
+Enclosing = Tuple[int, FrozenSet[int]]
+
+
+@dataclass(frozen=True)
+class VariantSite:
+    """A location in a schema where a branch must be chosen.
+
+    Attributes:
+        path: Property path to the composite node (empty string at root).
+            Array items use ``[*]`` as the index placeholder.
+        kind: ``"oneOf"`` or ``"anyOf"``.
+        count: Number of variants at this site.
+        names: Best-effort human labels for each variant — the variant's
+            ``title``, else a discriminator-mapping key, else
+            ``f"variant_{i}"``.
+    """
+
+    path: str
+    kind: str
+    count: int
+    names: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class BreakSite:
+    """A location in a schema where a constraint can be violated.
+
+    Attributes:
+        path: Property path (empty string at root). Array items use
+            ``[*]`` as a placeholder, matching :class:`~.VariantSite`.
+        schema_fragment: The schema dict at this path.
+        applicable: Break kinds applicable at this site.
+        required_in_parent: Whether the property at this path is listed
+            in its parent's ``required`` array.
+        parent_additional_props_false: Whether the parent object has
+            ``additionalProperties: false``.
+    """
+
+    path: str
+    schema_fragment: dict
+    applicable: Tuple[BreakKind, ...]
+    required_in_parent: bool = False
+    parent_additional_props_false: bool = False
+
+
+@dataclass(frozen=True)
+class SiteIndex:
+    """Every variant and break site of a schema, from a single walk.
+
+    Attributes:
+        variant_sites: oneOf/anyOf sites, deduplicated by (path, kind),
+            in discovery order.
+        enclosing: Per variant site, the site and variants it is nested
+            under, or ``None`` when it is always reachable (top level,
+            or found under more than one enclosing site).
+        break_sites: Breakable locations, deduplicated by path, in
+            discovery order.
+        break_sites_by_path: ``break_sites`` grouped by path.
+    """
+
+    variant_sites: Tuple[VariantSite, ...]
+    enclosing: Tuple[Optional[Enclosing], ...]
+    break_sites: Tuple[BreakSite, ...]
+    break_sites_by_path: Dict[str, Tuple[BreakSite, ...]]
+
+
+def build_site_index(
+    data: Any, max_depth: int, cache: AllOfCache
+) -> SiteIndex:
+    """Walk *data* once and return its :class:`SiteIndex`.
+
+    Prefer :meth:`.Schema.site_index`, which caches the result.
+    """
+    walker = _Walker(max_depth, cache)
+    walker.walk(data, "", 0, True, True, False, False, None)
+    by_path: Dict[str, List[BreakSite]] = {}
+    for site in walker.break_sites:
+        by_path.setdefault(site.path, []).append(site)
+    return SiteIndex(
+        variant_sites=tuple(walker.variant_sites),
+        enclosing=tuple(
+            _freeze(walker.reach.get(idx))
+            for idx in range(len(walker.variant_sites))
+        ),
+        break_sites=tuple(walker.break_sites),
+        break_sites_by_path={
+            path: tuple(sites) for path, sites in by_path.items()
+        },
+    )
+
+
+# ---------------------------------------------------------------------------
+# Internals
+# ---------------------------------------------------------------------------
+
+
+def _unwrap(node: Any) -> Any:
+    if isinstance(node, JsonRef):
+        try:
+            return node.__subject__
+        except Exception:
+            return node
+    return node
+
+
+def _freeze(
+    enclosing: Optional[Tuple[int, Set[int]]],
+) -> Optional[Enclosing]:
+    if enclosing is None:
+        return None
+    return enclosing[0], frozenset(enclosing[1])
+
+
+class _Walker:
+    """Recursive walk collecting variant and break sites.
+
+    ``variants`` and ``breaks`` switch either collection off for a
+    subtree, which is how the walk forks at ``allOf`` nodes that also
+    have ``oneOf``/``anyOf``.
+    """
+
+    def __init__(self, max_depth: int, cache: AllOfCache) -> None:
+        self.max_depth = max_depth
+        self.cache = cache
+        self.variant_sites: List[VariantSite] = []
+        self.variant_seen: Dict[Tuple[str, str], int] = {}
+        self.reach: Dict[int, Optional[Tuple[int, Set[int]]]] = {}
+        self.break_sites: List[BreakSite] = []
+        self.break_seen: Set[str] = set()
+
+    def walk(
+        self,
+        node: Any,
+        path: str,
+        depth: int,
+        variants: bool,
+        breaks: bool,
+        required_in_parent: bool,
+        parent_additional_props_false: bool,
+        enclosing: Optional[Tuple[int, int]],
+    ) -> None:
+        if depth > self.max_depth:
+            return
+        node = _unwrap(node)
+        if not isinstance(node, dict):
+            return
+
+        if "allOf" in node:
+            composite = "oneOf" in node or "anyOf" in node
+            if variants or not composite:
+                try:
+                    merged = self.cache.merge(node)
+                except Exception:
+                    merged = node
+                self.walk(
+                    merged,
+                    path,
+                    depth + 1,
+                    variants,
+                    breaks and not composite,
+                    required_in_parent,
+                    parent_additional_props_false,
+                    enclosing,
+                )
+            if not (breaks and composite):
+                return
+            # Break sites come from the node as written.
+            variants = False
+
+        if breaks:
+            self._add_break_site(
+                node, path, required_in_parent, parent_additional_props_false
+            )
+
+        for kind in ("oneOf", "anyOf"):
+            options = node.get(kind)
+            if not isinstance(options, list):
+                continue
+            site_idx = None
+            if variants and options:
+                site_idx = self._add_variant_site(
+                    node, kind, options, path, enclosing
+                )
+            for i, option in enumerate(options):
+                self.walk(
+                    option,
+                    path,
+                    depth + 1,
+                    variants,
+                    breaks,
+                    required_in_parent,
+                    parent_additional_props_false,
+                    enclosing if site_idx is None else (site_idx, i),
+                )
+
+        props = node.get("properties")
+        required: List[str] = node.get("required") or []
+        add_props = node.get("additionalProperties")
+        add_props_false = add_props is False or (
+            isinstance(add_props, bool) and not add_props
+        )
+
+        if isinstance(props, dict):
+            for prop_name, prop_schema in props.items():
+                child_path = f"{path}.{prop_name}" if path else str(prop_name)
+                self.walk(
+                    prop_schema,
+                    child_path,
+                    depth + 1,
+                    variants,
+                    breaks,
+                    prop_name in required,
+                    add_props_false,
+                    enclosing,
+                )
+
+        # An ADDITIONAL_PROPERTY site for the parent object itself.
+        if (
+            breaks
+            and add_props_false
+            and isinstance(props, dict)
+            and path not in self.break_seen
+        ):
+            self.break_seen.add(path)
+            self.break_sites.append(
+                BreakSite(
+                    path=path,
+                    schema_fragment=dict(node),
+                    applicable=(BreakKind.ADDITIONAL_PROPERTY,),
+                    required_in_parent=required_in_parent,
+                    parent_additional_props_false=False,
+                )
+            )
+
+        items = node.get("items")
+        if isinstance(items, (dict, JsonRef)):
+            self.walk(
+                items,
+                f"{path}[*]",
+                depth + 1,
+                variants,
+                breaks,
+                False,
+                False,
+                enclosing,
+            )
+
+    def _add_variant_site(
+        self,
+        node: Dict[str, Any],
+        kind: str,
+        options: List[Any],
+        path: str,
+        enclosing: Optional[Tuple[int, int]],
+    ) -> int:
+        key = (path, kind)
+        site_idx = self.variant_seen.get(key)
+        if site_idx is None:
+            discriminator = node.get("discriminator") or {}
+            mapping = discriminator.get("mapping") or {}
+            site_idx = self.variant_seen[key] = len(self.variant_sites)
+            self.variant_sites.append(
+                VariantSite(
+                    path=path,
+                    kind=kind,
+                    count=len(options),
+                    names=tuple(
+                        _variant_label(v, i, mapping)
+                        for i, v in enumerate(options)
+                    ),
+                )
+            )
+        self._record_reach(site_idx, enclosing)
+        return site_idx
+
+    def _record_reach(
+        self, site_idx: int, enclosing: Optional[Tuple[int, int]]
+    ) -> None:
+        """Note that *site_idx* occurs under *enclosing* (site, variant).
+
+        A site seen outside any variant, under two different enclosing
+        sites, or under a later site (possible with deduplicated paths)
+        is treated as always reachable, which keeps the links acyclic.
+        """
+        reach = self.reach
+        if enclosing is not None and enclosing[0] == site_idx:
+            return  # a variant nesting its own site again
+        if enclosing is None or enclosing[0] > site_idx:
+            reach[site_idx] = None
+            return
+        if site_idx not in reach:
+            reach[site_idx] = (enclosing[0], {enclosing[1]})
+            return
+        current = reach[site_idx]
+        if current is None:
+            return
+        if current[0] == enclosing[0]:
+            current[1].add(enclosing[1])
+        else:
+            reach[site_idx] = None
+
+    def _add_break_site(
+        self,
+        node: Dict[str, Any],
+        path: str,
+        required_in_parent: bool,
+        parent_additional_props_false: bool,
+    ) -> None:
+        # Pure composite wrappers (only oneOf/anyOf/allOf) are skipped.
+        has_leaf_content = (
+            "type" in node
+            or "enum" in node
+            or "const" in node
+            or "pattern" in node
+            or "format" in node
+            or "properties" in node
+            or "items" in node
+        )
+        if not has_leaf_content or path in self.break_seen:
+            return
+        self.break_seen.add(path)
+        kinds = _applicable_kinds(
+            node, required_in_parent, parent_additional_props_false
+        )
+        if kinds:
+            self.break_sites.append(
+                BreakSite(
+                    path=path,
+                    schema_fragment=dict(node),
+                    applicable=kinds,
+                    required_in_parent=required_in_parent,
+                    parent_additional_props_false=parent_additional_props_false,
+                )
+            )
+
+
+def _variant_label(variant: Any, index: int, mapping: Dict[str, Any]) -> str:
+    variant = _unwrap(variant)
+    if isinstance(variant, dict):
+        title = variant.get("title")
+        if isinstance(title, str) and title:
+            return title
+        # Reverse-lookup discriminator mapping by ref tail, if we can.
+        for map_key, ref in mapping.items():
+            tail = str(ref).rsplit("/", 1)[-1]
+            if tail and variant.get("title") == tail:
+                return str(map_key)
+    return f"variant_{index}"
+
+
+def _applicable_kinds(
+    node: dict,
+    required_in_parent: bool,
+    parent_additional_props_false: bool,
+) -> Tuple[BreakKind, ...]:
+    kinds: List[BreakKind] = []
+
+    # Nullable check: skip NULL_VALUE if the schema already allows null.
+    type_val = node.get("type")
+    nullable = node.get("nullable", False)
+    if isinstance(type_val, list):
+        nullable = nullable or "null" in type_val
+
+    kinds.append(BreakKind.WRONG_TYPE)
+    if not nullable:
+        kinds.append(BreakKind.NULL_VALUE)
+
+    if "enum" in node:
+        kinds.append(BreakKind.ENUM_VIOLATION)
+    if "const" in node:
+        kinds.append(BreakKind.CONST_VIOLATION)
+    if "pattern" in node:
+        kinds.append(BreakKind.PATTERN_VIOLATION)
+
+    typ = type_val if isinstance(type_val, str) else None
+    if typ == "string":
+        if "minLength" in node:
+            kinds.append(BreakKind.MIN_LENGTH_VIOLATION)
+        if "maxLength" in node:
+            kinds.append(BreakKind.MAX_LENGTH_VIOLATION)
+        fmt = node.get("format")
+        if fmt in _KNOWN_FORMATS:
+            kinds.append(BreakKind.FORMAT_VIOLATION)
+    elif typ in ("integer", "number"):
+        has_min = "minimum" in node or "exclusiveMinimum" in node
+        has_max = "maximum" in node or "exclusiveMaximum" in node
+        if has_min:
+            kinds.append(BreakKind.MIN_VIOLATION)
+        if has_max:
+            kinds.append(BreakKind.MAX_VIOLATION)
+    elif typ == "array":
+        if "minItems" in node:
+            kinds.append(BreakKind.MIN_ITEMS_VIOLATION)
+        if "maxItems" in node:
+            kinds.append(BreakKind.MAX_ITEMS_VIOLATION)
+
+    if required_in_parent:
+        kinds.append(BreakKind.REMOVE_REQUIRED)
+    if parent_additional_props_false:
+        kinds.append(BreakKind.ADDITIONAL_PROPERTY)
+
+    return tuple(kinds)
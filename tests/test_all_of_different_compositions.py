@@ -1,6 +1,11 @@
 from __future__ import annotations
 
-from src.json_sample_generator import JSONSchemaGenerator
+from src.json_sample_generator import (
+    JSONSchemaGenerator,
+    collect_break_sites,
+    collect_variant_sites,
+)
+from src.json_sample_generator.helpers import allof_merge
 from src.json_sample_generator.models import Scenario, Schema
 
 shared_definitions = {
@@ -168,3 +173,56 @@ def test_embedded_allof() -> None:
     assert result == {
         "person": {"name": "Charlie", "age": 45, "address": "123 Main St"}
     }
+
+
+def test_allof_merged_once_per_schema() -> None:
+    calls = []
+
+    def counting_merge(node):
+        calls.append(node)
+        return allof_merge(node)
+
+    schema_data = {
+        "definitions": shared_definitions,
+        "type": "object",
+        "properties": {
+            "people": {
+                "type": "array",
+                "minItems": 3,
+                "maxItems": 3,
+                "items": {
+                    "allOf": [
+                        {"$ref": "#/definitions/Name"},
+                        {"$ref": "#/definitions/Age"},
+                    ]
+                },
+            },
+        },
+    }
+    gen = JSONSchemaGenerator(
+        schema=Schema(base_uri="file://dummy.json", data=schema_data),
+        allof_merger=counting_merge,
+    )
+    gen.generate_many(5)
+    assert len(calls) == 1, "allOf node should be merged exactly once"
+
+    gen.allof_cache.invalidate()
+    assert len(gen.allof_cache) == 0
+
+
+def test_allof_cache_shared_with_enumerators() -> None:
+    schema = Schema(
+        base_uri="file://dummy.json",
+        data={
+            "allOf": [
+                {"type": "object", "properties": {"a": {"type": "string"}}},
+                {"properties": {"b": {"type": "integer"}}},
+            ]
+        },
+    )
+    collect_break_sites(schema)
+    merged = schema.allof_cache.merge(schema.data)
+    collect_variant_sites(schema)
+    assert len(schema.allof_cache) == 1
+    assert schema.allof_cache.merge(schema.data) is merged
+    assert set(merged["properties"]) == {"a", "b"}
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import pytest
+
+# The runner benchmarks the installed package, imported as
+# ``json_sample_generator`` rather than through ``src``.
+pytest.importorskip("json_sample_generator")
+
+from benchmarks.runner import CASES, compare, run
+
+
+def test_quick_run_reports_every_phase() -> None:
+    case = next(c for c in CASES if c.name == "deep_nesting")
+    report = run([case], quick=True, repeat=1)
+
+    phases = report["cases"]["deep_nesting"]
+    assert list(phases)[:2] == ["setup", "generate"]
+    for name, m in phases.items():
+        if "skipped" in m:
+            continue
+        assert m["seconds"] >= 0, name
+        assert "peak_kib" in m, f"{name} should record peak memory"
+    assert phases["generate"]["ops"] == case.samples // 10
+
+
+def test_compare_flags_slow_phases() -> None:
+    baseline = {
+        "cases": {
+            "c": {
+                "fast": {"seconds": 1.0},
+                "slow": {"seconds": 1.0},
+                "tiny": {"seconds": 1e-5},
+            }
+        }
+    }
+    report = {
+        "cases": {
+            "c": {
+                "fast": {"seconds": 1.1},
+                "slow": {"seconds": 2.0},
+                "tiny": {"seconds": 1e-4},
+                "new": {"seconds": 1.0},
+            }
+        }
+    }
+
+    rows = {row["phase"]: row for row in compare(report, baseline, 0.25)}
+
+    assert "new" not in rows, "phases missing a baseline are skipped"
+    assert not rows["fast"]["regression"]
+    assert rows["slow"]["regression"]
+    assert not rows["tiny"]["regression"], "timer noise is not a regression"
@@ -20,6 +20,7 @@ from json_sample_generator import (
     BreakRule,
     BreakScenario,
     BreakScenarioReport,
+    BreakValidator,
     JSONSchemaGenerator,
     RuleCheck,
     SampleBreaker,
@@ -302,6 +303,85 @@ def test_original_sample_unchanged():
     assert _FULL_SAMPLE == original
 
 
+def test_apply_shares_untouched_subtrees():
+    breaker = SampleBreaker(_schema(_FULL_SCHEMA))
+    scenario = BreakScenario(
+        name="t",
+        rules=[BreakRule(path="tags", kind=BreakKind.MIN_ITEMS_VIOLATION)],
+    )
+    broken = breaker.apply(_FULL_SAMPLE, scenario)
+    assert broken["tags"] == []
+    assert _FULL_SAMPLE["tags"] == ["a", "b"]
+    assert broken["address"] is _FULL_SAMPLE["address"]
+    unchanged = breaker.apply(_FULL_SAMPLE, BreakScenario(name="n", rules=[]))
+    assert unchanged == _FULL_SAMPLE and unchanged is not _FULL_SAMPLE
+
+
+def test_root_break_replaces_sample():
+    breaker = SampleBreaker(_schema(_FULL_SCHEMA))
+    scenario = BreakScenario(
+        name="t", rules=[BreakRule(path="", kind=BreakKind.NULL_VALUE)]
+    )
+    broken = breaker.apply(_FULL_SAMPLE, scenario)
+    assert broken is None
+    report = validate_breaks(_schema(_FULL_SCHEMA), broken, scenario)
+    assert report[0].matched
+
+
+# ---------------------------------------------------------------------------
+# SampleBreaker.apply_many
+# ---------------------------------------------------------------------------
+
+
+def test_apply_many_matches_apply():
+    import copy
+
+    original = copy.deepcopy(_FULL_SAMPLE)
+    schema = _schema(_FULL_SCHEMA)
+    breaker = SampleBreaker(schema)
+    # WRONG_TYPE draws a random replacement, so it is left out here;
+    # apply() needs concrete paths, so are root and ``[*]`` sites.
+    scenarios = [
+        sc
+        for sc in enumerate_break_scenarios(schema)
+        if sc.rules[0].path
+        and "[*]" not in sc.rules[0].path
+        and sc.rules[0].kind != BreakKind.WRONG_TYPE
+    ]
+    scenarios.append(
+        merge_break_scenarios(*scenarios[:4], name="multi"),
+    )
+    expected = [breaker.apply(_FULL_SAMPLE, sc) for sc in scenarios]
+    assert breaker.apply_many(_FULL_SAMPLE, scenarios) == expected
+    assert _FULL_SAMPLE == original
+
+
+def test_apply_many_shares_untouched_subtrees():
+    breaker = SampleBreaker(_schema(_FULL_SCHEMA))
+    scenarios = [
+        BreakScenario(
+            name="street",
+            rules=[
+                BreakRule(path="address.street", kind=BreakKind.NULL_VALUE)
+            ],
+        ),
+        BreakScenario(
+            name="extra",
+            rules=[
+                BreakRule(path="address", kind=BreakKind.ADDITIONAL_PROPERTY)
+            ],
+        ),
+    ]
+    street, extra = breaker.apply_many(_FULL_SAMPLE, scenarios)
+    assert street["address"] == {"street": None}
+    assert "__break_extra__" in extra["address"]
+    assert _FULL_SAMPLE["address"] == {"street": "Main St"}
+    assert street["tags"] is _FULL_SAMPLE["tags"]
+    assert extra["tags"] is _FULL_SAMPLE["tags"]
+    _validate_fails(_FULL_SCHEMA, street)
+    _validate_fails(_FULL_SCHEMA, extra)
+
+
 # ---------------------------------------------------------------------------
 # collect_break_sites
 # ---------------------------------------------------------------------------
@@ -506,6 +586,88 @@ def test_validate_breaks_unmatched_noop():
     assert not failures[0].matched
 
 
+def test_break_validator_reused_across_samples():
+    from concurrent.futures import ThreadPoolExecutor
+
+    schema = _schema(_FULL_SCHEMA)
+    scenarios = [
+        sc
+        for sc in enumerate_break_scenarios(schema)
+        if "[*]" not in sc.rules[0].path
+    ]
+    broken = SampleBreaker(schema).apply_many(_FULL_SAMPLE, scenarios)
+    validator = BreakValidator(schema)
+
+    def summary(failures):
+        return [
+            (f.rule.path, [e.message for e in f.matched_errors])
+            for f in failures
+        ]
+
+    expected = [
+        summary(validate_breaks(schema, b, sc))
+        for b, sc in zip(broken, scenarios)
+    ]
+    assert [
+        summary(f) for f in validator.validate_many(broken, scenarios)
+    ] == expected
+
+    # One validator shared between threads gives the same answers.
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        threaded = list(pool.map(validator.validate, broken, scenarios))
+    assert [summary(f) for f in threaded] == expected
+
+    with pytest.raises(ValueError):
+        validator.validate_many(broken[:1], scenarios)
+
+
+def test_validate_breaks_matches_errors_by_path():
+    schema = _schema(
+        {
+            "type": "object",
+            "required": ["rows", "total"],
+            "properties": {
+                "rows": {
+                    "type": "array",
+                    "maxItems": 2,
+                    "items": {
+                        "type": "object",
+                        "properties": {"v": {"type": "integer"}},
+                    },
+                },
+                "rowsum": {"type": "integer"},
+                "total": {"type": "integer"},
+            },
+        }
+    )
+    broken = {"rows": [{"v": "x"}, {"v": 1}, {"v": "y"}], "rowsum": "z"}
+    scenario = BreakScenario(
+        name="paths",
+        rules=[
+            BreakRule(path="rows[0].v", kind=BreakKind.WRONG_TYPE),
+            BreakRule(path="rows", kind=BreakKind.MAX_ITEMS_VIOLATION),
+            BreakRule(path="rows[1]", kind=BreakKind.WRONG_TYPE),
+            BreakRule(path="total", kind=BreakKind.REMOVE_REQUIRED),
+        ],
+    )
+    failures = validate_breaks(schema, broken, scenario)
+
+    def paths(failure):
+        return [list(e.absolute_path) for e in failure.matched_errors]
+
+    # The error on the array itself is an ancestor of rows[0].v
+    assert paths(failures[0]) == [["rows"], ["rows", 0, "v"]]
+    # Descendants keep the validator's order; "rowsum" is not below "rows"
+    assert paths(failures[1]) == [
+        ["rows"],
+        ["rows", 0, "v"],
+        ["rows", 2, "v"],
+    ]
+    assert paths(failures[2]) == [["rows"]]
+    # Errors without a path are matched on their message
+    assert [e.validator for e in failures[3].matched_errors] == ["required"]
+
+
 # ---------------------------------------------------------------------------
 # End-to-end
 # ---------------------------------------------------------------------------
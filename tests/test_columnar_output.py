@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import array
+
+import pytest
+
+from src.json_sample_generator import JSONSchemaGenerator
+from src.json_sample_generator.columnar import pivot_rows
+from src.json_sample_generator.models import Scenario, Schema
+
+_FLAT = Schema(
+    data={
+        "type": "object",
+        "properties": {
+            "ts": {"type": "integer", "minimum": 10, "maximum": 20},
+            "value": {"type": "number", "minimum": -1, "maximum": 1},
+            "level": {"enum": ["low", "high"]},
+            "device": {
+                "type": "object",
+                "properties": {"name": {"type": "string"}},
+            },
+        },
+    }
+)
+
+
+def test_generate_columns_matches_vectorized_rows() -> None:
+    gen = JSONSchemaGenerator(_FLAT)
+    columns = gen.generate_columns(5000, seed=4)
+    rows = gen.generate_many(5000, seed=4, vectorized=True)
+
+    assert list(columns) == ["ts", "value", "level", "device.name"]
+    assert all(len(col) == 5000 for col in columns.values())
+    assert columns == pivot_rows(rows), "columns should pivot the rows"
+
+
+def test_generate_columns_typed_packs_numeric_columns() -> None:
+    columns = JSONSchemaGenerator(_FLAT).generate_columns(10, typed=True)
+
+    assert isinstance(columns["ts"], array.array)
+    assert columns["ts"].typecode == "q"
+    assert columns["value"].typecode == "d"
+    assert isinstance(columns["level"], list), "strings stay in lists"
+
+
+def test_generate_columns_pivots_when_not_flat() -> None:
+    schema = Schema(
+        data={
+            "type": "object",
+            "properties": {
+                "id": {"type": "integer"},
+                "tags": {"type": "array", "items": {"type": "string"}},
+            },
+        }
+    )
+    scenario = Scenario(name="pin", overrides={"id": 7})
+    columns = JSONSchemaGenerator(schema).generate_columns(3, scenario, seed=5)
+
+    assert columns["id"] == [7, 7, 7]
+    # empty arrays are left out of samples, so their cell is None
+    assert all(
+        cell is None or isinstance(cell, list) for cell in columns["tags"]
+    )
+
+
+def test_pivot_rows_fills_missing_paths() -> None:
+    rows = [{"a": 1, "b": {"c": 2}}, {"a": 3}, {"d": 4}]
+
+    assert pivot_rows(rows) == {
+        "a": [1, 3, None],
+        "b.c": [2, None, None],
+        "d": [None, None, 4],
+    }
+
+
+def test_generate_table_builds_arrow_table() -> None:
+    pytest.importorskip("pyarrow")
+    table = JSONSchemaGenerator(_FLAT).generate_table(100, seed=1)
+
+    assert table.num_rows == 100
+    assert table.column_names == ["ts", "value", "level", "device.name"]
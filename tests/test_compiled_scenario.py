@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from src.json_sample_generator.compiled_scenario import CompiledScenario
+from src.json_sample_generator.models import Scenario
+
+
+def test_first_listed_pattern_override_wins() -> None:
+    scenario = Scenario(
+        name="patterns",
+        overrides={"address.city": "exact"},
+        pattern_overrides=[
+            *[(f"unused{i}", i) for i in range(200)],
+            ("ss.ci", "inner"),
+            ("address.", "outer"),
+            ("city", "late"),
+        ],
+    ).normalize()
+    compiled = CompiledScenario(scenario)
+
+    assert compiled.override_for("address.city")(None) == "exact"
+    assert compiled.override_for("address.city2")(None) == "inner"
+    assert compiled.override_for("address.zip")(None) == "outer"
+    assert compiled.override_for("home.city")(None) == "late"
+    assert compiled.override_for("unused") is None
+    assert compiled.override_for("x.unused17.y")(None) == 1, "unused1 first"
+
+
+def test_selector_regexes_keep_insertion_order() -> None:
+    first = lambda ctx, schemas: 0  # noqa: E731
+    second = lambda ctx, schemas: 1  # noqa: E731
+    backref = lambda ctx, schemas: 2  # noqa: E731
+    scenario = Scenario(
+        name="selectors",
+        oneof_selectors={
+            r"items\[\d+\]\.(pet|animal)": first,
+            r"items\[\d+\]\..*": second,
+            r"(x)\1": backref,
+        },
+    )
+    compiled = CompiledScenario(scenario)
+
+    assert compiled.selector_for("items[3].pet") is first
+    assert compiled.selector_for("items[3].owner") is second
+    assert compiled.selector_for("items") is None
+    assert compiled.selector_for("xx") is backref, "fallback scan"
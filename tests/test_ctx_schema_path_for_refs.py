@@ -113,3 +113,34 @@ def test_ctx_schema_path_set_for_refs() -> None:
             ), f"schema_path for {path} should point to Address, got {sp}"
         else:
             raise AssertionError(f"Unexpected path captured: {path}")
+
+
+def test_override_on_ref_property_sees_target_schema() -> None:
+    schema = Schema(
+        base_uri="file://dummy.json",
+        data={
+            "type": "object",
+            "$defs": {
+                "A": {
+                    "type": "object",
+                    "properties": {"x": {"type": "string"}},
+                }
+            },
+            "properties": {"a": {"$ref": "#/$defs/A"}},
+        },
+    )
+    seen = []
+
+    def capture(ctx):
+        seen.append(ctx)
+        return {"x": "fixed"}
+
+    scenario = Scenario(name="ref_override", overrides={"a": capture})
+    sample = JSONSchemaGenerator(schema, scenario).generate()
+
+    assert sample == {"a": {"x": "fixed"}}
+    (ctx,) = seen
+    assert type(ctx.schema_data) is dict
+    assert list(ctx.schema_data) == ["type", "properties"]
+    assert ctx.parent_schema == ctx.schema_data
+    assert ctx.schema_path.endswith("#/$defs/A")
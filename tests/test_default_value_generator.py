@@ -152,3 +152,111 @@ def test_number_non_numeric_bounds_fallback():
     samples = sample_many(g)
     assert all(isinstance(x, (int, float)) for x in samples)
     assert len(set(samples)) > 1
+
+
+def test_factories_cached_by_constraints():
+    dvg = DefaultValueGenerator()
+    first = dvg({"type": "integer", "minimum": 1, "maximum": 3})
+    same = dvg({"type": "integer", "minimum": 1, "maximum": 3, "title": "x"})
+    other = dvg({"type": "integer", "minimum": 1, "maximum": 4})
+    assert first is same
+    assert first is not other
+    assert dvg({"type": "string", "maxLength": 5}) is not dvg(
+        {"type": "string", "maxLength": 5.0}
+    ), "bound types are part of the key"
+
+
+def test_only_the_schema_type_generator_is_built():
+    # An integer-only bound that overflows must not break string leaves.
+    g = DefaultValueGenerator()({"type": "string", "minimum": "inf"})
+    assert isinstance(g(), str)
+
+
+def test_pattern_strings_match_and_honor_length():
+    import re
+
+    g = DefaultValueGenerator()(
+        {"type": "string", "pattern": "^[a-z][a-z0-9_]*$", "maxLength": 8}
+    )
+    samples = sample_many(g)
+    assert all(re.fullmatch("[a-z][a-z0-9_]*", s) for s in samples)
+    assert all(len(s) <= 8 for s in samples)
+
+    g = DefaultValueGenerator()(
+        {"type": "string", "pattern": "^x+$", "minLength": 30}
+    )
+    assert all(len(s) >= 30 for s in sample_many(g, n=50))
+
+
+def test_pattern_with_backreference_falls_back_to_rstr():
+    g = DefaultValueGenerator()({"type": "string", "pattern": r"^(ab)\1$"})
+    assert g() == "abab"
+
+
+def test_value_pool_reuses_reservoir_values():
+    import random
+
+    from json_sample_generator.helpers.random_source import use_random
+    from json_sample_generator.helpers.value_pool import ValuePool
+
+    calls = []
+    pool = ValuePool(size=5, refresh=0.0)
+    factory = pool.wrap("word", lambda: calls.append(1) or len(calls))
+    with use_random(random.Random(1)):
+        values = [factory() for _ in range(100)]
+
+    assert len(calls) == 5, "only the reservoir should call the factory"
+    assert set(values) == {1, 2, 3, 4, 5}
+
+    assert pool.wrap("uuid", factory) is factory, "uuid is never pooled"
+
+
+def test_pooled_generator_is_reproducible_per_seed():
+    import random
+
+    from json_sample_generator.helpers.random_source import use_random
+    from json_sample_generator.helpers.value_pool import ValuePool
+
+    g = DefaultValueGenerator(pool=ValuePool(size=8))({"type": "string"})
+
+    def run():
+        with use_random(random.Random(3)):
+            return [g() for _ in range(50)]
+
+    first = run()
+    assert first == run(), "each seeded run starts from empty reservoirs"
+    assert len(set(first)) <= 8 + 50 // 10
+
+
+def test_value_pool_reservoirs_outlive_generate_calls():
+    from json_sample_generator import JSONSchemaGenerator
+    from json_sample_generator.helpers.value_pool import ValuePool
+    from json_sample_generator.models import Schema
+
+    schema = Schema(
+        data={
+            "type": "object",
+            "required": ["email"],
+            "properties": {"email": {"type": "string", "format": "email"}},
+        }
+    )
+
+    def generator(seed=None):
+        pool = ValuePool(size=4, refresh=0.0)
+        return JSONSchemaGenerator(
+            schema,
+            default_value_generator=DefaultValueGenerator(pool=pool),
+            seed=seed,
+        )
+
+    gen = generator()
+    emails = {gen.generate()["email"] for _ in range(200)}
+    assert len(emails) <= 4, "single calls should share one reservoir"
+
+    # Reuse never changes what a seed produces.
+    expected = generator().generate(seed=5)
+    assert gen.generate(seed=5) == expected
+    assert gen.generate(seed=5) == expected
+    a, b = generator(seed=11), generator(seed=11)
+    b.generate_many(50, seed=11)  # fills the reservoir of b's stream
+    assert [a.generate() for _ in range(5)] == [b.generate() for _ in range(5)]
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import types
+
+from src.json_sample_generator import JSONSchemaGenerator
+from src.json_sample_generator.models import Scenario, Schema
+
+_SCHEMA = Schema(
+    data={
+        "type": "object",
+        "properties": {
+            "id": {"type": "string", "format": "uuid"},
+            "name": {"type": "string"},
+            "age": {"type": "integer", "minimum": 0, "maximum": 120},
+            "tags": {"type": "array", "items": {"type": "string"}},
+            "pet": {
+                "oneOf": [
+                    {"type": "string", "const": "dog"},
+                    {"type": "string", "const": "cat"},
+                ]
+            },
+            "address": {
+                "type": "object",
+                "properties": {"city": {"type": "string"}},
+            },
+        },
+    }
+)
+
+
+def test_generate_many_returns_count_samples() -> None:
+    results = JSONSchemaGenerator(_SCHEMA).generate_many(25)
+
+    assert isinstance(results, list)
+    assert len(results) == 25, "should return one sample per requested count"
+    assert all(isinstance(r, dict) for r in results)
+
+
+def test_generate_many_applies_scenario_to_every_sample() -> None:
+    scenario = Scenario(
+        name="fixed",
+        overrides={"name": "Alice"},
+        oneof_selectors={"pet": 1},
+    )
+
+    results = JSONSchemaGenerator(_SCHEMA).generate_many(10, scenario)
+
+    assert all(r["name"] == "Alice" for r in results)
+    assert all(r["pet"] == "cat" for r in results)
+
+
+def test_generate_many_seed_is_reproducible() -> None:
+    gen = JSONSchemaGenerator(_SCHEMA)
+
+    first = gen.generate_many(20, seed=1234)
+    second = gen.generate_many(20, seed=1234)
+    other = gen.generate_many(20, seed=4321)
+
+    assert first == second, "same seed should yield the same batch"
+    assert first != other, "different seeds should yield different batches"
+
+
+def test_generate_many_default_data_not_shared_between_samples() -> None:
+    scenario = Scenario(
+        name="defaults", default_data={"address": {"city": "Dublin"}}
+    )
+
+    first, second = JSONSchemaGenerator(_SCHEMA).generate_many(2, scenario)
+    first["address"]["city"] = "Cork"
+
+    assert second["address"]["city"] == "Dublin"
+    assert scenario.default_data == {"address": {"city": "Dublin"}}
+
+
+def test_iter_generate_is_lazy() -> None:
+    calls = []
+
+    def record(ctx):
+        calls.append(ctx.prop_path)
+        return "x"
+
+    scenario = Scenario(name="lazy", overrides={"name": record})
+    it = JSONSchemaGenerator(_SCHEMA).iter_generate(3, scenario)
+
+    assert isinstance(it, types.GeneratorType)
+    assert calls == [], "nothing should be generated before iteration"
+    next(it)
+    assert calls == ["name"]
+    assert len(list(it)) == 2
+
+
+_FLAT = Schema(
+    data={
+        "type": "object",
+        "required": ["ts"],
+        "properties": {
+            "ts": {"type": "integer", "minimum": 10, "maximum": 20},
+            "value": {"type": "number", "minimum": -1, "maximum": 1},
+            "ok": {"type": "boolean"},
+            "level": {"enum": ["low", "high"]},
+            "device": {
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string"},
+                    "empty": {"type": "object", "properties": {}},
+                },
+            },
+        },
+    }
+)
+
+
+def test_vectorized_matches_per_sample_shape() -> None:
+    gen = JSONSchemaGenerator(_FLAT)
+    plain = gen.generate_many(50, seed=1)
+    vectorized = gen.generate_many(200, seed=1, vectorized=True)
+
+    assert [list(r) for r in vectorized[:50]] == [list(r) for r in plain]
+    assert all(list(r["device"]) == ["name"] for r in vectorized)
+    assert all(10 <= r["ts"] <= 20 for r in vectorized)
+    assert all(-1 <= r["value"] <= 1 for r in vectorized)
+    assert {r["level"] for r in vectorized} == {"low", "high"}
+    assert {r["ok"] for r in vectorized} == {True, False}
+    assert vectorized == gen.generate_many(200, seed=1, vectorized=True)
+
+
+def test_vectorized_falls_back_for_overrides_and_arrays() -> None:
+    scenario = Scenario(name="pin", pattern_overrides=[("ts", 15)])
+    results = JSONSchemaGenerator(_FLAT).generate_many(
+        20, scenario, seed=2, vectorized=True
+    )
+    assert all(r["ts"] == 15 for r in results)
+
+    mixed = JSONSchemaGenerator(_SCHEMA).generate_many(
+        5, seed=3, vectorized=True
+    )
+    assert mixed == JSONSchemaGenerator(_SCHEMA).generate_many(5, seed=3)
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from src.json_sample_generator import GenerationStats, JSONSchemaGenerator
+from src.json_sample_generator.models import Context, Scenario, Schema
+
+_SCHEMA = Schema(
+    data={
+        "type": "object",
+        "properties": {
+            "id": {"type": "integer"},
+            "label": {"type": "string"},
+            "items": {
+                "type": "array",
+                "minItems": 2,
+                "maxItems": 2,
+                "items": {
+                    "allOf": [
+                        {
+                            "type": "object",
+                            "properties": {"x": {"type": "integer"}},
+                        },
+                        {"properties": {"y": {"type": "string"}}},
+                    ]
+                },
+            },
+            "pet": {"oneOf": [{"type": "string"}, {"type": "integer"}]},
+        },
+    }
+)
+
+
+def _label(ctx: Context) -> str:
+    # "total" is never generated, so the override stays pending.
+    return f"item-{ctx.data['total']}"
+
+
+def test_stats_record_paths_and_categories() -> None:
+    stats = GenerationStats()
+    scenario = Scenario(name="s", overrides={"id": 1})
+    gen = JSONSchemaGenerator(_SCHEMA, scenario, stats=stats)
+    gen.generate_many(10, seed=1)
+
+    assert stats.samples == 10
+    assert stats.node_counts["items[*]"] == 20, "indices fold into [*]"
+    assert stats.node_counts["items[*].x"] == 20
+    assert stats.category_counts["override"] == 10
+    assert stats.category_counts["variant"] == 10
+    assert stats.category_counts["allof_merge"] == 1, "merged once"
+    assert stats.category_counts["default_value"] >= 10 * 3
+    assert stats.node_seconds[""] >= stats.node_seconds["items"]
+
+    summary = stats.summary()
+    assert "hottest paths" in summary and "items[*]" in summary
+
+
+def test_stats_count_unresolved_pending_fields() -> None:
+    stats = GenerationStats()
+    scenario = Scenario(name="s", overrides={"label": _label})
+    JSONSchemaGenerator(_SCHEMA, scenario, stats=stats).generate_many(3)
+
+    assert stats.pending_deferred == 3
+    assert stats.pending_retry_rounds == 3 * 5
+    assert stats.pending_unresolved == 3
+    assert stats.as_dict()["pending"]["resolved"] == 0
+
+
+def test_generator_without_stats_is_not_instrumented() -> None:
+    gen = JSONSchemaGenerator(_SCHEMA)
+    assert gen.stats is None
+    assert "_generate_node" not in vars(gen)
@@ -1,7 +1,8 @@
 import pytest
 
 from src.json_sample_generator import JSONSchemaGenerator
-from src.json_sample_generator.models import Schema
+from src.json_sample_generator.generation_plan import ObjectPlan
+from src.json_sample_generator.models import Scenario, Schema
 
 
 def test_fragment_resolution():
@@ -290,3 +291,66 @@ def test_generator_max_items_respects_smaller_schema_maxitems():
     assert "items" in result
     assert isinstance(result["items"], list)
     assert 1 <= len(result["items"]) <= 3
+
+
+def test_compile_returns_memoized_plan():
+    schema_data = {
+        "type": "object",
+        "properties": {
+            "name": {"type": "string"},
+            "tags": {"type": "array", "items": {"type": "string"}},
+        },
+    }
+    generator = JSONSchemaGenerator(Schema(data=schema_data))
+
+    plan = generator.compile()
+
+    assert isinstance(plan, ObjectPlan)
+    assert [p.name for p in plan.properties] == ["name", "tags"]
+    assert generator.compile() is plan, "root plan should be memoized"
+
+
+def test_compiled_leaf_factory_bound_once():
+    calls = []
+
+    def counting_generator(schema):
+        calls.append(schema)
+        return lambda: "x"
+
+    schema_data = {
+        "type": "object",
+        "properties": {
+            "a": {"type": "string"},
+            "b": {"type": "string"},
+        },
+    }
+    generator = JSONSchemaGenerator(
+        Schema(data=schema_data), default_value_generator=counting_generator
+    )
+
+    results = [generator.generate() for _ in range(10)]
+
+    assert all(r == {"a": "x", "b": "x"} for r in results)
+    assert len(calls) == 2, "each leaf factory should be built once"
+
+
+def test_compile_skips_unreached_variants():
+    schema_data = {
+        "type": "object",
+        "properties": {
+            "pick": {
+                "oneOf": [
+                    {"type": "string"},
+                    # Would fail in DefaultValueGenerator if ever compiled.
+                    {"description": "no type"},
+                ]
+            }
+        },
+    }
+    generator = JSONSchemaGenerator(Schema(data=schema_data))
+
+    result = generator.generate(
+        Scenario(name="first", oneof_selectors={"pick": 0})
+    )
+
+    assert isinstance(result["pick"], str)
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from collections import Counter
+
+import pytest
+
+from src.json_sample_generator import GenerationStats, JSONSchemaGenerator
+from src.json_sample_generator.models import Scenario, Schema, depends_on
+
+# Properties are generated in this order, so every derived field comes
+# before the field it is derived from.
+_SCHEMA = Schema(
+    data={
+        "type": "object",
+        "properties": {
+            "label": {"type": "string"},
+            "display": {"type": "string"},
+            "full": {"type": "string"},
+            "first": {"type": "string"},
+            "last": {"type": "string"},
+            "address": {
+                "type": "object",
+                "properties": {"city": {"type": "string"}},
+            },
+        },
+    }
+)
+
+
+def _chain(calls: Counter) -> Scenario:
+    @depends_on("first", "last")
+    def full(ctx):
+        calls["full"] += 1
+        return f"{ctx.data['first']} {ctx.data['last']}"
+
+    @depends_on("full")
+    def display(ctx):
+        calls["display"] += 1
+        return ctx.data["full"].upper()
+
+    @depends_on("display", "address")
+    def label(ctx):
+        calls["label"] += 1
+        return f"{ctx.data['display']} ({ctx.data['address']['city']})"
+
+    return Scenario(
+        name="chain",
+        overrides={
+            "label": label,
+            "display": display,
+            "full": full,
+            "first": "Ada",
+            "last": "Lovelace",
+            "address.city": "London",
+        },
+    )
+
+
+def test_dependent_overrides_run_once_in_dependency_order() -> None:
+    calls: Counter = Counter()
+    stats = GenerationStats()
+    gen = JSONSchemaGenerator(_SCHEMA, stats=stats)
+    results = gen.generate_many(5, _chain(calls))
+
+    assert all(r["label"] == "ADA LOVELACE (London)" for r in results)
+    assert calls == {"full": 5, "display": 5, "label": 5}, "no retries"
+    assert stats.pending_deferred == 0
+
+
+def test_undeclared_dependency_falls_back_to_retries() -> None:
+    def display(ctx):
+        return ctx.data["full"].upper()  # raises KeyError on first pass
+
+    @depends_on("display")
+    def label(ctx):
+        return f"<{ctx.data['display']}>"
+
+    scenario = Scenario(
+        name="mixed",
+        overrides={
+            "label": label,
+            "display": display,
+            "full": "x y",
+        },
+    )
+    result = JSONSchemaGenerator(_SCHEMA).generate(scenario)
+
+    assert result["display"] == "X Y"
+    assert result["label"] == "<X Y>"
+
+
+def test_dependency_cycle_is_rejected() -> None:
+    scenario = Scenario(
+        name="cycle",
+        overrides={
+            "first": depends_on("last")(lambda ctx: ctx.data["last"]),
+            "last": depends_on("first")(lambda ctx: ctx.data["first"]),
+        },
+    )
+    with pytest.raises(ValueError, match="cycle"):
+        JSONSchemaGenerator(_SCHEMA).generate(scenario)
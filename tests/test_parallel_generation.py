@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import concurrent.futures
 
-from src.json_sample_generator import JSONSchemaGenerator
+import pytest
+
+from src.json_sample_generator import JSONSchemaGenerator, ParallelGenerator
 from src.json_sample_generator.models import Scenario, Schema
 
 
@@ -123,3 +125,53 @@ def test_sequential_vs_parallel():
     # Both should have the same content
     for result in sequential_results + parallel_results:
         assert result == {"id": "test-id", "value": 42}
+
+
+_PROCESS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "id": {"type": "string", "format": "uuid"},
+        "name": {"type": "string"},
+        "age": {"type": "integer", "minimum": 0, "maximum": 120},
+        "pet": {
+            "oneOf": [
+                {"type": "string", "const": "dog"},
+                {"type": "string", "const": "cat"},
+            ]
+        },
+    },
+}
+
+
+def test_process_pool_generation_is_deterministic():
+    schema = Schema(data=_PROCESS_SCHEMA)
+
+    with ParallelGenerator(schema, workers=2, chunk_size=7) as gen:
+        first = gen.generate_many(40, seed=99)
+        second = gen.generate_many(40, seed=99)
+    with ParallelGenerator(schema, workers=3, chunk_size=7) as gen:
+        third = gen.generate_many(40, seed=99)
+
+    assert len(first) == 40
+    assert first == second, "same seed should reproduce the same samples"
+    assert first == third, "worker count should not change the output"
+    assert len({r["id"] for r in first}) == 40, "chunks should not repeat"
+
+
+def test_process_pool_applies_scenario():
+    scenario = Scenario(
+        name="fixed", overrides={"name": "Alice"}, oneof_selectors={"pet": 0}
+    )
+
+    with ParallelGenerator(Schema(data=_PROCESS_SCHEMA), workers=2) as gen:
+        results = gen.generate_many(10, scenario, seed=1)
+
+    assert all(r["name"] == "Alice" and r["pet"] == "dog" for r in results)
+
+
+def test_process_pool_rejects_unpicklable_scenario():
+    scenario = Scenario(name="local", overrides={"name": lambda ctx: "x"})
+
+    with ParallelGenerator(Schema(data=_PROCESS_SCHEMA), workers=1) as gen:
+        with pytest.raises(TypeError, match="cannot be sent"):
+            gen.generate_many(1, scenario)
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import itertools
+
 import pytest
 
 from src.json_sample_generator import (
     JSONSchemaGenerator,
     cartesian_scenarios,
     collect_variant_sites,
+    iter_cartesian_scenarios,
     minimal_scenarios,
+    pairwise_scenarios,
 )
 from src.json_sample_generator.models import Scenario, Schema
 from src.json_sample_generator.scenario_enum import VariantSite
@@ -226,6 +230,65 @@ def test_cartesian_base_overrides_survive():
     assert all("name" in s.overrides for s in scenarios)
 
 
+# ---------------------------------------------------------------------------
+# iter_cartesian_scenarios
+# ---------------------------------------------------------------------------
+
+
+def _three_sites() -> Schema:
+    return _make_schema(
+        a=_const_oneof("1", "2", "3"),
+        b=_const_oneof("x", "y"),
+        c=_const_oneof("p", "q", "r", "s"),
+    )
+
+
+def test_iter_cartesian_matches_list():
+    schema = _three_sites()
+    eager = cartesian_scenarios(schema)
+    lazy = list(iter_cartesian_scenarios(schema))
+    assert [s.name for s in lazy] == [s.name for s in eager]
+    assert [s.description for s in lazy] == [s.description for s in eager]
+
+
+def test_iter_cartesian_shards_partition_the_product():
+    schema = _three_sites()
+    names = [s.name for s in cartesian_scenarios(schema)]
+    shards = [
+        [
+            s.name
+            for s in iter_cartesian_scenarios(schema, shard=k, num_shards=5)
+        ]
+        for k in range(5)
+    ]
+    assert sorted(n for shard in shards for n in shard) == sorted(names)
+    assert shards[2] == names[2::5]
+
+
+def test_iter_cartesian_resumes_from_index():
+    schema = _three_sites()
+    names = [s.name for s in cartesian_scenarios(schema)]
+    resumed = iter_cartesian_scenarios(schema, start=17, stop=21)
+    assert [s.name for s in resumed] == names[17:21]
+    sharded = iter_cartesian_scenarios(schema, start=7, shard=1, num_shards=3)
+    assert [s.name for s in sharded] == names[7:][::3]
+
+
+def test_iter_cartesian_has_no_cap():
+    schema = _make_schema(
+        **{f"s{i}": _const_oneof(*"abcdefghij") for i in range(6)}
+    )
+    with pytest.raises(ValueError):
+        cartesian_scenarios(schema)
+    last = next(iter_cartesian_scenarios(schema, start=999_999))
+    assert last.name == "cartesian_999999"
+
+
+def test_iter_cartesian_rejects_bad_shard():
+    with pytest.raises(ValueError):
+        iter_cartesian_scenarios(_three_sites(), shard=3, num_shards=3)
+
+
 # ---------------------------------------------------------------------------
 # minimal_scenarios
 # ---------------------------------------------------------------------------
@@ -251,8 +314,8 @@ def _selector_index(
     scenario: Scenario, path: str, site: VariantSite, expected_idx: int
 ) -> bool:
     """Return True if the scenario's selector at path picks expected_idx."""
-    from src.json_sample_generator.JSONSchemaGenerator import (
-        JSONSchemaGenerator,
+    from src.json_sample_generator.compiled_scenario import (
+        CompiledScenario,
     )
     from src.json_sample_generator.models import Context
 
@@ -263,7 +326,7 @@ def _selector_index(
         schema_data={},
     )
     dummy_schemas = [{} for _ in range(site.count)]
-    sel = JSONSchemaGenerator._lookup_variant_selector(path, scenario)
+    sel = CompiledScenario(scenario).selector_for(path)
     if sel is None:
         return False
     result = sel(ctx, dummy_schemas)
@@ -316,6 +379,78 @@ def test_minimal_base_overrides_survive():
     assert all("x" in s.overrides for s in scenarios)
 
 
+# ---------------------------------------------------------------------------
+# pairwise_scenarios
+# ---------------------------------------------------------------------------
+
+
+def _picks(scenario: Scenario, sites) -> dict:
+    """Map each site path to the variant the scenario selects, if any."""
+    return {
+        site.path: next(
+            (
+                idx
+                for idx in range(site.count)
+                if _selector_index(scenario, site.path, site, idx)
+            ),
+            None,
+        )
+        for site in sites
+    }
+
+
+def test_pairwise_covers_every_pair():
+    schema = _make_schema(
+        **{f"p{i}": _const_oneof("a", "b", "c") for i in range(6)}
+    )
+    sites = collect_variant_sites(schema)
+    scenarios = pairwise_scenarios(schema)
+    rows = [_picks(s, sites) for s in scenarios]
+    for left, right in itertools.combinations(sites, 2):
+        for a in range(left.count):
+            for b in range(right.count):
+                assert any(
+                    row[left.path] == a and row[right.path] == b
+                    for row in rows
+                )
+    assert len(scenarios) < 3**6 // 10
+
+
+def test_pairwise_respects_nesting():
+    schema = _make_schema(
+        pet={
+            "oneOf": [
+                {
+                    "type": "object",
+                    "properties": {"sub": _const_oneof("x", "y", "z")},
+                },
+                {"type": "string", "const": "other"},
+            ]
+        },
+        size=_const_oneof("S", "M", "L"),
+    )
+    sites = collect_variant_sites(schema)
+    rows = [_picks(s, sites) for s in pairwise_scenarios(schema)]
+    # A nested choice only counts where its enclosing variant is picked.
+    for row in rows:
+        assert (row["pet.sub"] is None) == (row["pet"] == 1)
+    pairs = {(row["pet.sub"], row["size"]) for row in rows if row["pet"] == 0}
+    assert pairs == set(itertools.product(range(3), range(3)))
+    assert {row["size"] for row in rows if row["pet"] == 1} == {0, 1, 2}
+
+
+def test_pairwise_strength():
+    schema = _three_sites()
+    assert len(pairwise_scenarios(schema, strength=3)) == len(
+        cartesian_scenarios(schema)
+    )
+    assert len(pairwise_scenarios(schema, strength=1)) == max(
+        site.count for site in collect_variant_sites(schema)
+    )
+    with pytest.raises(ValueError):
+        pairwise_scenarios(schema, strength=0)
+
+
 # ---------------------------------------------------------------------------
 # End-to-end: generate with enumerated scenarios
 # ---------------------------------------------------------------------------
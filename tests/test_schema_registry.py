@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import pytest
+
+from src.json_sample_generator import SchemaRegistry
+from src.json_sample_generator.models import Schema
+
+_OAS = {
+    "components": {
+        "schemas": {
+            "Category": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "integer"},
+                    "name": {"type": "string"},
+                },
+                "required": ["id", "name"],
+            },
+            "Pet": {
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string"},
+                    "category": {"$ref": "#/components/schemas/Category"},
+                },
+                "required": ["name", "category"],
+            },
+        }
+    }
+}
+
+
+def test_registry_resolves_each_document_once() -> None:
+    registry = SchemaRegistry()
+    pet = registry.component(Schema(data=_OAS), "Pet", seed=1)
+    category = registry.component(Schema(data=_OAS), "Category")
+
+    assert len(registry) == 1, "same document should be cached once"
+    shared = registry.resolve(Schema(data=_OAS))
+    assert (
+        pet.schema.data["properties"]["category"].__subject__
+        is shared["components"]["schemas"]["Category"]
+    ), "generators should share the resolved document"
+
+    sample = pet.generate()
+    assert set(sample["category"]) == {"id", "name"}, sample
+    assert set(category.generate()) == {"id", "name"}
+
+
+def test_registry_keys_by_content_and_base_uri() -> None:
+    registry = SchemaRegistry()
+    registry.resolve(Schema(data=_OAS))
+    registry.resolve(Schema(data={**_OAS}))
+    assert len(registry) == 1, "equal content should hit the cache"
+
+    registry.resolve(Schema(data=_OAS, base_uri="file://other.json"))
+    assert len(registry) == 2, "base_uri is part of the cache key"
+
+
+def test_registry_generator_for_fragment() -> None:
+    registry = SchemaRegistry()
+    gen = registry.generator(
+        Schema(data=_OAS, base_uri="file://api.json"),
+        fragment="/components/schemas/Pet",
+    )
+    sample = gen.generate()
+    assert "name" in sample and "category" in sample, sample
+    assert gen.schema.base_uri == "file://api.json#/components/schemas/Pet"
+
+
+def test_registry_generators_share_schema_caches() -> None:
+    registry = SchemaRegistry()
+    pet = registry.component(Schema(data=_OAS), "Pet")
+    again = registry.generator(
+        Schema(data=dict(_OAS)), fragment="components/schemas/Pet/", seed=3
+    )
+    category = registry.component(Schema(data=_OAS), "Category")
+
+    assert again.allof_cache is pet.allof_cache
+    assert again.schema.site_index() is pet.schema.site_index()
+    assert category.allof_cache is not pet.allof_cache
+
+    registry.clear()
+    fresh = registry.component(Schema(data=_OAS), "Pet")
+    assert fresh.allof_cache is not pet.allof_cache
+
+
+def test_registry_evicts_least_recently_used() -> None:
+    registry = SchemaRegistry(maxsize=2)
+    first = Schema(data={"type": "string"})
+    registry.resolve(first)
+    registry.resolve(Schema(data={"type": "integer"}))
+    registry.resolve(first)
+    registry.resolve(Schema(data={"type": "boolean"}))
+
+    assert len(registry) == 2
+    before = registry.resolve(first)
+    assert registry.resolve(first) is before, "recently used entry kept"
+
+
+def test_registry_unknown_fragment_raises() -> None:
+    registry = SchemaRegistry()
+    with pytest.raises(ValueError, match="Missing"):
+        registry.component(Schema(data=_OAS), "Missing")
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from src.json_sample_generator import JSONSchemaGenerator
-from src.json_sample_generator.models import Scenario, Schema
+from src.json_sample_generator.models import Context, Scenario, Schema
 
 
 def test_simple_value_overrides():
@@ -91,3 +91,34 @@ def test_mixed_overrides():
     assert result["id"] == "user-123"
     assert "User" in result["name"]
     assert result["created_at"] == "2023-01-01"
+
+
+def test_override_receives_context():
+    """Override callbacks get a Context describing the overridden node."""
+    seen = []
+
+    def capture(ctx):
+        seen.append(ctx)
+        return ctx.prop_path
+
+    schema = Schema(
+        base_uri="file://dummy.json",
+        data={
+            "type": "object",
+            "properties": {
+                "user": {
+                    "type": "object",
+                    "properties": {"name": {"type": "string"}},
+                }
+            },
+        },
+    )
+    scenario = Scenario(name="ctx", overrides={"user.name": capture})
+    result = JSONSchemaGenerator(schema).generate(scenario)
+
+    assert result == {"user": {"name": "user.name"}}
+    (ctx,) = seen
+    assert isinstance(ctx, Context)
+    assert ctx.schema_data == {"type": "string"}
+    assert ctx.parent_schema["properties"].keys() == {"name"}
+    assert ctx.schema_path == "file://dummy.json"
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import src.json_sample_generator.site_index as site_index_module
+from src.json_sample_generator import (
+    check_break_scenario,
+    collect_break_sites,
+    collect_variant_sites,
+    enumerate_break_scenarios,
+    minimal_scenarios,
+    pairwise_scenarios,
+)
+from src.json_sample_generator.models import Schema
+
+
+def _schema() -> Schema:
+    return Schema(
+        data={
+            "type": "object",
+            "properties": {
+                "pet": {
+                    "oneOf": [
+                        {
+                            "type": "object",
+                            "properties": {
+                                "size": {
+                                    "oneOf": [
+                                        {"const": "S"},
+                                        {"const": "L"},
+                                    ]
+                                }
+                            },
+                        },
+                        {"type": "string", "maxLength": 3},
+                    ]
+                },
+                "age": {"type": "integer", "minimum": 0},
+            },
+        }
+    )
+
+
+def test_enumerators_share_one_walk(monkeypatch) -> None:
+    calls = []
+    build = site_index_module.build_site_index
+
+    def counting_build(*args):
+        calls.append(args[1])
+        return build(*args)
+
+    monkeypatch.setattr(site_index_module, "build_site_index", counting_build)
+    schema = _schema()
+    collect_variant_sites(schema)
+    collect_break_sites(schema)
+    minimal_scenarios(schema)
+    pairwise_scenarios(schema)
+    for scenario in enumerate_break_scenarios(schema):
+        check_break_scenario(schema, scenario)
+    assert calls == [6]
+
+    collect_variant_sites(schema, max_depth=1)
+    assert calls == [6, 1]
+
+
+def test_site_index_rebuilt_after_data_changes() -> None:
+    schema = _schema()
+    index = schema.site_index()
+    assert schema.site_index() is index
+    assert [site.path for site in index.variant_sites] == ["pet", "pet.size"]
+    # pet.size is only reachable through the first variant of pet
+    assert index.enclosing == (None, (0, frozenset({0})))
+
+    schema.data = {"type": "object", "properties": {"x": {"type": "string"}}}
+    assert collect_variant_sites(schema) == []
+    assert [site.path for site in collect_break_sites(schema)] == ["", "x"]
+
+    schema.data["properties"]["y"] = {"type": "integer"}
+    schema.invalidate()
+    assert [site.path for site in collect_break_sites(schema)] == [
+        "",
+        "x",
+        "y",
+    ]
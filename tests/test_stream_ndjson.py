@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import io
+import json
+
+from src.json_sample_generator import JSONSchemaGenerator
+from src.json_sample_generator.models import Scenario, Schema
+
+_SCHEMA = Schema(
+    data={
+        "type": "object",
+        "properties": {
+            "id": {"type": "string", "format": "uuid"},
+            "name": {"type": "string"},
+            "score": {"type": "number"},
+        },
+    }
+)
+
+
+class _CountingBytesIO(io.BytesIO):
+    def __init__(self) -> None:
+        super().__init__()
+        self.writes = 0
+
+    def write(self, b) -> int:  # type: ignore[override]
+        self.writes += 1
+        return super().write(b)
+
+
+def test_stream_ndjson_text_stream() -> None:
+    out = io.StringIO()
+
+    written = JSONSchemaGenerator(_SCHEMA).stream_ndjson(out, 5)
+
+    lines = out.getvalue().splitlines()
+    assert written == 5
+    assert len(lines) == 5, "one line per sample"
+    assert all(
+        set(json.loads(line)) == {"id", "name", "score"} for line in lines
+    )
+
+
+def test_stream_ndjson_binary_matches_generate_many() -> None:
+    gen = JSONSchemaGenerator(_SCHEMA)
+    scenario = Scenario(name="fixed", overrides={"name": "Zoë"})
+    out = io.BytesIO()
+
+    gen.stream_ndjson(out, 10, scenario, seed=7)
+
+    decoded = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert decoded == gen.generate_many(10, scenario, seed=7)
+    assert "Zoë".encode("utf-8") in out.getvalue(), "should write UTF-8"
+
+
+def test_stream_ndjson_flushes_bounded_buffer() -> None:
+    out = _CountingBytesIO()
+
+    JSONSchemaGenerator(_SCHEMA).stream_ndjson(out, 50, buffer_size=256)
+
+    assert out.writes > 1, "small buffer should flush more than once"
+    assert len(out.getvalue().splitlines()) == 50
+
+
+def test_stream_ndjson_duck_typed_writers() -> None:
+    class TextWriter:
+        def __init__(self) -> None:
+            self.parts = []
+
+        def write(self, s: str) -> int:
+            assert isinstance(s, str), "text writers should get str"
+            self.parts.append(s)
+            return len(s)
+
+    class BinaryWriter(TextWriter):
+        mode = "wb"
+
+        def write(self, b: bytes) -> int:  # type: ignore[override]
+            assert isinstance(b, bytes), "binary mode should get bytes"
+            self.parts.append(b.decode("utf-8"))
+            return len(b)
+
+    for out in (TextWriter(), BinaryWriter()):
+        JSONSchemaGenerator(_SCHEMA).stream_ndjson(out, 3)
+        assert len("".join(out.parts).splitlines()) == 3
+
+
+def test_stream_ndjson_to_path(tmp_path) -> None:
+    target = tmp_path / "samples.ndjson"
+
+    written = JSONSchemaGenerator(_SCHEMA).stream_ndjson(target, 3)
+
+    assert written == 3
+    assert len(target.read_text(encoding="utf-8").splitlines()) == 3
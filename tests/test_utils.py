@@ -1,8 +1,13 @@
 from __future__ import annotations
 
 from src.json_sample_generator.helpers.utils import (
+    copy_path,
+    get_value_at_tokens,
     parse_path,
     set_value_at_path,
+    set_value_at_tokens,
+    with_value_at_path,
+    without_value_at_path,
 )
 
 
@@ -56,3 +61,50 @@ def test_overwrite_existing_value() -> None:
     target = {"a": {"b": 1}}
     set_value_at_path("a.b", target, 2)
     assert target["a"]["b"] == 2, "should overwrite existing value"
+
+
+def test_set_value_at_tokens_matches_string_path() -> None:
+    by_path: dict = {}
+    by_tokens: dict = {}
+    for path, value in [("a.items[2].name", "x"), ("a.flag", True)]:
+        set_value_at_path(path, by_path, value)
+        set_value_at_tokens(tuple(parse_path(path)), by_tokens, value)
+    assert (
+        by_tokens
+        == by_path
+        == {"a": {"items": [{}, {}, {"name": "x"}], "flag": True}}
+    ), "token writes should create the same structure"
+    assert get_value_at_tokens(parse_path("a.items[2].name"), by_tokens) == "x"
+    assert get_value_at_tokens(parse_path("a.items[5]"), by_tokens) is None
+
+
+def test_with_value_at_path_copies_only_the_path() -> None:
+    target = {"a": {"items": [{"n": 1}, {"n": 2}], "b": {"x": 1}}, "c": [1]}
+    result = with_value_at_path("a.items[1].n", target, 9)
+    assert result == {
+        "a": {"items": [{"n": 1}, {"n": 9}], "b": {"x": 1}},
+        "c": [1],
+    }
+    assert target["a"]["items"][1] == {"n": 2}, "input must be unchanged"
+    assert result["c"] is target["c"]
+    assert result["a"]["b"] is target["a"]["b"]
+    assert result["a"]["items"][0] is target["a"]["items"][0]
+    assert result["a"]["items"] is not target["a"]["items"]
+
+    created = with_value_at_path("a.new.deep", target, 1)
+    assert created["a"]["new"] == {"deep": 1}
+    assert "new" not in target["a"]
+    assert with_value_at_path("", target, None) is None
+
+
+def test_without_value_at_path_and_copy_path() -> None:
+    target = {"a": {"b": 1, "c": 2}, "l": [{"x": 1}, {"x": 2}]}
+    result = without_value_at_path("l[0]", target)
+    assert result["l"] == [{"x": 2}]
+    assert len(target["l"]) == 2
+    assert result["a"] is target["a"]
+    assert without_value_at_path("a.missing", target) == target
+
+    copied = copy_path("a", target, include_target=True)
+    assert copied["a"] == target["a"] and copied["a"] is not target["a"]
+    assert copy_path("a", target)["a"] is target["a"]